@@ -14,6 +14,7 @@ class CameraV2:
         self.dead_frac = (0.38, 0.30)  # fração da visão (w,h) EM MUNDO
         self.lookahead_t = 0.25        # segundos de antecipação
         self.smooth = 0.12             # amortecimento (0.10~0.16)
+        self.vel_px = (0.0, 0.0)       # última velocidade do foco (px/s), usada no pré-bake
         # Shake (opcional)
         self.shake_amp = 0.0
         self.shake_t = 0.0
@@ -62,6 +63,7 @@ class CameraV2:
         # 1) foco com lookahead (em mundo)
         fx, fy = focus_px
         vx, vy = vel_px
+        self.vel_px = (float(vx), float(vy))
         fx += float(vx) * self.lookahead_t
         fy += float(vy) * self.lookahead_t
 
@@ -0,0 +1,117 @@
+# core/chunk_baker.py — fila de bake de chunks com workers e orçamento por frame
+from __future__ import annotations
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+Key = Tuple[int,int]
+
+def drain(job: Iterator) -> Any:
+    """Executa um job-gerador até o fim e devolve o valor do `return`."""
+    while True:
+        try:
+            next(job)
+        except StopIteration as stop:
+            return stop.value
+
+class BakeScheduler:
+    """
+    Agenda bakes de chunk por prioridade (menor = antes) sem travar o frame.
+    - Um job é um gerador que faz `yield` a cada passo (uma linha de tiles) e
+      termina com `return surface`.
+    - workers>0: os jobs rodam em threads (o blit do pygame solta o GIL);
+      pump() só integra os prontos e despacha novos.
+    - workers=0: os jobs avançam no main thread, passo a passo, até gastar budget_ms.
+    A fila pendente é refeita a cada frame (reset_pending + request); jobs já
+    iniciados sempre terminam.
+    """
+    def __init__(self, make_job: Callable[[Key], Iterator], on_ready: Callable[[Key, Any], None],
+                 *, workers: int = 1, budget_ms: float = 3.0):
+        self.make_job = make_job
+        self.on_ready = on_ready
+        self.workers = max(0, int(workers))
+        self.budget_ms = float(budget_ms)
+        self._heap: List[Tuple[int,int,Key]] = []
+        self._prio: Dict[Key,int] = {}
+        self._seq = 0
+        self._inflight: Dict[Key, Future] = {}
+        self._current: Optional[Tuple[Key, Iterator]] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        if self.workers:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='chunk-bake')
+        self.stats = {'baked': 0, 'last_pump_ms': 0.0}
+
+    # --- fila ---
+    def busy(self, key: Key) -> bool:
+        """True se o chunk já está sendo assado (thread ou main)."""
+        return key in self._inflight or (self._current is not None and self._current[0] == key)
+
+    def reset_pending(self):
+        self._heap.clear()
+        self._prio.clear()
+
+    def request(self, key: Key, prio: int = 0):
+        if self.busy(key):
+            return
+        old = self._prio.get(key)
+        if old is not None and old <= prio:
+            return
+        self._prio[key] = prio
+        self._seq += 1
+        heapq.heappush(self._heap, (prio, self._seq, key))
+
+    def _pop(self) -> Optional[Key]:
+        while self._heap:
+            prio, _, key = heapq.heappop(self._heap)
+            if self._prio.get(key) != prio:
+                continue  # entrada antiga (re-priorizada)
+            del self._prio[key]
+            return key
+        return None
+
+    @property
+    def pending(self) -> int:
+        return len(self._prio) + len(self._inflight) + (1 if self._current else 0)
+
+    # --- execução ---
+    def _finish(self, key: Key, surf):
+        self.stats['baked'] += 1
+        self.on_ready(key, surf)
+
+    def pump(self, budget_ms: Optional[float] = None):
+        """Avança os bakes gastando no máximo ~budget_ms do frame atual."""
+        t0 = time.perf_counter()
+        deadline = t0 + (self.budget_ms if budget_ms is None else float(budget_ms)) / 1000.0
+        if self._pool is not None:
+            for key, fut in list(self._inflight.items()):
+                if fut.done():
+                    del self._inflight[key]
+                    self._finish(key, fut.result())
+            while len(self._inflight) < self.workers and time.perf_counter() < deadline:
+                key = self._pop()
+                if key is None:
+                    break
+                self._inflight[key] = self._pool.submit(drain, self.make_job(key))
+        else:
+            while time.perf_counter() < deadline:
+                if self._current is None:
+                    key = self._pop()
+                    if key is None:
+                        break
+                    self._current = (key, self.make_job(key))
+                key, job = self._current
+                try:
+                    next(job)
+                except StopIteration as stop:
+                    self._current = None
+                    self._finish(key, stop.value)
+        self.stats['last_pump_ms'] = (time.perf_counter() - t0) * 1000.0
+
+    def close(self):
+        self.reset_pending()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._inflight.clear()
+        self._current = None
@@ -0,0 +1,96 @@
+# core/chunk_cache.py — cache LRU de Surfaces de chunk limitado por memória
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+import pygame
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    """Bytes de pixel ocupados pela Surface (pitch inclui o padding da linha)."""
+    return int(surf.get_pitch()) * int(surf.get_height())
+
+class ChunkCache:
+    """
+    LRU com touch/evicção O(1) (OrderedDict) e teto em megabytes.
+    - get() conta hit/miss e marca como recente; `in`/peek() não mexem em nada.
+    - put() despeja os menos recentes até caber em max_bytes (o recém-inserido fica).
+    - max_items>0 mantém um teto extra por contagem (0 = sem teto).
+    """
+    def __init__(self, max_mb: float = 256.0, max_items: int = 0):
+        self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        self.max_items = max(0, int(max_items))
+        self._items: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.resident_bytes = 0
+        self.peak_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def keys(self):
+        return list(self._items)
+
+    def peek(self, key) -> Optional[pygame.Surface]:
+        return self._items.get(key)
+
+    def get(self, key) -> Optional[pygame.Surface]:
+        surf = self._items.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return surf
+
+    def put(self, key, surf: pygame.Surface):
+        if key in self._items:
+            self.discard(key)
+        size = surface_bytes(surf)
+        self._items[key] = surf
+        self._sizes[key] = size
+        self.resident_bytes += size
+        self.peak_bytes = max(self.peak_bytes, self.resident_bytes)
+        self._evict()
+
+    def discard(self, key):
+        if key in self._items:
+            del self._items[key]
+            self.resident_bytes -= self._sizes.pop(key)
+
+    def clear(self):
+        self._items.clear()
+        self._sizes.clear()
+        self.resident_bytes = 0
+
+    def set_budget(self, max_mb: float):
+        self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        self._evict()
+
+    def _evict(self):
+        while len(self._items) > 1 and (self.resident_bytes > self.max_bytes or
+                                        (self.max_items and len(self._items) > self.max_items)):
+            old, _ = self._items.popitem(last=False)
+            self.resident_bytes -= self._sizes.pop(old)
+            self.evictions += 1
+
+    @property
+    def resident_mb(self) -> float:
+        return self.resident_bytes / (1024 * 1024)
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._items),
+            'resident_mb': round(self.resident_mb, 2),
+            'peak_mb': round(self.peak_bytes / (1024 * 1024), 2),
+            'budget_mb': round(self.max_bytes / (1024 * 1024), 2),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
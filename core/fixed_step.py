@@ -0,0 +1,46 @@
+# core/fixed_step.py — simulação em passo fixo com acumulador
+"""
+O loop principal mede o dt do frame e chama advance(dt): ele devolve quantos
+passos de `step` segundos a cena deve simular agora (0 em frames rápidos,
+vários em frames lentos) e deixa em `alpha` (0..1) quanto do próximo passo já
+passou. A cena desenha interpolando entre o estado anterior e o atual com
+alpha, então o render pode rodar em qualquer FPS sem mudar o comportamento.
+
+max_steps limita o custo de simulação por frame: o atraso além disso é
+descartado (o jogo fica mais lento por um instante em vez de travar tentando
+alcançar o relógio).
+"""
+from __future__ import annotations
+from typing import Tuple
+
+class FixedStep:
+    def __init__(self, hz: float = 60.0, max_steps: int = 4):
+        self.hz = float(hz)
+        self.step = 1.0 / self.hz
+        self.max_steps = max(1, int(max_steps))
+        self.acc = 0.0
+        self.alpha = 1.0      # sem advance() (ex.: bench chamando update direto) = estado atual
+        self.steps = 0        # total simulado
+        self.dropped = 0.0    # segundos descartados por max_steps
+
+    def advance(self, dt: float) -> int:
+        """Soma dt ao acumulador; devolve quantos passos simular neste frame."""
+        self.acc += max(0.0, float(dt))
+        n = int(self.acc / self.step)
+        if n > self.max_steps:
+            late = (n - self.max_steps) * self.step
+            self.acc -= late
+            self.dropped += late
+            n = self.max_steps
+        self.acc -= n * self.step
+        self.alpha = min(1.0, self.acc / self.step)
+        self.steps += n
+        return n
+
+    def reset(self):
+        self.acc = 0.0
+        self.alpha = 1.0
+
+def lerp_point(a: Tuple[float, float], b: Tuple[float, float], t: float) -> Tuple[int, int]:
+    """Ponto entre a (t=0) e b (t=1), arredondado para px."""
+    return (int(round(a[0] + (b[0] - a[0]) * t)), int(round(a[1] + (b[1] - a[1]) * t)))
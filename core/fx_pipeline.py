@@ -14,6 +14,8 @@ class PostFX:
 
     def set_quality(self, quality: str):
         factor = 2 if str(quality) == 'half' else 4
+        if factor != getattr(self, '_div', None):
+            self.size = None   # buffers refeitos no próximo _ensure
         self._div = factor
 
     def _ensure(self, size):
@@ -1,9 +1,16 @@
 # core/iso_chunked.py
 from __future__ import annotations
+import math
+import time
 import pygame
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Any, Optional
 from core.config import TILE_W, TILE_H
+from core.chunk_baker import BakeScheduler, drain
+from core.chunk_cache import ChunkCache
+from core.tile_grid import as_tile_grid
+from core.tile_atlas import TileAtlas, build_tile_atlas
+from core.zoom_view import ZoomView, make_variant
 
 # Utilidade local: projeção 2:1 (mesmo que systems.iso_math)
 def _grid_to_screen(ix: int, iy: int, origin: Tuple[int,int]) -> Tuple[int,int]:
@@ -12,39 +19,134 @@ def _grid_to_screen(ix: int, iy: int, origin: Tuple[int,int]) -> Tuple[int,int]:
     y = (iy + ix) * (TILE_H // 2) + oy
     return x, y
 
+def _screen_to_grid(x: float, y: float, origin: Tuple[int,int]) -> Tuple[float,float]:
+    """Inversa exata de _grid_to_screen (float, sem arredondar)."""
+    ox, oy = origin
+    u = (y - oy) / (TILE_H / 2)   # = ix + iy
+    v = (x - ox) / (TILE_W / 2)   # = iy - ix
+    return (u - v) / 2.0, (u + v) / 2.0
+
 @dataclass
 class ChunkSpec:
     rows: int = 24
     cols: int = 24
-    lru_max: int = 12
+    # Cache de bakes: teto em MB (Surface RGBA de chunk 24x24 ~ 20 MB); lru_max>0 soma um teto por contagem
+    cache_mb: float = 256.0
+    lru_max: int = 0
+    # Variantes de zoom/flip do draw_native: cache próprio, para não competirem com os bakes base
+    variant_cache_mb: float = 160.0
+    # Bake assíncrono: threads de bake (0 = passos no main thread) e teto de ms por frame
+    bake_workers: int = 1
+    bake_budget_ms: float = 3.0
+    # Pré-bake na direção do movimento: quantos passos de camera.lookahead_t à frente
+    prefetch_steps: int = 3
+    # Cor do losango provisório enquanto o chunk não fica pronto
+    placeholder_color: Tuple[int,int,int] = (38, 64, 44)
+    # Props parados: baixos entram no bake do chão; altos viram faixas de overlay
+    # (uma Surface por chunk e faixa de profundidade de occluder_band_px)
+    bake_props: bool = True
+    occluder_band_px: int = TILE_H // 2
+
+class StaticOverlay:
+    """Faixa de props altos de um chunk, assada numa Surface só (sob demanda).
+    Entra no DepthGroup como item estático: image/rect/_layer como um sprite."""
+    def __init__(self, props: List[Any]):
+        self.rect = props[0].rect.unionall([p.rect for p in props[1:]])
+        self.layer_bias = 0
+        self.depth_offset = 0
+        self._props = sorted(props, key=lambda p: p.rect.bottom)
+        self._image: Optional[pygame.Surface] = None
+
+    @property
+    def image(self) -> pygame.Surface:
+        if self._image is None:
+            surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            x0, y0 = self.rect.topleft
+            surf.blits([(p.image, (p.rect.left - x0, p.rect.top - y0)) for p in self._props], False)
+            self._image = surf
+        return self._image
+
+def is_occluder(sprite) -> bool:
+    """Prop que pode cobrir um ator: `occluder` explícito ou mais alto que um tile."""
+    flag = getattr(sprite, 'occluder', None)
+    return bool(flag) if flag is not None else sprite.rect.height > TILE_H
 
 class IsoChunkedMap:
     """
     Renderer isométrico por CHUNKS com bake estático das camadas de chão.
     - Cada chunk gera 1 Surface do footprint isométrico (ground + overlays estáticas).
-    - draw() blita só os chunks visíveis (culling por retângulo de câmera).
-    - Props/entidades dinâmicas devem ser desenhadas por cima, fora deste bake.
+    - draw() blita só os chunks visíveis (faixa calculada pela projeção inversa,
+      custo proporcional à tela e não ao tamanho do mapa).
+    - Bake fora do frame (BakeScheduler): chunk ainda não pronto vira um losango liso.
+    - bake_props(): props baixos vão para dentro do bake; altos viram StaticOverlay.
+    - Entidades dinâmicas devem ser desenhadas por cima, fora deste bake.
     """
     def __init__(self, layers: List[Dict[str, Any]], tileset, origin: Tuple[int,int]=(0,0), spec: ChunkSpec=ChunkSpec()):
         assert layers and 'grid' in layers[0], 'layers inválidas'
-        self.layers = layers
+        # Grades compactas (TileGrid, ids uint8); list[list[str]] é convertida aqui
+        self.layers = [dict(layer, grid=as_tile_grid(layer['grid'])) for layer in layers]
         self.tileset = tileset
         self.origin = origin
         self.spec = spec
-        self.rows = len(layers[0]['grid'])
-        self.cols = len(layers[0]['grid'][0]) if self.rows>0 else 0
+        self.rows = self.layers[0]['grid'].rows
+        self.cols = self.layers[0]['grid'].cols
         # Chunks em grid
         self.cr = (self.rows + spec.rows - 1) // spec.rows
         self.cc = (self.cols + spec.cols - 1) // spec.cols
-        # Cache LRU de bakes
-        self.cache: Dict[Tuple[int,int], pygame.Surface] = {}
-        self.lru: List[Tuple[int,int]] = []
+        # Cache LRU de bakes (limitado por bytes)
+        self.cache = ChunkCache(max_mb=spec.cache_mb, max_items=spec.lru_max)
+        # (cr, cc, zkey, flip) -> variante escalada/espelhada (draw_native)
+        self.variants = ChunkCache(max_mb=spec.variant_cache_mb)
 
         # Origem (0,0) do grid em pixels mundiais para alinhar como seu IsoMap
         # Mesma lógica do tilemap_iso: desloca X para manter x>=0
         self.map_offset_x = (self.rows - 1) * (TILE_W // 2)
         self.map_offset_y = 0
 
+        # Atlas com todos os tokens da paleta (inclui dbg_*), montado aqui (main thread):
+        # o bake roda no worker e só lê as tabelas id -> área / id -> Surface avulsa
+        self._tiles: List[Optional[pygame.Surface]] = [None] * 256
+        self._areas: List[Optional[pygame.Rect]] = [None] * 256
+        self.atlas: Optional[TileAtlas] = None
+        self._resolved_n = 0
+        if tileset is not None:
+            palette = self.layers[0]['grid'].palette
+            self.atlas = build_tile_atlas(palette.tokens, tileset.get)
+            for tid, tok in enumerate(palette.tokens):
+                if tid:
+                    self._areas[tid] = self.atlas.area(tok)
+        self._resolve_tiles()
+        # props baixos por chunk: [(image, (x, y) mundo)], em ordem de rect.bottom
+        self._chunk_props: Dict[Tuple[int,int], List[Tuple[pygame.Surface, Tuple[int,int]]]] = {}
+        # geração do conteúdo de cada chunk: bake_props() sobe, e bake iniciado antes não entra no cache
+        self._gen: Dict[Tuple[int,int], int] = {}
+        self.baker = BakeScheduler(self._bake_job, self._on_baked,
+                                   workers=spec.bake_workers, budget_ms=spec.bake_budget_ms)
+
+    def _resolve_tiles(self):
+        """Surface avulsa para tokens da paleta sem área no atlas (registrados depois dele).
+        Main thread: chamado antes de agendar bakes, então o worker só lê _tiles."""
+        if self.tileset is None:
+            return
+        tokens = self.layers[0]['grid'].palette.tokens
+        for tid in range(self._resolved_n, len(tokens)):
+            if tid and self._areas[tid] is None and self._tiles[tid] is None:
+                self._tiles[tid] = self.tileset.get(tokens[tid])
+        self._resolved_n = len(tokens)
+
+    # Aliases compatíveis com IsoMap2 (player/props usam offset_x/offset_y)
+    @property
+    def offset_x(self) -> int:
+        return self.map_offset_x
+
+    @property
+    def offset_y(self) -> int:
+        return self.map_offset_y
+
+    @property
+    def offset(self) -> Tuple[int,int]:
+        return self.map_offset_x, self.map_offset_y
+
     # --- Helpers chunk ---
     def chunk_grid_rect(self, cr: int, cc: int) -> Tuple[int,int,int,int]:
         """Retorna (r0, r1, c0, c1) inclusivo do sub-grid do chunk."""
@@ -55,56 +157,113 @@ class IsoChunkedMap:
         return r0, r1, c0, c1
 
     def chunk_world_rect(self, cr: int, cc: int) -> pygame.Rect:
-        """Retorna o retângulo mundial em px que cobre o chunk."""
-        r0, r1, c0, c1 = self.chunk_grid_rect(cr, cc)
-        # canto superior esquerdo do chunk
-        x0, y0 = _grid_to_screen(r0, c0, (self.map_offset_x, self.map_offset_y))
-        # canto inferior direito do chunk (r1+1,c1) e (r1,c1+1) para pegar extremidades
-        x1a, y1a = _grid_to_screen(r1+1, c1, (self.map_offset_x, self.map_offset_y))
-        x1b, y1b = _grid_to_screen(r1, c1+1, (self.map_offset_x, self.map_offset_y))
-        # bounding box
-        left = min(x0, x1a, x1b)
-        top  = min(y0, y1a, y1b)
-        right= max(x0 + TILE_W, x1a + TILE_W, x1b + TILE_W)
-        bottom=max(y0 + TILE_H, y1a + TILE_H, y1b + TILE_H)
-        return pygame.Rect(left, top, right-left, bottom-top)
-
-    def _lru_touch(self, key: Tuple[int,int]):
-        if key in self.lru:
-            self.lru.remove(key)
-        self.lru.append(key)
-        while len(self.lru) > self.spec.lru_max:
-            old = self.lru.pop(0)
-            if old in self.cache:
-                del self.cache[old]
+        """Retorna o retângulo mundial em px que cobre o chunk (bbox do losango)."""
+        top, right, bottom, left = self.chunk_diamond(cr, cc)
+        return pygame.Rect(left[0], top[1], right[0] - left[0], bottom[1] - top[1])
 
-    def _bake_chunk(self, cr: int, cc: int) -> pygame.Surface:
+    def _bake_steps(self, cr: int, cc: int):
+        """Job-gerador do bake: um `yield` por linha de tiles, `return` da Surface pronta."""
         rect = self.chunk_world_rect(cr, cc)
         surf = pygame.Surface(rect.size, pygame.SRCALPHA)
         r0, r1, c0, c1 = self.chunk_grid_rect(cr, cc)
-        # desenha camadas na ordem
+        atlas, areas, tiles = (self.atlas.surface if self.atlas else None), self._areas, self._tiles
+        hw, hh = TILE_W // 2, TILE_H // 2
+        # mesma projeção de _grid_to_screen, já em coordenadas locais do chunk
+        ox = self.map_offset_x - rect.left
+        oy = self.map_offset_y - rect.top
+        # desenha camadas na ordem; uma chamada Surface.blits por linha
         for layer in self.layers:
             grid = layer['grid']
-            # nota: tokens vazios ('') são pulados
             for r in range(r0, r1+1):
-                for c in range(c0, c1+1):
-                    token = grid[r][c]
-                    if not token:
+                seq = []
+                for c, tid in enumerate(grid.row_ids(r, c0, c1), c0):
+                    # nota: id 0 (token vazio) é pulado
+                    if not tid:
                         continue
-                    img = self.tileset.get(token)
-                    wx, wy = _grid_to_screen(r, c, (self.map_offset_x, self.map_offset_y))
-                    # local dentro do chunk
-                    lx = int(wx - rect.left)
-                    ly = int(wy - rect.top)
-                    surf.blit(img, (lx, ly))
+                    pos = ((c - r) * hw + ox, (c + r) * hh + oy)
+                    area = areas[tid]
+                    if area is not None:
+                        seq.append((atlas, pos, area))
+                    elif tiles[tid] is not None:
+                        seq.append((tiles[tid], pos))
+                if seq:
+                    surf.blits(seq, False)
+                yield
+        props = self._chunk_props.get((cr, cc))
+        if props:
+            surf.blits([(img, (x - rect.left, y - rect.top)) for img, (x, y) in props], False)
         return surf
 
+    def _bake_job(self, key: Tuple[int,int]):
+        """Job do BakeScheduler: o bake do chunk marcado com a geração em que começou."""
+        gen = self._gen.get(key, 0)
+        surf = yield from self._bake_steps(*key)
+        return gen, surf
+
+    # --- Props estáticos ---
+    def bake_props(self, sprites) -> List[StaticOverlay]:
+        """Assa props parados no mapa e devolve as faixas de overlay dos altos.
+
+        Baixos (pedra, arbusto, placa) entram em todos os chunks que o rect toca,
+        depois do chão (cada chunk traz a parte dele, então a ordem de blit dos
+        chunks não importa). Altos (árvore, casa) são agrupados por chunk da
+        âncora e faixa de rect.bottom: cada faixa é um item só no DepthGroup,
+        com profundidade certa em relação aos atores até occluder_band_px.
+        """
+        band = max(1, int(self.spec.occluder_band_px))
+        origin = (self.map_offset_x, self.map_offset_y)
+        flat: Dict[Tuple[int,int], list] = {}
+        tall: Dict[Tuple[int,int,int], list] = {}
+        for sp in sprites:
+            if is_occluder(sp):
+                r, c = _screen_to_grid(sp.rect.centerx - TILE_W // 2, sp.rect.bottom - TILE_H, origin)
+                cr = min(self.cr - 1, max(0, int(r) // self.spec.rows))
+                cc = min(self.cc - 1, max(0, int(c) // self.spec.cols))
+                tall.setdefault((cr, cc, sp.rect.bottom // band), []).append(sp)
+            else:
+                for key in self.chunks_in_rect(sp.rect):
+                    flat.setdefault(key, []).append(sp)
+        for key, items in flat.items():
+            merged = self._chunk_props.get(key, []) + [(p.image, p.rect.topleft) for p in items]
+            merged.sort(key=lambda t: t[1][1] + t[0].get_height())
+            self._chunk_props[key] = merged
+            self._gen[key] = self._gen.get(key, 0) + 1   # bake em voo (sem estes props) é descartado
+            self.cache.discard(key)   # re-assa com os props na próxima vez que aparecer
+            self._discard_variants(key)
+        return [StaticOverlay(items) for items in tall.values()]
+
+    def _bake_chunk(self, cr: int, cc: int) -> pygame.Surface:
+        return drain(self._bake_steps(cr, cc))
+
+    def _on_baked(self, key: Tuple[int,int], result: Tuple[int, pygame.Surface]):
+        gen, surf = result
+        if gen == self._gen.get(key, 0):
+            self.cache.put(key, surf)
+
+    def _discard_variants(self, key: Tuple[int,int]):
+        for vk in [vk for vk in self.variants.keys() if vk[:2] == key]:
+            self.variants.discard(vk)
+
     def get_chunk(self, cr: int, cc: int) -> pygame.Surface:
+        """Bake síncrono (uso fora do frame: pré-carga, ferramentas)."""
         key = (cr, cc)
-        if key not in self.cache:
-            self.cache[key] = self._bake_chunk(cr, cc)
-        self._lru_touch(key)
-        return self.cache[key]
+        img = self.cache.get(key)
+        if img is None:
+            self._resolve_tiles()
+            img = self._bake_chunk(cr, cc)
+            self.cache.put(key, img)
+        return img
+
+    def chunk_diamond(self, cr: int, cc: int) -> List[Tuple[int,int]]:
+        """Vértices (topo, direita, base, esquerda) do losango do chunk em px mundiais."""
+        r0, r1, c0, c1 = self.chunk_grid_rect(cr, cc)
+        o = (self.map_offset_x, self.map_offset_y)
+        hw, hh = TILE_W // 2, TILE_H // 2
+        tx, ty = _grid_to_screen(r0, c0, o)
+        rx, ry = _grid_to_screen(r0, c1, o)
+        bx, by = _grid_to_screen(r1, c1, o)
+        lx, ly = _grid_to_screen(r1, c0, o)
+        return [(tx + hw, ty), (rx + TILE_W, ry + hh), (bx + hw, by + TILE_H), (lx, ly + hh)]
 
     # --- Culling por chunk ---
     def _camera_world_rect(self, camera) -> pygame.Rect:
@@ -117,44 +276,133 @@ class IsoChunkedMap:
             return pygame.Rect(int(r.left), int(r.top), int(r.width), int(r.height))
         return pygame.Rect(int(getattr(camera, 'x', 0)), int(getattr(camera, 'y', 0)), int(getattr(camera, 'screen_w', 0)), int(getattr(camera, 'screen_h', 0)))
 
-    def visible_chunks_bounds(self, camera) -> Tuple[int,int,int,int]:
-        cam = self._camera_world_rect(camera)
-        # checa interseção com retângulo de cada chunk – bounds simples
-        cr0 = cc0 = 999999
-        cr1 = cc1 = -999999
-        for cr in range(self.cr):
-            # rápida rejeição vertical
-            rect0 = self.chunk_world_rect(cr, 0)
-            rectn = self.chunk_world_rect(cr, max(0, self.cc-1))
-            top = min(rect0.top, rectn.top)
-            bottom = max(rect0.bottom, rectn.bottom)
-            if bottom < cam.top - TILE_H or top > cam.bottom + TILE_H:
-                continue
-            # dentro do range vertical, varre colunas
-            for cc in range(self.cc):
-                rect = self.chunk_world_rect(cr, cc)
-                if rect.colliderect(cam.inflate(TILE_W, TILE_H)):
-                    cr0 = min(cr0, cr); cc0 = min(cc0, cc)
-                    cr1 = max(cr1, cr); cc1 = max(cc1, cc)
-        if cr1 < cr0 or cc1 < cc0:
+    def _chunk_range(self, cam: pygame.Rect) -> Tuple[int,int,int,int]:
+        # os 4 cantos do retângulo (inflado em 1 tile) passam pela projeção inversa
+        # e o bbox resultante em (r,c) vira índice de chunk
+        cam = cam.inflate(TILE_W * 2, TILE_H * 2)
+        origin = (self.map_offset_x, self.map_offset_y)
+        rs = []; cs = []
+        for px, py in (cam.topleft, cam.topright, cam.bottomleft, cam.bottomright):
+            r, c = _screen_to_grid(px, py, origin)
+            rs.append(r); cs.append(c)
+        r0 = max(0, int(math.floor(min(rs))) - 1)
+        r1 = min(self.rows - 1, int(math.ceil(max(rs))) + 1)
+        c0 = max(0, int(math.floor(min(cs))) - 1)
+        c1 = min(self.cols - 1, int(math.ceil(max(cs))) + 1)
+        if r1 < r0 or c1 < c0:
             return 0, -1, 0, -1
-        # pad de 1 chunk ao redor para evitar pop-in
-        return max(0, cr0-1), min(self.cr-1, cr1+1), max(0, cc0-1), min(self.cc-1, cc1+1)
+        return r0 // self.spec.rows, r1 // self.spec.rows, c0 // self.spec.cols, c1 // self.spec.cols
 
-    def draw(self, screen: pygame.Surface, camera, debug: bool=False):
-        cr0, cr1, cc0, cc1 = self.visible_chunks_bounds(camera)
-        if cr1 < cr0:
-            return
-        world_to_screen = getattr(camera, 'world_to_screen', lambda p: p)
+    def visible_chunks_bounds(self, camera) -> Tuple[int,int,int,int]:
+        """Faixa (cr0, cr1, cc0, cc1) de chunks que podem tocar a câmera, em O(1)."""
+        return self._chunk_range(self._camera_world_rect(camera))
+
+    def chunks_in_rect(self, cam: pygame.Rect) -> List[Tuple[int,int]]:
+        """Chunks cujo retângulo mundial toca `cam` (bbox em (r,c) menos os cantos do losango)."""
+        cr0, cr1, cc0, cc1 = self._chunk_range(cam)
+        out = []
         for cr in range(cr0, cr1+1):
             for cc in range(cc0, cc1+1):
-                rect = self.chunk_world_rect(cr, cc)
-                img = self.get_chunk(cr, cc)
-                sx, sy = world_to_screen((rect.left, rect.top))
-                screen.blit(img, (int(sx), int(sy)))
+                if self.chunk_world_rect(cr, cc).colliderect(cam):
+                    out.append((cr, cc))
+        return out
+
+    def _request_prefetch(self, camera, cam: pygame.Rect, have):
+        # prevê a câmera à frente usando a velocidade (px/s) e o lookahead da CameraV2
+        vx, vy = getattr(camera, 'vel_px', (0.0, 0.0))
+        step_t = float(getattr(camera, 'lookahead_t', 0.0) or 0.0)
+        if (vx == 0 and vy == 0) or step_t <= 0:
+            return
+        for k in range(1, self.spec.prefetch_steps + 1):
+            ahead = cam.move(int(vx * step_t * k), int(vy * step_t * k))
+            for key in self.chunks_in_rect(ahead):
+                if not have(key):
+                    self.baker.request(key, prio=k)
+
+    def _schedule(self, camera, cam: pygame.Rect, visible: List[Tuple[int,int]], have=None, pump: bool = True):
+        """Refaz a fila de bake (visíveis primeiro, depois a previsão de movimento) e avança.
+        have(key): o chunk já tem o que o desenho precisa (base ou variante) e não entra na fila."""
+        have = have or (lambda key: key in self.cache)
+        self._resolve_tiles()
+        self.baker.reset_pending()
+        for key in visible:
+            if not have(key):
+                self.baker.request(key, prio=0)
+        self._request_prefetch(camera, cam, have)
+        if pump:
+            self.baker.pump()
+
+    def draw(self, screen: pygame.Surface, camera, debug: bool=False, pump: bool = True):
+        """pump=False: o baker já avançou neste frame (ex.: draw_native que devolveu False)."""
+        cam = self._camera_world_rect(camera)
+        visible = self.chunks_in_rect(cam)
+        self._schedule(camera, cam, visible, pump=pump)
+        # blita o que está pronto; o resto vira losango provisório
+        world_to_screen = getattr(camera, 'world_to_screen', lambda p: p)
+        for key in visible:
+            img = self.cache.get(key)
+            if img is None:
+                pts = [world_to_screen(p) for p in self.chunk_diamond(*key)]
+                pygame.draw.polygon(screen, self.spec.placeholder_color, pts)
                 if debug:
-                    # desenha moldura do chunk
-                    pygame.draw.rect(screen, (80,180,255), pygame.Rect(int(sx), int(sy), rect.w, rect.h), 1)
+                    pygame.draw.polygon(screen, (255,160,60), pts, 1)
+                continue
+            rect = self.chunk_world_rect(*key)
+            sx, sy = world_to_screen((rect.left, rect.top))
+            screen.blit(img, (int(sx), int(sy)))
+            if debug:
+                # desenha moldura do chunk
+                pygame.draw.rect(screen, (80,180,255), pygame.Rect(int(sx), int(sy), rect.w, rect.h), 1)
+
+    def draw_native(self, screen: pygame.Surface, view: ZoomView, debug: bool=False,
+                    budget_ms: float = 4.0, pump: bool = True) -> bool:
+        """Desenha direto na tela com as variantes escaladas/espelhadas dos chunks.
+
+        As variantes ficam em self.variants (chave (cr, cc, zoom, flip), teto
+        próprio spec.variant_cache_mb) e são geradas a partir do bake base gastando
+        até budget_ms por frame. Chunk com variante pronta não pede bake base. Se
+        alguma visível não couber no orçamento, não desenha nada e devolve False
+        (a cena usa o caminho com RT neste frame, chamando draw(pump=False)).
+        """
+        cam = view.world_rect()
+        visible = self.chunks_in_rect(cam)
+        vkey = lambda key: key + (view.zkey, view.flip)
+        variants = self.variants
+        self._schedule(view, cam, visible, have=lambda key: vkey(key) in variants or key in self.cache, pump=pump)
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        imgs = []
+        for key in visible:
+            img = variants.get(vkey(key))
+            if img is None:
+                base = self.cache.get(key)
+                if base is not None:
+                    if time.perf_counter() > deadline:
+                        return False
+                    img = make_variant(base, view.zoom, view.flip)
+                    variants.put(vkey(key), img)
+            imgs.append((key, img))
+        for key, img in imgs:
+            if img is None:
+                pts = [view.world_to_screen(p) for p in self.chunk_diamond(*key)]
+                pygame.draw.polygon(screen, self.spec.placeholder_color, pts)
+                continue
+            dst = view.screen_rect(self.chunk_world_rect(*key))
+            screen.blit(img, dst.topleft)
+            if debug:
+                pygame.draw.rect(screen, (80,180,255), dst, 1)
+        return True
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Hits/misses/evicções e memória residente do cache de chunks (para calibrar cache_mb)."""
+        out = self.cache.stats()
+        out['variants'] = self.variants.stats()
+        out['bake_pending'] = self.baker.pending
+        out['baked'] = self.baker.stats['baked']
+        return out
+
+    def close(self):
+        """Encerra os workers de bake (ex.: ao descartar a região)."""
+        self.baker.close()
 
     def world_bounds(self) -> Tuple[int,int]:
         # igual ao IsoMap para manter compat
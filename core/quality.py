@@ -0,0 +1,98 @@
+# core/quality.py — governador de qualidade pelo tempo de frame medido
+"""
+O main loop passa ao GOVERNOR o tempo de trabalho de cada frame (update+draw,
+sem a espera do teto de FPS). Numa janela móvel, se o p90 passa do orçamento
+(16.6 ms a 60 FPS) ele desce um nível de QUALITY_TIERS; com folga clara
+(p90 abaixo de up_at * orçamento) sobe um. Depois de cada troca segura `hold`
+frames, e o vão entre down_at e up_at evita ficar oscilando entre dois níveis.
+
+O nível atual é público (GOVERNOR.tier / .index) e quem quiser reage na hora
+com subscribe(fn(tier)); as cenas comparam o tier que aplicaram com o atual.
+"""
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+@dataclass(frozen=True)
+class QualityTier:
+    name: str
+    fx_quality: str                   # PostFX: 'half' ou 'quarter'
+    smooth_scale: bool                # RT -> tela com smoothscale (False = scale)
+    bake_budget_ms: float             # bake de chunks por frame
+    native_budget_ms: float           # variantes de zoom/flip por frame (draw_native)
+    ai_view_margin: int               # px de mundo em volta da tela com IA cheia (ai_lod)
+    ai_periods: Tuple[int, int, int]  # passos entre ticks por tier de LOD (divisores de LOD_PHASES)
+
+QUALITY_TIERS: Tuple[QualityTier, ...] = (
+    QualityTier('high',    'half',    True,  3.0, 4.0, 96, (1, 2, 8)),
+    QualityTier('medium',  'quarter', True,  2.0, 3.0, 48, (1, 4, 8)),
+    QualityTier('low',     'quarter', False, 1.5, 2.0,  0, (1, 4, 8)),
+    QualityTier('minimal', 'quarter', False, 1.0, 1.5,  0, (2, 8, 8)),
+)
+
+class QualityGovernor:
+    def __init__(self, tiers: Tuple[QualityTier, ...] = QUALITY_TIERS, *, budget_ms: float = 1000.0 / 60.0,
+                 window: int = 90, down_at: float = 1.0, up_at: float = 0.7, hold: int = 120):
+        self.tiers = tiers
+        self.budget_ms = float(budget_ms)
+        self.down_at = float(down_at)
+        self.up_at = float(up_at)
+        self.hold = int(hold)
+        self.enabled = True
+        self.index = 0
+        self.samples = deque(maxlen=max(1, int(window)))
+        self._wait = 0
+        self._listeners: List[Callable[[QualityTier], None]] = []
+        self.changes = 0
+
+    @property
+    def tier(self) -> QualityTier:
+        return self.tiers[self.index]
+
+    def set_budget_fps(self, fps: float):
+        """Orçamento a partir do FPS alvo (0/None = mantém 60)."""
+        self.budget_ms = 1000.0 / float(fps) if fps else 1000.0 / 60.0
+
+    def subscribe(self, fn: Callable[[QualityTier], None]):
+        self._listeners.append(fn)
+
+    def p90(self) -> float:
+        if not self.samples:
+            return 0.0
+        s = sorted(self.samples)
+        return s[min(len(s) - 1, int(len(s) * 0.9))]
+
+    def sample(self, frame_ms: float) -> QualityTier:
+        """Registra o tempo de trabalho de um frame; pode trocar de nível."""
+        if not self.enabled:
+            return self.tier
+        self.samples.append(float(frame_ms))
+        if self._wait > 0:
+            self._wait -= 1
+            return self.tier
+        if len(self.samples) < self.samples.maxlen:
+            return self.tier
+        p = self.p90()
+        if p > self.budget_ms * self.down_at and self.index < len(self.tiers) - 1:
+            self.set_index(self.index + 1)
+        elif p < self.budget_ms * self.up_at and self.index > 0:
+            self.set_index(self.index - 1)
+        return self.tier
+
+    def set_index(self, index: int):
+        index = max(0, min(len(self.tiers) - 1, int(index)))
+        self.samples.clear()
+        self._wait = self.hold
+        if index == self.index:
+            return
+        self.index = index
+        self.changes += 1
+        for fn in self._listeners:
+            fn(self.tier)
+
+    def stats(self) -> dict:
+        return {'tier': self.tier.name, 'index': self.index, 'p90_ms': self.p90(),
+                'budget_ms': self.budget_ms, 'changes': self.changes}
+
+GOVERNOR = QualityGovernor()
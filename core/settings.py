@@ -5,7 +5,8 @@ DEFAULTS = {
     'volume': 100,
     'mute': False,
     'resolution': [1280, 720],
-    'fps': 60,
+    'fps': 60,       # teto de FPS do render (0 = sem teto)
+    'sim_hz': 60,    # passo fixo da simulação no jogo (0 = dt variável, como antes)
     'difficulty': 'normal',
     'language': 'en-US',
     'show_missing': False,
@@ -14,6 +15,8 @@ DEFAULTS = {
     'fx_bloom': True,
     'fx_dof': True,
     'fx_quality': 'half',  # 'half' or 'quarter'
+    # Governador de qualidade (core.quality): desce/sobe o nível pelo tempo de frame
+    'quality_auto': True,
 }
 
 def _sanitize(data: dict) -> dict:
@@ -26,11 +29,25 @@ def _sanitize(data: dict) -> dict:
     out['fx_dof'] = bool(out.get('fx_dof', True))
     return out
 
+# último arquivo lido: (mtime_ns, dict) — menus chamam load_settings() todo frame
+_cache = {'mtime': None, 'data': None}
+
+def _copy(data: dict) -> dict:
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in data.items()}
+
 def load_settings() -> dict:
-    if SETTINGS_PATH.exists():
+    """Lê settings.json; sem mudança no arquivo (mtime) devolve uma cópia do último lido."""
+    try:
+        mtime = SETTINGS_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None:
+        if _cache['mtime'] == mtime:
+            return _copy(_cache['data'])
         try:
-            data = json.loads(SETTINGS_PATH.read_text(encoding='utf-8'))
-            return _sanitize(data)
+            data = _sanitize(json.loads(SETTINGS_PATH.read_text(encoding='utf-8')))
+            _cache['mtime'], _cache['data'] = mtime, data
+            return _copy(data)
         except Exception:
             pass
     save_settings(DEFAULTS)
@@ -38,3 +55,4 @@ def load_settings() -> dict:
 
 def save_settings(data: dict):
     SETTINGS_PATH.write_text(json.dumps(_sanitize(data), indent=2, ensure_ascii=False), encoding='utf-8')
+    _cache['mtime'] = None
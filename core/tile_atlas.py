@@ -0,0 +1,49 @@
+# core/tile_atlas.py — atlas de tiles procedurais (1 Surface + tabela de rects)
+"""
+Empacota as Surfaces de tile (tile_factory / tiles_placeholders2) numa única
+Surface SRCALPHA com uma tabela chave -> Rect. O bake de chunk monta uma lista
+(atlas, destino, área) por linha e chama Surface.blits uma vez, em vez de um
+blit Python por célula.
+"""
+from __future__ import annotations
+from typing import Dict, Hashable, Mapping, Optional
+import pygame
+
+class TileAtlas:
+    def __init__(self, surface: pygame.Surface, rects: Dict[Hashable, pygame.Rect]):
+        self.surface = surface
+        self.rects = rects
+
+    @classmethod
+    def pack(cls, images: Mapping[Hashable, pygame.Surface], max_w: int = 1024) -> 'TileAtlas':
+        """Empacotamento em prateleiras (linhas de altura = maior imagem da linha)."""
+        x = y = shelf_h = 0
+        width = 0
+        places: Dict[Hashable, pygame.Rect] = {}
+        for key, img in images.items():
+            w, h = img.get_size()
+            if x and x + w > max_w:
+                x = 0; y += shelf_h; shelf_h = 0
+            places[key] = pygame.Rect(x, y, w, h)
+            x += w
+            shelf_h = max(shelf_h, h)
+            width = max(width, x)
+        surf = pygame.Surface((max(1, width), max(1, y + shelf_h)), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 0))
+        for key, img in images.items():
+            # cópia exata dos pixels (sem mistura de alpha com o fundo transparente)
+            surf.blit(img, places[key], special_flags=pygame.BLEND_RGBA_MAX)
+        return cls(surf, places)
+
+    def area(self, key) -> Optional[pygame.Rect]:
+        return self.rects.get(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self.rects
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+def build_tile_atlas(tokens, build) -> TileAtlas:
+    """Atlas com um tile por token; `build(token)` é tileset.get / build_tile."""
+    return TileAtlas.pack({tok: build(tok) for tok in tokens if tok})
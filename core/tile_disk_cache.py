@@ -0,0 +1,96 @@
+# core/tile_disk_cache.py — cache em disco dos tiles procedurais (RGBA cru, versionado)
+"""
+Os tiles placeholder (systems/tile_factory, core/tiles_placeholders2) são
+desenhados com supersampling 2x a cada execução. Aqui o resultado fica em
+DATA_DIR/tile_cache/<nome>_<w>x<h>_<hash>/<token>.rgba, onde <hash> é o sha1 do
+arquivo-fonte da fábrica: mudou o código, muda a pasta (as antigas são apagadas).
+
+Uso:
+    @lru_cache(maxsize=512)
+    @disk_cached('tile_factory', __file__, (TILE_W, TILE_H))
+    def _render_token(token): ...
+"""
+from __future__ import annotations
+import hashlib
+import os
+import shutil
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import pygame
+from core.config import DATA_DIR
+
+CACHE_DIR: Path = DATA_DIR / 'tile_cache'
+
+def source_hash(path) -> str:
+    try:
+        return hashlib.sha1(Path(path).read_bytes()).hexdigest()[:12]
+    except OSError:
+        return 'nosrc'
+
+def _file_name(token: str) -> str:
+    # tokens são identificadores simples; qualquer outra coisa vira hex
+    if token and all(ch.isalnum() or ch == '_' for ch in token):
+        return token + '.rgba'
+    return 'x' + token.encode('utf-8').hex() + '.rgba'
+
+class TileDiskCache:
+    """Uma pasta por (fábrica, tamanho, versão do código); um arquivo RGBA por token."""
+    def __init__(self, name: str, source, size: Tuple[int, int]):
+        self.size = (int(size[0]), int(size[1]))
+        self.prefix = f'{name}_{self.size[0]}x{self.size[1]}_'
+        self.dir = CACHE_DIR / (self.prefix + source_hash(source))
+        self._pruned = False
+
+    def load(self, token: str) -> Optional[pygame.Surface]:
+        path = self.dir / _file_name(token)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        w, h = self.size
+        if len(data) != w * h * 4:
+            return None
+        return pygame.image.frombytes(data, self.size, 'RGBA')
+
+    def save(self, token: str, surf: pygame.Surface):
+        if surf.get_size() != self.size:
+            return
+        if not self._pruned:
+            self._prune()
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / _file_name(token)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(pygame.image.tobytes(surf, 'RGBA'))
+        os.replace(tmp, path)
+
+    def _prune(self):
+        """Apaga versões antigas desta mesma fábrica/tamanho."""
+        self._pruned = True
+        if not CACHE_DIR.is_dir():
+            return
+        for p in CACHE_DIR.iterdir():
+            if p.is_dir() and p.name.startswith(self.prefix) and p != self.dir:
+                shutil.rmtree(p, ignore_errors=True)
+
+    def clear(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+def disk_cached(name: str, source, size: Tuple[int, int]) -> Callable:
+    """Decorador para render(token) -> Surface: lê do disco ou renderiza e grava."""
+    cache = TileDiskCache(name, source, size)
+    def deco(render: Callable[[str], pygame.Surface]):
+        @wraps(render)
+        def wrapper(token: str) -> pygame.Surface:
+            surf = cache.load(token)
+            if surf is None:
+                surf = render(token)
+                try:
+                    cache.save(token, surf)
+                except OSError as e:
+                    print('[TileCache] falha ao gravar', token, e)
+            return surf
+        wrapper.disk_cache = cache
+        return wrapper
+    return deco
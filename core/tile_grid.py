@@ -0,0 +1,166 @@
+# core/tile_grid.py — paleta token<->id e grades compactas (1 byte por célula)
+"""
+Camadas antigas são list[list[str]] ('grass', '', ...). Aqui cada camada vira
+um TileGrid: array('B') contíguo em ordem de linha + uma TilePalette que traduz
+id <-> token (id 0 = vazio). `grid[r][c]` continua devolvendo o token, então o
+código que lê o formato antigo segue funcionando sem mudanças.
+"""
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Ordem fixa = ids estáveis entre execuções (serialização/cache em disco)
+DEFAULT_TOKENS = (
+    '', 'grass', 'sand', 'water', 'path', 'shore', 'snow',
+    'snow_patch', 'grass_detail', 'rock_crack', 'ice_crack',
+    'dbg_city', 'dbg_village', 'dbg_cave', 'dbg_dungeon',
+)
+
+class TilePalette:
+    """Registro token -> id (0..255). Tokens novos ganham o próximo id livre."""
+    def __init__(self, tokens: Iterable[str] = DEFAULT_TOKENS):
+        self.tokens: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for tok in tokens:
+            self.id_of(tok)
+
+    def id_of(self, token: str) -> int:
+        token = token or ''
+        tid = self._ids.get(token)
+        if tid is None:
+            if len(self.tokens) >= 256:
+                raise ValueError('TilePalette cheia (máx. 256 tokens)')
+            tid = len(self.tokens)
+            self.tokens.append(token)
+            self._ids[token] = tid
+        return tid
+
+    def token_of(self, tid: int) -> str:
+        return self.tokens[tid]
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+PALETTE = TilePalette()
+
+class _RowView:
+    """Adaptador de leitura/escrita de uma linha em tokens (compat list[str])."""
+    __slots__ = ('_g', '_base')
+    def __init__(self, grid: 'TileGrid', r: int):
+        self._g = grid
+        self._base = r * grid.cols
+
+    def __len__(self) -> int:
+        return self._g.cols
+
+    def __getitem__(self, c):
+        g = self._g
+        if isinstance(c, slice):
+            return [g.palette.tokens[t] for t in g.data[self._base:self._base + g.cols][c]]
+        if c < 0:
+            c += g.cols
+        if not 0 <= c < g.cols:
+            raise IndexError(c)
+        return g.palette.tokens[g.data[self._base + c]]
+
+    def __setitem__(self, c: int, token: str):
+        g = self._g
+        if c < 0:
+            c += g.cols
+        if not 0 <= c < g.cols:
+            raise IndexError(c)
+        g.data[self._base + c] = g.palette.id_of(token)
+
+    def __iter__(self):
+        toks = self._g.palette.tokens
+        return (toks[t] for t in self._g.data[self._base:self._base + self._g.cols])
+
+class TileGrid:
+    """Grade rows x cols de ids uint8, linha a linha.
+    `data` é array('B') ou qualquer buffer uint8 indexável (ex.: memoryview de mmap).
+    """
+    __slots__ = ('rows', 'cols', 'data', 'palette')
+    def __init__(self, rows: int, cols: int, data: Optional[array] = None, palette: TilePalette = PALETTE):
+        self.rows, self.cols = int(rows), int(cols)
+        self.data = data if data is not None else array('B', bytes(self.rows * self.cols))
+        if len(self.data) != self.rows * self.cols:
+            raise ValueError('TileGrid: tamanho de data não bate com rows*cols')
+        self.palette = palette
+
+    # --- construção ---
+    @classmethod
+    def from_tokens(cls, grid: Sequence[Sequence[str]], palette: TilePalette = PALETTE) -> 'TileGrid':
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        lut: Dict[str, int] = {}
+        data = array('B')
+        for row in grid:
+            for tok in row:
+                tid = lut.get(tok)
+                if tid is None:
+                    tid = lut[tok] = palette.id_of(tok)
+                data.append(tid)
+        return cls(rows, cols, data, palette)
+
+    @classmethod
+    def from_numpy(cls, arr, palette: TilePalette = PALETTE) -> 'TileGrid':
+        rows, cols = arr.shape
+        return cls(rows, cols, array('B', arr.astype('uint8', copy=False).tobytes()), palette)
+
+    @classmethod
+    def frombytes(cls, rows: int, cols: int, buf, palette: TilePalette = PALETTE) -> 'TileGrid':
+        data = array('B')
+        data.frombytes(bytes(buf))
+        return cls(rows, cols, data, palette)
+
+    # --- acesso por id ---
+    def get(self, r: int, c: int) -> int:
+        return self.data[r * self.cols + c]
+
+    def set(self, r: int, c: int, tid: int):
+        self.data[r * self.cols + c] = tid
+
+    def row_ids(self, r: int, c0: int = 0, c1: Optional[int] = None) -> array:
+        """Ids da linha r no intervalo [c0, c1] inclusivo (fatia contígua)."""
+        base = r * self.cols
+        return self.data[base + c0: base + (self.cols - 1 if c1 is None else c1) + 1]
+
+    def ids_present(self) -> set:
+        return set(self.data)
+
+    def as_numpy(self):
+        """View NumPy (rows, cols) sobre o mesmo buffer (sem cópia)."""
+        import numpy as np
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.rows, self.cols)
+
+    def tobytes(self) -> bytes:
+        return self.data.tobytes()
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) * self.data.itemsize
+
+    # --- compat com list[list[str]] ---
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, r: int) -> _RowView:
+        if r < 0:
+            r += self.rows
+        if not 0 <= r < self.rows:
+            raise IndexError(r)
+        return _RowView(self, r)
+
+    def __iter__(self):
+        return (_RowView(self, r) for r in range(self.rows))
+
+    def tolist(self) -> List[List[str]]:
+        toks = self.palette.tokens
+        cols = self.cols
+        return [[toks[t] for t in self.data[r*cols:(r+1)*cols]] for r in range(self.rows)]
+
+def as_tile_grid(grid, palette: TilePalette = PALETTE) -> TileGrid:
+    """Aceita TileGrid (devolve igual) ou list[list[str]] (converte)."""
+    if isinstance(grid, TileGrid):
+        return grid
+    return TileGrid.from_tokens(grid, palette)
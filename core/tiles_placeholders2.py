@@ -2,6 +2,7 @@
 import pygame
 from functools import lru_cache
 from core.iso_math2 import TILE_W, TILE_H
+from core.tile_disk_cache import disk_cached
 
 DEBUG_LABELS = True  # coloque False quando não quiser textos grandes
 
@@ -22,6 +23,7 @@ COLORS = {
 }
 
 @lru_cache(maxsize=256)
+@disk_cached('placeholders2' if DEBUG_LABELS else 'placeholders2_nolabel', __file__, (TILE_W, TILE_H))
 def _build(token:str)->pygame.Surface:
     t = (token or 'grass').lower()
     a,b = COLORS.get(t, COLORS['grass'])
@@ -74,6 +74,66 @@ def tint(screen: pygame.Surface, color=(32, 42, 64), alpha=40):
     veil.fill((*color, int(alpha)))
     screen.blit(veil, (0, 0))
 
+class Backdrop:
+    """
+    Fundo de menu pré-composto: imagem (fit/cover) ou cor + véu + vinheta + grão,
+    montado uma vez numa Surface opaca por (tamanho da tela, scale_mode).
+    Por frame custa um blit; muda de resolução ou de modo -> recompõe.
+    Vinheta e grão (lentos de gerar) ficam num cache por tamanho compartilhado
+    entre as cenas.
+    """
+    def __init__(self, img: pygame.Surface = None, *, fill=(8, 10, 14), tint_color=(20, 28, 42),
+                 tint_alpha=40, vignette=0.75, grain=24):
+        self.img = img
+        self.fill = fill
+        self.tint_color = tint_color
+        self.tint_alpha = int(tint_alpha)
+        self.vignette = vignette
+        self.grain = grain
+        self._key = None
+        self._surf = None
+
+    def invalidate(self):
+        self._key = None
+        self._surf = None
+
+    def get(self, size, mode: str = 'fit') -> pygame.Surface:
+        key = (tuple(size), mode if self.img else None)
+        if key != self._key:
+            self._key = key
+            self._surf = self._compose(key[0], mode)
+        return self._surf
+
+    def _compose(self, size, mode):
+        surf = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill(self.fill)
+        if self.img:
+            (blit_cover if mode == 'cover' else blit_fit)(surf, self.img)
+        tint(surf, color=self.tint_color, alpha=self.tint_alpha)
+        if self.vignette:
+            surf.blit(_fx_layer('vignette', size, self.vignette), (0, 0))
+        if self.grain:
+            surf.blit(_fx_layer('grain', size, self.grain), (0, 0))
+        return surf
+
+    def draw(self, screen: pygame.Surface, mode: str = 'fit'):
+        screen.blit(self.get(screen.get_size(), mode), (0, 0))
+
+_FX_LAYERS = {}
+
+def _fx_layer(kind, size, amount):
+    key = (kind, tuple(size), amount)
+    layer = _FX_LAYERS.get(key)
+    if layer is None:
+        if kind == 'vignette':
+            layer = make_vignette(size, strength=amount)
+        else:
+            layer = make_grain(size, intensity=amount)
+        _FX_LAYERS[key] = layer
+    return layer
+
 # FX opcional de “chama” para hotspots (não obrigatório)
 
 def _make_flame_disc(radius=160, color=(255,140,40), alpha=140):
@@ -0,0 +1,110 @@
+# core/zoom_view.py — desenho direto na tela com zoom quantizado e espelho horizontal
+"""
+Em vez de desenhar o mundo numa RT do tamanho da visão e fazer smoothscale/flip
+da tela inteira, cada Surface (chunk, sprite, prop) ganha uma variante já escalada
+(e espelhada) que fica em cache; a posição vem da câmera. Só funciona com zoom
+em um nível quantizado (ZOOM_STEP): durante a transição de zoom a cena volta
+para a RT + smoothscale. Frames com espelho pronto (register_mirror, ex.: folhas
+de ator) usam esse em vez de transform.flip.
+
+As variantes ficam em VARIANTS, um ChunkCache (LRU por bytes) com chave
+(weakref da origem, zkey, flip): tiles, props e overlays vivem a cena inteira,
+então sem teto cada passo de zoom visitado ficaria residente para sempre.
+"""
+from __future__ import annotations
+import math
+import weakref
+from typing import Tuple
+import pygame
+from core.chunk_cache import ChunkCache
+
+ZOOM_STEP = 0.02
+VARIANT_MB = 96.0
+
+def zoom_key(zoom: float) -> int:
+    """Índice do nível quantizado mais próximo (chave de cache)."""
+    return int(round(float(zoom) / ZOOM_STEP))
+
+def quantize_zoom(zoom: float) -> float:
+    return zoom_key(zoom) * ZOOM_STEP
+
+def is_quantized(zoom: float, eps: float = 1e-6) -> bool:
+    return abs(float(zoom) - quantize_zoom(zoom)) <= eps
+
+def scaled_size(size: Tuple[int, int], zoom: float) -> Tuple[int, int]:
+    # ceil: vizinhos se sobrepõem 1px em vez de abrir fresta
+    return max(1, int(math.ceil(size[0] * zoom))), max(1, int(math.ceil(size[1] * zoom)))
+
+# variantes escaladas/espelhadas de sprites, props e overlays; chave de origem morta
+# nunca mais casa (weakref compara por identidade) e sai pela LRU
+VARIANTS = ChunkCache(max_mb=VARIANT_MB)
+# espelhos pré-calculados (frame -> frame espelhado)
+_MIRRORS: 'weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface]' = weakref.WeakKeyDictionary()
+
+def register_mirror(surf: pygame.Surface, mirrored: pygame.Surface):
+    """Declara `mirrored` como o espelho horizontal de `surf` (e vice-versa)."""
+    _MIRRORS[surf] = mirrored
+    _MIRRORS[mirrored] = surf
+
+def make_variant(surf: pygame.Surface, zoom: float, flip: bool) -> pygame.Surface:
+    """Cópia escalada (smoothscale) e/ou espelhada de `surf`; zoom 1 sem flip = a própria."""
+    out = surf
+    if flip:
+        mirror = _MIRRORS.get(surf)
+        if mirror is not None:
+            out, flip = mirror, False
+    if zoom_key(zoom) != zoom_key(1.0):
+        out = pygame.transform.smoothscale(out, scaled_size(out.get_size(), zoom))
+    if flip:
+        out = pygame.transform.flip(out, True, False)
+    return out
+
+class ZoomView:
+    """Câmera de desenho nativo: mundo -> tela com zoom quantizado e flip opcional.
+    Compatível com CameraV2 onde importa (x, y, zoom, screen_w/h, world_to_screen)."""
+    def __init__(self, camera, screen_w: int, screen_h: int, *, flip: bool = False, zoom: float = None):
+        self.x = float(camera.x)
+        self.y = float(camera.y)
+        self.zoom = quantize_zoom(camera.zoom if zoom is None else zoom)
+        self.zkey = zoom_key(self.zoom)
+        self.flip = bool(flip)
+        self.screen_w, self.screen_h = int(screen_w), int(screen_h)
+        self.vel_px = getattr(camera, 'vel_px', (0.0, 0.0))
+        self.lookahead_t = getattr(camera, 'lookahead_t', 0.0)
+
+    def world_rect(self) -> pygame.Rect:
+        """Área visível em mundo."""
+        return pygame.Rect(int(self.x), int(self.y), int(self.screen_w / self.zoom), int(self.screen_h / self.zoom))
+
+    def world_to_screen(self, pos) -> Tuple[int, int]:
+        """Ponto de mundo -> tela (espelhado se flip)."""
+        sx = int((float(pos[0]) - self.x) * self.zoom)
+        sy = int((float(pos[1]) - self.y) * self.zoom)
+        return (self.screen_w - sx, sy) if self.flip else (sx, sy)
+
+    def place(self, rect) -> Tuple[int, int]:
+        """Topleft na tela da variante de uma Surface cujo rect de mundo é `rect`."""
+        sx = int((rect.left - self.x) * self.zoom)
+        sy = int((rect.top - self.y) * self.zoom)
+        if self.flip:
+            sx = self.screen_w - sx - scaled_size(rect.size, self.zoom)[0]
+        return sx, sy
+
+    def screen_rect(self, rect) -> pygame.Rect:
+        x, y = self.place(rect)
+        return pygame.Rect((x, y), scaled_size(rect.size, self.zoom))
+
+    def image(self, surf: pygame.Surface) -> pygame.Surface:
+        """Variante em cache de `surf` para este zoom/flip."""
+        if self.zkey == zoom_key(1.0):
+            if not self.flip:
+                return surf
+            mirror = _MIRRORS.get(surf)
+            if mirror is not None:
+                return mirror
+        k = (weakref.ref(surf), self.zkey, self.flip)
+        out = VARIANTS.get(k)
+        if out is None:
+            out = make_variant(surf, self.zoom, self.flip)
+            VARIANTS.put(k, out)
+        return out
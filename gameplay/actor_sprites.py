@@ -1,7 +1,13 @@
 # gameplay/actor_sprites.py
 from __future__ import annotations
 import pygame, math, hashlib
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Mapping, Tuple, Optional
+from pathlib import Path
+from core.chunk_cache import surface_bytes
+from core.config import DATA_DIR
+from core.tile_disk_cache import source_hash
+from gameplay import anim_sheet as anim_sheet_module
+from gameplay.anim_sheet import AnimSheet, dir_vectors
 
 # Tamanho padrão do player (ajuste conforme seu jogo)
 PLAYER_SIZE: Tuple[int,int] = (64, 96)
@@ -48,9 +54,11 @@ def _class_accent(clazz_label: str) -> Tuple[int,int,int]:
     return (120 + h % 80, 90 + (h//3) % 80, 90 + (h//5) % 80)
 
 
-def _make_frame(size: Tuple[int,int], phase: float, body: Tuple[int,int,int], accent: Tuple[int,int,int]) -> pygame.Surface:
+def _make_frame(size: Tuple[int,int], phase: float, body: Tuple[int,int,int], accent: Tuple[int,int,int],
+                facing: Optional[Tuple[float,float]] = None) -> pygame.Surface:
     """Desenha um busto humanoide estilizado com pequenas variações por fase.
     phase: 0..1 (usado para idle/walk/run)
+    facing: vetor de tela (x, y p/ baixo) para onde o ator olha; None = sem direção
     """
     w, h = size
     surf = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -73,8 +81,14 @@ def _make_frame(size: Tuple[int,int], phase: float, body: Tuple[int,int,int], ac
 
     # cabeça
     head_r = int(min(w,h) * 0.17)
-    head_c = (w//2, int(h*0.36) + oscill)
+    lean = int(facing[0] * w * 0.04) if facing else 0
+    head_c = (w//2 + lean, int(h*0.36) + oscill)
     pygame.draw.circle(surf, tuple(min(255, c+14) for c in body), head_c, head_r)
+    # viseira do lado para onde olha (de costas não aparece)
+    if facing and facing[1] > -0.5:
+        visor = pygame.Rect(0, 0, int(head_r*1.1), max(2, int(head_r*0.35)))
+        visor.center = (head_c[0] + int(facing[0] * head_r * 0.45), head_c[1] + int(facing[1] * head_r * 0.2))
+        pygame.draw.rect(surf, accent, visor, border_radius=3)
 
     # ombreiras/acento
     pad_w = int(w*0.22)
@@ -92,40 +106,26 @@ def _make_frame(size: Tuple[int,int], phase: float, body: Tuple[int,int,int], ac
     return surf
 
 
-def _make_anim(size: Tuple[int,int], frames: int, speed: float, body: Tuple[int,int,int], accent: Tuple[int,int,int]) -> List[pygame.Surface]:
+def _make_anim(size: Tuple[int,int], frames: int, speed: float, body: Tuple[int,int,int], accent: Tuple[int,int,int],
+               facing: Optional[Tuple[float,float]] = None) -> List[pygame.Surface]:
     """Gera uma animação simples variando o phase."""
     anim = []
     for i in range(frames):
         phase = (i / max(1, frames-1)) * speed
-        anim.append(_make_frame(size, phase, body, accent))
+        anim.append(_make_frame(size, phase, body, accent, facing))
     return anim
 
 
-def build_actor_sprites(profile: Dict, size: Tuple[int,int] = PLAYER_SIZE, anim_frames: int = 8) -> Dict[str, List[pygame.Surface]]:
-    """
-    Gera um dicionário com animações do ator a partir do profile do criador V2.
-    Retorna chaves comuns: 'idle', 'walk', 'run', 'attack'.
-
-    profile esperado (exemplo):
-    {
-      'name': '...', 'gender': 'Masculino',
-      'race': 'Planicius', 'clazz': 'Sombra', 'sign': 'Vulkhar',
-      'skills': ['Arco','Furtividade'], 'stats': {...}
-    }
-    """
-    race_label = profile.get('race', '')
-    clazz_label = profile.get('clazz', '')
-    body = _race_body_color(race_label)
-    accent = _class_accent(clazz_label)
-
-    idle = _make_anim(size, anim_frames, speed=0.6, body=body, accent=accent)
-    walk = _make_anim(size, anim_frames, speed=1.2, body=body, accent=accent)
-    run  = _make_anim(size, anim_frames, speed=1.8, body=body, accent=accent)
+def _build_anim_set(size: Tuple[int,int], anim_frames: int, body: Tuple[int,int,int], accent: Tuple[int,int,int],
+                    facing: Optional[Tuple[float,float]] = None) -> Dict[str, List[pygame.Surface]]:
+    idle = _make_anim(size, anim_frames, speed=0.6, body=body, accent=accent, facing=facing)
+    walk = _make_anim(size, anim_frames, speed=1.2, body=body, accent=accent, facing=facing)
+    run  = _make_anim(size, anim_frames, speed=1.8, body=body, accent=accent, facing=facing)
     # ataque: usa as mesmas bases mas com um "flash" de acento no frame central
     attack = []
     mid = anim_frames//2
     for i in range(anim_frames):
-        frame = _make_frame(size, i/anim_frames, body, accent)
+        frame = _make_frame(size, i/anim_frames, body, accent, facing)
         if i == mid:
             glow = pygame.Surface(size, pygame.SRCALPHA)
             pygame.draw.circle(glow, (*accent, 80), (size[0]//2, int(size[1]*0.45)), int(min(size)*0.20))
@@ -138,3 +138,120 @@ def build_actor_sprites(profile: Dict, size: Tuple[int,int] = PLAYER_SIZE, anim_
         'run': run,
         'attack': attack,
     }
+
+
+AnimSet = Mapping[str, Tuple[pygame.Surface, ...]]
+
+# fps por estado gravado na folha (player/inimigos leem daqui)
+STATE_FPS: Dict[str, float] = {'idle': 6, 'walk': 8, 'run': 12, 'attack': 12}
+
+# direções desenhadas por folha (1, 4 ou 8) e se a folha leva o conjunto espelhado
+ACTOR_DIRECTIONS = 4
+ACTOR_MIRRORED = True
+
+# folhas prontas em disco: DATA_DIR/anim_cache/actor_<chave>_<versão do código>.{json,rgba}
+SHEET_DIR: Path = DATA_DIR / 'anim_cache'
+_SHEET_VERSION = source_hash(__file__)[:6] + source_hash(anim_sheet_module.__file__)[:6]
+
+class ActorSpriteCache:
+    """
+    Folhas de animação de ator compartilhadas por (corpo, acento, tamanho, nº de frames,
+    direções). Cada folha traz um conjunto por direção e o espelho de todos.
+    Perfis que resolvem para as mesmas cores recebem a MESMA AnimSheet (somente
+    leitura: não desenhe nos frames devolvidos). Folha nova é lida de SHEET_DIR
+    quando existe; senão é desenhada, empacotada e gravada lá (disk=False desliga).
+    """
+    def __init__(self, disk: bool = True, dirs: int = ACTOR_DIRECTIONS, mirrored: bool = ACTOR_MIRRORED):
+        self.disk = disk
+        self.dirs = int(dirs)
+        self.mirrored = bool(mirrored)
+        self._sheets: Dict[tuple, AnimSheet] = {}
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+
+    def key_for(self, profile: Dict, size: Tuple[int,int], anim_frames: int) -> tuple:
+        body = _race_body_color(profile.get('race', ''))
+        accent = _class_accent(profile.get('clazz', ''))
+        return (body, accent, (int(size[0]), int(size[1])), int(anim_frames), self.dirs, self.mirrored)
+
+    @staticmethod
+    def _disk_base(key: tuple) -> Path:
+        (b, a, (w, h), n, dirs, mirrored) = key
+        name = 'actor_%02x%02x%02x_%02x%02x%02x_%dx%d_%d_d%d%s_%s' % (
+            *b, *a, w, h, n, dirs, 'm' if mirrored else '', _SHEET_VERSION)
+        return SHEET_DIR / name
+
+    def get_sheet(self, profile: Dict, size: Tuple[int,int] = PLAYER_SIZE, anim_frames: int = 8) -> AnimSheet:
+        key = self.key_for(profile, size, anim_frames)
+        sheet = self._sheets.get(key)
+        if sheet is not None:
+            self.hits += 1
+            return sheet
+        self.misses += 1
+        sheet = AnimSheet.load(self._disk_base(key)) if self.disk else None
+        if sheet is not None:
+            self.disk_loads += 1
+        else:
+            body, accent, size, n, dirs, mirrored = key
+            facings = dir_vectors(dirs) if dirs > 1 else (None,)
+            sets = [_build_anim_set(size, n, body, accent, f) for f in facings]
+            sheet = AnimSheet.pack(sets, STATE_FPS, mirrored=mirrored)
+            if self.disk:
+                try:
+                    sheet.save(self._disk_base(key))
+                except OSError as e:
+                    print('[AnimCache] falha ao gravar', key, e)
+        self._sheets[key] = sheet
+        return sheet
+
+    def get(self, profile: Dict, size: Tuple[int,int] = PLAYER_SIZE, anim_frames: int = 8) -> AnimSet:
+        return self.get_sheet(profile, size, anim_frames).anim
+
+    def prebuild(self, profiles: Iterable[Dict], size: Tuple[int,int] = PLAYER_SIZE, anim_frames: int = 8) -> int:
+        """Monta antes (ex.: na carga da região) as animações que ainda faltam; devolve quantas foram montadas."""
+        before = self.misses
+        for profile in profiles:
+            if self.key_for(profile, size, anim_frames) not in self._sheets:
+                self.get_sheet(profile, size, anim_frames)
+        return self.misses - before
+
+    def stats(self) -> Dict[str, float]:
+        frames = sum(len(sh.frames) for sh in self._sheets.values())
+        resident = sum(surface_bytes(sh.surface) for sh in self._sheets.values())
+        return {'sets': len(self._sheets), 'frames': frames, 'hits': self.hits, 'misses': self.misses,
+                'disk_loads': self.disk_loads, 'resident_mb': resident / (1024 * 1024)}
+
+    def clear(self):
+        self._sheets.clear()
+
+SPRITE_CACHE = ActorSpriteCache()
+
+
+def build_actor_sprites(profile: Dict, size: Tuple[int,int] = PLAYER_SIZE, anim_frames: int = 8) -> AnimSet:
+    """
+    Animações do ator a partir do profile do criador V2 (compartilhadas via SPRITE_CACHE).
+    Retorna chaves comuns: 'idle', 'walk', 'run', 'attack' -> tupla de frames.
+
+    profile esperado (exemplo):
+    {
+      'name': '...', 'gender': 'Masculino',
+      'race': 'Planicius', 'clazz': 'Sombra', 'sign': 'Vulkhar',
+      'skills': ['Arco','Furtividade'], 'stats': {...}
+    }
+    """
+    return SPRITE_CACHE.get(profile, size, anim_frames)
+
+
+def build_actor_sheet(profile: Dict, size: Tuple[int,int] = PLAYER_SIZE, anim_frames: int = 8) -> AnimSheet:
+    """Folha de animação (AnimSheet) do ator; mesma chave/cache de build_actor_sprites."""
+    return SPRITE_CACHE.get_sheet(profile, size, anim_frames)
+
+
+def prebuild_actor_sprites(profiles: Iterable[Dict], size: Tuple[int,int] = PLAYER_SIZE, anim_frames: int = 8) -> int:
+    return SPRITE_CACHE.prebuild(profiles, size, anim_frames)
+
+
+def actor_sprite_stats() -> Dict[str, float]:
+    """Conjuntos/frames/memória do cache de animações (para calibrar spawns)."""
+    return SPRITE_CACHE.stats()
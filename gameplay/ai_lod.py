@@ -0,0 +1,40 @@
+# gameplay/ai_lod.py — nível de detalhe da IA (quem atualiza em qual frame)
+"""
+Inimigos ganham um nível (tier) por distância ao player e à câmera:
+    LOD_NEAR   na tela (view com margem)          -> todo frame, com animação
+    LOD_MID    fora da tela, até 30 tiles do player -> 1 a cada 2 frames, sem animação
+    LOD_FAR    fora da tela, além de 30 tiles       -> 1 a cada 8 frames, sem animação
+Quem pula frames acumula o dt (e o nº de frames) e anda tudo de uma vez no tick,
+então a posição final é a mesma. Cada inimigo tem uma fase própria, para os
+ticks dos distantes se espalharem pelos frames em vez de caírem todos juntos.
+"""
+from __future__ import annotations
+from typing import Optional, Tuple
+
+LOD_NEAR, LOD_MID, LOD_FAR = 0, 1, 2
+LOD_PERIOD = (1, 2, 8)         # frames entre ticks, por tier
+LOD_PHASES = 8                 # múltiplo de todos os períodos
+FAR_D2 = 900.0                 # mesmo limiar do ramo "só vagueia" de update_ai
+VIEW_MARGIN = 96               # px de mundo em volta da view que ainda contam como tela
+
+View = Tuple[float, float, float, float]   # (left, top, right, bottom) em px de mundo
+
+def view_from_camera(camera, w: int, h: int, margin: int = VIEW_MARGIN) -> View:
+    """Retângulo visível da câmera (px de mundo, já descontado o zoom) com margem."""
+    z = max(1e-6, float(camera.zoom))
+    x, y = float(camera.x), float(camera.y)
+    return (x - margin, y - margin, x + w / z + margin, y + h / z + margin)
+
+def tier_of(d2: float, x: float, y: float, view: Optional[View]) -> int:
+    """Tier de um inimigo a d2 tiles² do player com âncora (x, y) em px de mundo."""
+    if view is None:
+        on_screen = d2 <= FAR_D2
+    else:
+        on_screen = view[0] <= x <= view[2] and view[1] <= y <= view[3]
+    if on_screen:
+        return LOD_NEAR
+    return LOD_MID if d2 <= FAR_D2 else LOD_FAR
+
+def wander_chance(p_frame: float, frames: int) -> float:
+    """Chance de sortear ao menos uma vez em `frames` frames (p_frame por frame)."""
+    return 1.0 - (1.0 - p_frame) ** max(1, frames)
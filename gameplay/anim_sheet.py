@@ -0,0 +1,146 @@
+# gameplay/anim_sheet.py — animações de ator numa Surface só (sprite-sheet)
+"""
+Formato: uma Surface RGBA com os frames em grade — um bloco de linhas por
+direção (uma linha por estado, na ordem de `states`), e, com mirrored=True, o
+mesmo conjunto espelhado logo abaixo. Mais os Rects de cada frame e, por
+estado, (primeiro índice, nº de frames, fps). Os frames saem como subsurfaces
+da folha (sem cópia), criadas uma vez: quem anima guarda só (estado, índice,
+direção) e pede sheet.frame(estado, i, direção, flip).
+
+Direções (dirs = 1, 4 ou 8) em tela, sentido horário a partir do leste:
+4 -> L, S, O, N; 8 -> L, SE, S, SO, O, NO, N, NE. dir_of(fx, fy) escolhe pela
+direção do facing. Cada frame é registrado em core.zoom_view com seu espelho,
+então o render espelhado nunca chama transform.flip.
+
+Em disco: <base>.json (metadados) + <base>.rgba (pixels crus da folha).
+"""
+from __future__ import annotations
+import json
+import math
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import pygame
+from core.zoom_view import register_mirror
+
+StateSpec = Tuple[int, int, float]   # (primeiro frame, nº de frames, fps)
+AnimDict = Mapping[str, Sequence[pygame.Surface]]
+
+def dir_vectors(dirs: int) -> Tuple[Tuple[float, float], ...]:
+    """Vetor de tela (x, y para baixo) de cada direção."""
+    return tuple((math.cos(2 * math.pi * k / dirs), math.sin(2 * math.pi * k / dirs)) for k in range(dirs))
+
+class AnimSheet:
+    def __init__(self, surface: pygame.Surface, frame_size: Tuple[int, int], states: Dict[str, StateSpec],
+                 dirs: int = 1, mirrored: bool = False):
+        self.surface = surface
+        self.frame_size = (int(frame_size[0]), int(frame_size[1]))
+        self.states: Dict[str, StateSpec] = {k: (int(a), int(n), float(f)) for k, (a, n, f) in states.items()}
+        self.dirs = max(1, int(dirs))
+        self.mirrored = bool(mirrored)
+        fw, fh = self.frame_size
+        nrows = len(self.states)
+        # _sets[(direção, espelhado)] -> tupla de frames (índice global por estado)
+        self._sets: Dict[Tuple[int, bool], Tuple[pygame.Surface, ...]] = {}
+        self.rects = []
+        for m in ((False, True) if self.mirrored else (False,)):
+            for d in range(self.dirs):
+                base_row = (self.dirs * nrows if m else 0) + d * nrows
+                rects = [pygame.Rect(col * fw, (base_row + row) * fh, fw, fh)
+                         for row, (_, count, _) in enumerate(self.states.values()) for col in range(count)]
+                self.rects.extend(rects)
+                self._sets[(d, m)] = tuple(surface.subsurface(r) for r in rects)
+        if self.mirrored:
+            for d in range(self.dirs):
+                for a, b in zip(self._sets[(d, False)], self._sets[(d, True)]):
+                    register_mirror(a, b)
+        self.frames = self._sets[(0, False)]
+        # compat: estado -> tupla de frames (direção 0, sem espelho)
+        self.anim: Mapping[str, Tuple[pygame.Surface, ...]] = MappingProxyType(
+            {k: self.frames[a:a + n] for k, (a, n, _) in self.states.items()})
+
+    # --- montagem ---
+    @classmethod
+    def pack(cls, anims: Union[AnimDict, Sequence[AnimDict]], fps: Mapping[str, float],
+             mirrored: bool = False) -> 'AnimSheet':
+        """Empacota {estado: [frames]} (um dict por direção; frames do mesmo tamanho) numa folha."""
+        if isinstance(anims, Mapping):
+            anims = [anims]
+        first_set = anims[0]
+        fw, fh = next(iter(first_set.values()))[0].get_size()
+        cols = max(len(frames) for frames in first_set.values())
+        nrows = len(first_set) * len(anims)
+        surface = pygame.Surface((fw * cols, fh * nrows * (2 if mirrored else 1)), pygame.SRCALPHA)
+        row = 0
+        for anim in anims:
+            for frames in anim.values():
+                surface.blits([(f, (col * fw, row * fh)) for col, f in enumerate(frames)], False)
+                row += 1
+        if mirrored:
+            # metade de baixo = cada frame espelhado no próprio lugar
+            for r in range(nrows):
+                for col in range(cols):
+                    src = surface.subsurface(pygame.Rect(col * fw, r * fh, fw, fh))
+                    surface.blit(pygame.transform.flip(src, True, False), (col * fw, (nrows + r) * fh))
+        states: Dict[str, StateSpec] = {}
+        first = 0
+        for name, frames in first_set.items():
+            states[name] = (first, len(frames), float(fps.get(name, 8)))
+            first += len(frames)
+        return cls(surface, (fw, fh), states, dirs=len(anims), mirrored=mirrored)
+
+    # --- acesso ---
+    def count(self, state: str) -> int:
+        return self._spec(state)[1]
+
+    def fps(self, state: str) -> float:
+        return self._spec(state)[2]
+
+    def dir_of(self, fx: float, fy: float) -> int:
+        """Índice da direção mais próxima do facing (fx, fy) em tela."""
+        if self.dirs == 1 or (fx == 0 and fy == 0):
+            return 0
+        return int(round(math.atan2(fy, fx) / (2 * math.pi / self.dirs))) % self.dirs
+
+    def frame(self, state: str, idx: int, direction: int = 0, flip: bool = False) -> pygame.Surface:
+        first, count, _ = self._spec(state)
+        frames = self._sets[(direction % self.dirs, flip and self.mirrored)]
+        out = frames[first + idx % count]
+        if flip and not self.mirrored:
+            out = pygame.transform.flip(out, True, False)
+        return out
+
+    def _spec(self, state: str) -> StateSpec:
+        spec = self.states.get(state)
+        return spec if spec is not None else self.states['idle']
+
+    # --- disco ---
+    def save(self, base: Path):
+        base = Path(base)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        meta = {'size': list(self.surface.get_size()), 'frame_size': list(self.frame_size),
+                'states': {k: list(v) for k, v in self.states.items()},
+                'dirs': self.dirs, 'mirrored': self.mirrored}
+        for suffix, data in (('.rgba', pygame.image.tobytes(self.surface, 'RGBA')),
+                             ('.json', json.dumps(meta).encode('utf-8'))):
+            path = base.with_suffix(suffix)
+            tmp = path.with_suffix(suffix + '.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, base: Path) -> Optional['AnimSheet']:
+        base = Path(base)
+        try:
+            meta = json.loads(base.with_suffix('.json').read_text(encoding='utf-8'))
+            data = base.with_suffix('.rgba').read_bytes()
+            size = tuple(meta['size'])
+            if len(data) != size[0] * size[1] * 4:
+                return None
+            surface = pygame.image.frombytes(data, size, 'RGBA')
+            return cls(surface, tuple(meta['frame_size']), {k: tuple(v) for k, v in meta['states'].items()},
+                       dirs=meta.get('dirs', 1), mirrored=meta.get('mirrored', False))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
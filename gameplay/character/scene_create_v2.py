@@ -4,7 +4,7 @@ import math, pygame
 from core.settings import load_settings
 from core.strings import t
 from ui.theme import get_font, COLORS
-from core.ui_fx import make_vignette, make_grain, tint
+from core.ui_fx import Backdrop
 from gameplay.character import schema, builder, compute, portraits
 
 STEP_GENDER = 0
@@ -30,19 +30,12 @@ class SceneCreateV2:
         self.on_complete = on_complete
         st = load_settings(); self.lang = st.get('language','en-US')
         self.h1 = get_font(42); self.h2 = get_font(28); self.body = get_font(22); self.small = get_font(18)
-        self._fx_size = None; self.vignette = None; self.grain = None
+        self.backdrop = Backdrop(fill=(12,14,18), tint_alpha=42, grain=22)
         self.step = STEP_GENDER; self.sel_idx = 0; self.builder = builder.Builder()
         self._races = schema.race_keys(); self._classes = schema.class_keys(); self._consts = schema.const_keys(); self._skills = schema.skill_keys()
         self.skill_cursor = 0
         self._trans_t = 0.0; self._trans_dur = max(0.001, ANIM.get('step_fade_ms',180)/1000.0)
 
-    def _ensure_fx(self, screen):
-        size = screen.get_size()
-        if self._fx_size != size:
-            self._fx_size = size
-            self.vignette = make_vignette(size, strength=0.75)
-            self.grain = make_grain(size, intensity=22)
-
     def handle(self, events):
         for e in events:
             if e.type == pygame.QUIT: self.mgr.running = False
@@ -124,10 +117,7 @@ class SceneCreateV2:
         return alpha, slide
 
     def draw(self, screen):
-        screen.fill((12,14,18)); self._ensure_fx(screen)
-        tint(screen, color=(20,28,42), alpha=42)
-        if self.vignette: screen.blit(self.vignette,(0,0))
-        if self.grain: screen.blit(self.grain,(0,0))
+        self.backdrop.draw(screen)
         w, h = screen.get_size()
         title = self.h1.render(self._step_title(), True, PALETTE['text_hi'])
         screen.blit(title, title.get_rect(center=(w//2, int(h*0.14))))
@@ -1,6 +1,8 @@
 # gameplay/combat.py — shared combat helpers (player & enemy)
+import weakref
 import pygame
 from dataclasses import dataclass
+from typing import Any, List, Tuple
 
 STRIKE_FRAME_INDEX = 1  # attack frame that emits damage (0-based)
 
@@ -50,6 +52,62 @@ def make_melee_hitbox(attacker_rect: pygame.Rect, facing: pygame.Vector2,
     return pygame.Rect(hx - w//2, hy - h//2, w, h)
 
 
+def find_melee_targets(hitbox: pygame.Rect, index, origin=(0, 0)) -> list:
+    """Sprites in a SpatialHash whose rect touches the hitbox.
+    The index gives the broadphase candidates, and colliderect does the exact test.
+    """
+    if hitbox is None:
+        return []
+    return [sp for sp in index.query_screen_rect(hitbox, origin) if sp.rect.colliderect(hitbox)]
+
+
+@dataclass
+class HitEvent:
+    attacker: Any
+    target: Any
+    dmg: int
+    killed: bool = False
+
+
+class HitResolver:
+    """Batches melee hitboxes for one frame and resolves them against a broadphase index.
+
+    emit() only queues. resolve() queries the SpatialHash once per hitbox, runs
+    colliderect on the few candidates and applies Health.take. A hitbox stays
+    active for several frames of the strike animation, so each (attacker, swing)
+    hits a given target at most once. Attackers and targets are held weakly, so
+    a freed enemy's entry goes away with it.
+    """
+    def __init__(self):
+        self._queue: List[Tuple[Any, pygame.Rect, int, int]] = []
+        # attacker -> (swing, targets already hit by that swing)
+        self._hit: 'weakref.WeakKeyDictionary[Any, Tuple[int, weakref.WeakSet]]' = weakref.WeakKeyDictionary()
+
+    def emit(self, attacker, hitbox: pygame.Rect, dmg: int, swing: int = 0):
+        if hitbox is not None:
+            self._queue.append((attacker, hitbox, int(dmg), int(swing)))
+
+    def resolve(self, index, origin=(0, 0)) -> List[HitEvent]:
+        events: List[HitEvent] = []
+        queue, self._queue = self._queue, []
+        for attacker, hitbox, dmg, swing in queue:
+            prev = self._hit.get(attacker)
+            if prev is None or prev[0] != swing:
+                prev = self._hit[attacker] = (swing, weakref.WeakSet())
+            already = prev[1]
+            for target in find_melee_targets(hitbox, index, origin):
+                health = getattr(target, 'health', None)
+                if target is attacker or health is None or not health.alive or target in already:
+                    continue
+                already.add(target)
+                dealt = health.take(dmg)
+                events.append(HitEvent(attacker, target, dealt, not health.alive))
+        return events
+
+    def forget(self, attacker):
+        self._hit.pop(attacker, None)
+
+
 def draw_hitbox_debug(screen: pygame.Surface, rect: pygame.Rect, color=(255,80,80)):
     if rect is None:
         return
@@ -1,26 +1,86 @@
 import pygame, random
 from systems.iso_math import grid_to_screen
 from core.config import TILE_W, TILE_H, PLAYER_SIZE
-from gameplay.actor_sprites import build_actor_sprites
+from gameplay.actor_sprites import build_actor_sheet, prebuild_actor_sprites
+from gameplay.combat import Health
+from systems.spatial_hash import SpatialHash
+from gameplay.ai_lod import LOD_NEAR, LOD_PERIOD, LOD_PHASES, tier_of, wander_chance
+
+try:
+    from gameplay.enemy_crowd import EnemyCrowd, STATES as _CROWD_STATES
+except ImportError:   # sem NumPy: cada EnemyIso roda update_ai sozinho
+    EnemyCrowd = None
+
+def _crowd_field(name):
+    """Atributo próprio do sprite ou, se ligado a uma EnemyCrowd, view da linha _i."""
+    own = '_' + name
+    def fget(self):
+        cr = self._crowd
+        return getattr(self, own) if cr is None else float(getattr(cr, name)[self._i])
+    def fset(self, v):
+        cr = self._crowd
+        if cr is None:
+            setattr(self, own, v)
+        else:
+            getattr(cr, name)[self._i] = v
+    return property(fget, fset)
+
+# perfil visual de todo inimigo (frames compartilhados pelo cache de animações)
+ENEMY_PROFILE = {'race': 'Humano', 'gender': 'Masculino', 'clazz': 'Sombra'}
 
 class EnemyIso(pygame.sprite.Sprite):
+    r = _crowd_field('r')
+    c = _crowd_field('c')
+    vel_r = _crowd_field('vr')
+    vel_c = _crowd_field('vc')
+
+    @property
+    def state(self):
+        cr = self._crowd
+        return self._state if cr is None else _CROWD_STATES[cr.state[self._i]]
+
+    @state.setter
+    def state(self, v):
+        cr = self._crowd
+        if cr is None:
+            self._state = v
+        else:
+            cr.state[self._i] = _CROWD_STATES.index(v)
+
     def __init__(self, r, c, color=(170,80,60)):
         super().__init__()
+        self._crowd = None
+        self._i = -1
         self.r = float(r)
         self.c = float(c)
-        profile = {'race': 'Humano', 'gender': 'Masculino', 'clazz': 'Sombra'}
-        self.anim = build_actor_sprites(profile, size=(PLAYER_SIZE, PLAYER_SIZE))
+        self.sheet = build_actor_sheet(ENEMY_PROFILE, size=(PLAYER_SIZE, PLAYER_SIZE))
         self.state = 'idle'; self.anim_t = 0.0; self.anim_idx = 0
-        self.image = self.anim['idle'][0]
+        self.image = self.sheet.frame('idle', 0)
         self.rect = self.image.get_rect()
         self.speed_tiles = 2.0
         self.vel_r = 0.0
         self.vel_c = 0.0
         self.heading = pygame.Vector2(1, 0)
+        self.health = Health(hp=12, hp_max=12)
+        self._lod_acc = 0.0; self._lod_frames = 0
+        self._lod_phase = random.randrange(LOD_PHASES)
+
+    def _bind(self, crowd, i):
+        self._crowd, self._i = crowd, i
+
+    def _unbind(self):
+        """Copia o estado da linha de volta para o sprite (antes de sair da multidão)."""
+        cr, i = self._crowd, self._i
+        vals = (float(cr.r[i]), float(cr.c[i]), float(cr.vr[i]), float(cr.vc[i]), _CROWD_STATES[cr.state[i]])
+        self.heading = pygame.Vector2(float(cr.hx[i]), float(cr.hy[i]))
+        self.anim_t, self.anim_idx = float(cr.anim_t[i]), int(cr.anim_idx[i])
+        self._crowd, self._i = None, -1
+        self.r, self.c, self.vel_r, self.vel_c, self.state = vals
 
     def update_rect(self, ox, oy):
         x, y = grid_to_screen(self.r, self.c)
         x += ox; y += oy
+        self.prev_midbottom = self.rect.midbottom
         self.rect.midbottom = (x + TILE_W//2, y + TILE_H)
 
     def _screen_vec_from_iso(self, dr, dc):
@@ -29,13 +89,14 @@ class EnemyIso(pygame.sprite.Sprite):
         if v.length_squared() > 0: v = v.normalize()
         return v
 
-    def update_ai(self, dt, target_rc):
+    def update_ai(self, dt, target_rc, frames=1, animate=True):
+        """frames>1: dt acumulado de vários frames (LOD); animate=False pula a animação."""
         tr, tc = target_rc
         dr = tr - self.r
         dc = tc - self.c
         d2 = dr*dr + dc*dc
         if d2 > 900:
-            if random.random() < 0.01:
+            if random.random() < wander_chance(0.01, frames):
                 self.vel_r = random.uniform(-0.3, 0.3)
                 self.vel_c = random.uniform(-0.3, 0.3)
             self.r += self.vel_r * dt
@@ -54,43 +115,84 @@ class EnemyIso(pygame.sprite.Sprite):
                 self.vel_c = (dc / dist) * self.speed_tiles
             self.state = 'run'
         else:
-            if random.random() < 0.02:
+            if random.random() < wander_chance(0.02, frames):
                 self.vel_r = random.uniform(-0.2, 0.2)
                 self.vel_c = random.uniform(-0.2, 0.2)
             self.state = 'walk' if (self.vel_r or self.vel_c) else 'idle'
         self.r += self.vel_r * dt
         self.c += self.vel_c * dt
-        fps = 12 if self.state == 'run' else (8 if self.state == 'walk' else 6)
+        if not animate:
+            return
+        fps = self.sheet.fps(self.state)
         self.anim_t += dt
         if self.anim_t >= 1.0 / fps:
             self.anim_t -= 1.0 / fps
-            frames = self.anim.get(self.state, self.anim['idle'])
-            self.anim_idx = (self.anim_idx + 1) % len(frames)
-            self.image = frames[self.anim_idx]
+            self.anim_idx = (self.anim_idx + 1) % self.sheet.count(self.state)
+            self.image = self.sheet.frame(self.state, self.anim_idx, self.sheet.dir_of(self.heading.x, self.heading.y))
 
 class EnemiesIso:
     def __init__(self, *, tilemap, pois: dict | None, rng_seed=2025):
         self.tilemap = tilemap
         self.pois = pois or {}
         self.group = pygame.sprite.Group()
+        self.index = SpatialHash(cell=8.0)   # (r,c) -> inimigos; atualizado em update()
+        self.crowd = EnemyCrowd(seed=rng_seed) if EnemyCrowd is not None else None
         self.rng = random.Random(rng_seed)
+        self._frame = 0                      # contador para os ticks de LOD (sem NumPy)
+        prebuild_actor_sprites([ENEMY_PROFILE], size=(PLAYER_SIZE, PLAYER_SIZE))
         self._spawn_from_pois()
 
+    def add(self, enemy: EnemyIso):
+        if self.tilemap is not None:
+            enemy.update_rect(self.tilemap.offset_x, self.tilemap.offset_y)
+        self.group.add(enemy)
+        if self.crowd is not None:
+            self.crowd.add(enemy)
+        self.index.insert(enemy, enemy.r, enemy.c)
+
+    def remove(self, enemy: EnemyIso):
+        self.group.remove(enemy)
+        if self.crowd is not None:
+            self.crowd.remove(enemy)
+        self.index.remove(enemy)
+
     def _spawn_from_pois(self):
         if 'cave_entrances' in self.pois:
             for (r,c) in self.pois['cave_entrances']:
                 for _ in range(2):
                     rr = r + self.rng.randint(-3,3)
                     cc = c + self.rng.randint(-3,3)
-                    self.group.add(EnemyIso(rr, cc, color=(170,80,60)))
+                    self.add(EnemyIso(rr, cc, color=(170,80,60)))
         if 'mountain_bbox' in self.pois:
             top,left,h,w = self.pois['mountain_bbox']
             for _ in range(4):
                 rr = top + self.rng.randint(0, max(1,h-1))
                 cc = left + self.rng.randint(0, max(1,w-1))
-                self.group.add(EnemyIso(rr, cc, color=(100,60,140)))
+                self.add(EnemyIso(rr, cc, color=(100,60,140)))
+
+    def update(self, dt, player_rc, ox, oy, view=None, periods=LOD_PERIOD) -> list:
+        """Avança a IA; devolve os inimigos que andaram (rect/camada mudaram).
 
-    def update(self, dt, player_rc, ox, oy):
+        view: (left, top, right, bottom) em px de mundo (ai_lod.view_from_camera);
+        fora dela os inimigos rodam em tick reduzido e sem animação.
+        periods: frames entre ticks por tier de LOD (padrão ai_lod.LOD_PERIOD).
+        """
+        index = self.index
+        if self.crowd is not None:
+            moved, ticked = self.crowd.step(dt, player_rc, view=view, origin=(ox, oy), periods=periods)
+            return self.crowd.sync(moved, ticked, ox, oy, index)
+        pr, pc = player_rc
+        frame = self._frame; self._frame += 1
+        out = []
         for e in self.group.sprites():
-            e.update_ai(dt, player_rc)
+            e._lod_acc += dt; e._lod_frames += 1
+            d2 = (pr - e.r) ** 2 + (pc - e.c) ** 2
+            tier = tier_of(d2, e.rect.centerx, e.rect.bottom, view)
+            if (frame + e._lod_phase) % periods[tier]:
+                continue
+            e.update_ai(e._lod_acc, player_rc, frames=e._lod_frames, animate=tier == LOD_NEAR)
+            e._lod_acc = 0.0; e._lod_frames = 0
             e.update_rect(ox, oy)
+            index.move(e, e.r, e.c)
+            out.append(e)
+        return out
@@ -0,0 +1,216 @@
+# gameplay/enemy_crowd.py — multidão de inimigos em struct-of-arrays (NumPy)
+"""
+Mesmo comportamento de EnemyIso.update_ai, calculado para todos os inimigos de
+uma vez. Estado por inimigo em arrays (uma linha por inimigo):
+    r, c, vr, vc, hx, hy (heading em tela), speed, state (0 idle/1 walk/2 run),
+    anim_t, anim_idx, nframes/fps (por estado, da AnimSheet do sprite),
+    lod_acc/lod_frames (dt e frames acumulados desde o último tick), lod_phase
+Os EnemyIso ficam ligados a uma linha (sprite._crowd / sprite._i) e viram views:
+r/c/vel_r/vel_c/state leem e escrevem os arrays. Por frame, o Python só toca os
+sprites que andaram (rect + índice espacial) ou trocaram de frame (image).
+Com uma view, só quem está na tela roda todo frame (ver gameplay.ai_lod).
+"""
+from __future__ import annotations
+from typing import List, Tuple
+import numpy as np
+
+from core.config import TILE_W, TILE_H
+from gameplay.ai_lod import LOD_NEAR, LOD_MID, LOD_FAR, LOD_PERIOD, LOD_PHASES, View
+
+STATES = ('idle', 'walk', 'run')
+IDLE, WALK, RUN = 0, 1, 2
+SEEK_D2 = 900.0          # além de 30 tiles: só vagueia
+COS_HALF_FOV = 0.5
+_PERIOD = np.array(LOD_PERIOD, dtype=np.int64)
+
+class EnemyCrowd:
+    def __init__(self, capacity: int = 64, seed: int = 2025):
+        self.n = 0
+        self.frame = 0
+        self.rng = np.random.default_rng(seed)
+        self.sprites: List = []
+        self._alloc(max(1, int(capacity)))
+
+    def _alloc(self, cap: int):
+        old_n = self.n
+        def grow(name, dtype, fill=0, shape=()):
+            a = np.full((cap,) + shape, fill, dtype=dtype)
+            prev = getattr(self, name, None)
+            if prev is not None:
+                a[:old_n] = prev[:old_n]
+            setattr(self, name, a)
+        for name in ('r', 'c', 'vr', 'vc', 'hy', 'anim_t', 'lod_acc'):
+            grow(name, np.float64)
+        grow('hx', np.float64, 1.0)
+        grow('speed', np.float64, 2.0)
+        grow('state', np.int8)
+        grow('anim_idx', np.int32)
+        grow('nframes', np.int32, 1, (3,))
+        grow('fps', np.float64, 8.0, (3,))
+        grow('lod_frames', np.int32)
+        grow('lod_phase', np.int32)
+        grow('tier', np.int8)
+        self.cap = cap
+
+    def __len__(self) -> int:
+        return self.n
+
+    # --- membros ---
+    def add(self, sp) -> int:
+        """Copia o estado do sprite para uma linha nova e liga o sprite a ela."""
+        if self.n == self.cap:
+            self._alloc(self.cap * 2)
+        i = self.n
+        self.r[i], self.c[i] = sp.r, sp.c
+        self.vr[i], self.vc[i] = sp.vel_r, sp.vel_c
+        self.hx[i], self.hy[i] = sp.heading.x, sp.heading.y
+        self.speed[i] = sp.speed_tiles
+        self.state[i] = STATES.index(sp.state) if sp.state in STATES else IDLE
+        self.anim_t[i], self.anim_idx[i] = sp.anim_t, sp.anim_idx
+        self.nframes[i] = [sp.sheet.count(s) for s in STATES]
+        self.fps[i] = [sp.sheet.fps(s) for s in STATES]
+        self.lod_acc[i], self.lod_frames[i] = 0.0, 0
+        self.lod_phase[i] = self.rng.integers(LOD_PHASES)
+        self.tier[i] = LOD_NEAR
+        self.n += 1
+        self.sprites.append(sp)
+        sp._bind(self, i)
+        return i
+
+    def remove(self, sp):
+        """Remove trocando com a última linha (O(1)); o sprite volta a ser autônomo."""
+        i = sp._i
+        if sp._crowd is not self or not 0 <= i < self.n:
+            return
+        sp._unbind()
+        last = self.n - 1
+        if i != last:
+            for name in ('r', 'c', 'vr', 'vc', 'hx', 'hy', 'speed', 'state', 'anim_t', 'anim_idx', 'nframes', 'fps',
+                         'lod_acc', 'lod_frames', 'lod_phase', 'tier'):
+                a = getattr(self, name)
+                a[i] = a[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved._i = i
+        self.sprites.pop()
+        self.n = last
+
+    # --- simulação ---
+    def _tiers(self, d2: np.ndarray, view: View | None, origin: Tuple[int, int]) -> np.ndarray:
+        """Tier de LOD de cada linha (mesma regra de ai_lod.tier_of)."""
+        n = self.n
+        if view is None:
+            on_screen = d2 <= SEEK_D2
+        else:
+            r, c = self.r[:n], self.c[:n]
+            x = (c - r) * (TILE_W // 2) + (origin[0] + TILE_W // 2)
+            y = (c + r) * (TILE_H // 2) + (origin[1] + TILE_H)
+            on_screen = (x >= view[0]) & (x <= view[2]) & (y >= view[1]) & (y <= view[3])
+        return np.where(on_screen, LOD_NEAR, np.where(d2 <= SEEK_D2, LOD_MID, LOD_FAR)).astype(np.int8)
+
+    def step(self, dt: float, target_rc: Tuple[float, float], view: View | None = None,
+             origin: Tuple[int, int] = (0, 0), periods: Tuple[int, int, int] = LOD_PERIOD) -> Tuple[np.ndarray, np.ndarray]:
+        """Avança a IA de quem tem tick neste frame; devolve (índices que andaram, índices que trocaram de frame).
+        periods: frames entre ticks por tier (core.quality baixa isso sob carga)."""
+        n = self.n
+        if n == 0:
+            e = np.zeros(0, dtype=np.intp)
+            return e, e
+        r, c, vr, vc = self.r[:n], self.c[:n], self.vr[:n], self.vc[:n]
+        hx, hy, state = self.hx[:n], self.hy[:n], self.state[:n]
+        tr, tc = target_rc
+        dr = tr - r
+        dc = tc - c
+        d2 = dr * dr + dc * dc
+
+        # LOD: acumula o dt de todos; só roda quem cai no tick do seu período
+        tier = self._tiers(d2, view, origin)
+        self.tier[:n] = tier
+        acc, frames = self.lod_acc[:n], self.lod_frames[:n]
+        acc += dt
+        frames += 1
+        period = _PERIOD if periods is LOD_PERIOD else np.asarray(periods, dtype=np.int64)
+        act = (self.frame + self.lod_phase[:n]) % period[tier] == 0
+        self.frame += 1
+        dts = np.where(act, acc, 0.0)
+
+        far = act & (d2 > SEEK_D2)
+        near = act & ~far
+        roll = self.rng.random(n)
+
+        # heading (tela) a partir da velocidade atual, só para quem está perto
+        moving = (vr != 0.0) | (vc != 0.0)
+        hvx, hvy = vc - vr, vc + vr
+        hl = np.hypot(hvx, hvy)
+        upd = near & moving & (hl > 0.0)
+        hx[upd] = hvx[upd] / hl[upd]
+        hy[upd] = hvy[upd] / hl[upd]
+
+        # teste de FOV: heading . direção ao alvo (vetor nulo = não vê)
+        tx, ty = dc - dr, dc + dr
+        tl = np.hypot(tx, ty)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dot = np.where(tl > 0.0, (hx * tx + hy * ty) / tl, 0.0)
+        seen = near & (dot >= COS_HALF_FOV)
+
+        # seek: corre direto para o alvo
+        dist = np.sqrt(d2)
+        seek = seen & (dist > 0.001)
+        vr[seek] = dr[seek] / dist[seek] * self.speed[:n][seek]
+        vc[seek] = dc[seek] / dist[seek] * self.speed[:n][seek]
+
+        # wander: longe 1%/frame (±0.3), perto sem ver 2%/frame (±0.2);
+        # quem pulou frames sorteia com a chance composta desses frames
+        w_far = far & (roll < 1.0 - 0.99 ** frames)
+        w_near = near & ~seen & (roll < 1.0 - 0.98 ** frames)
+        for mask, amp in ((w_far, 0.3), (w_near, 0.2)):
+            k = int(mask.sum())
+            if k:
+                v = self.rng.uniform(-amp, amp, size=(2, k))
+                vr[mask] = v[0]
+                vc[mask] = v[1]
+
+        moving = (vr != 0.0) | (vc != 0.0)
+        state[act] = np.where(seen, RUN, np.where(moving, WALK, IDLE))[act]
+        r += vr * dts
+        c += vc * dts
+        acc[act] = 0.0
+        frames[act] = 0
+
+        # animação: só quem está perto do player e na tela (tiers distantes não animam)
+        anim_t, anim_idx = self.anim_t[:n], self.anim_idx[:n]
+        step = 1.0 / self.fps[np.arange(n), state]
+        vis = near & (tier == LOD_NEAR)
+        anim_t[vis] += dts[vis]
+        tick = vis & (anim_t >= step)
+        if tick.any():
+            anim_t[tick] -= step[tick]
+            ti = np.flatnonzero(tick)
+            anim_idx[ti] = (anim_idx[ti] + 1) % self.nframes[ti, state[ti]]
+        return np.flatnonzero(act & moving), np.flatnonzero(tick)
+
+    def sync(self, moved: np.ndarray, ticked: np.ndarray, ox: int, oy: int, index=None) -> list:
+        """Copia posição/frame para os sprites tocados; devolve os sprites que andaram."""
+        sprites = self.sprites
+        out = []
+        if len(moved):
+            r, c = self.r[moved], self.c[moved]
+            # mesma conta de systems.iso_math.grid_to_screen (int trunca) + âncora midbottom
+            xs = (np.trunc((c - r) * (TILE_W // 2)).astype(np.int64) + (ox + TILE_W // 2)).tolist()
+            ys = (np.trunc((c + r) * (TILE_H // 2)).astype(np.int64) + (oy + TILE_H)).tolist()
+            rl, cl = r.tolist(), c.tolist()
+            for k, i in enumerate(moved.tolist()):
+                sp = sprites[i]
+                sp.prev_midbottom = sp.rect.midbottom
+                sp.rect.midbottom = (xs[k], ys[k])
+                if index is not None:
+                    index.move(sp, rl[k], cl[k])
+                out.append(sp)
+        if len(ticked):
+            st, idx = self.state[ticked].tolist(), self.anim_idx[ticked].tolist()
+            hx, hy = self.hx[ticked].tolist(), self.hy[ticked].tolist()
+            for k, i in enumerate(ticked.tolist()):
+                sp = sprites[i]
+                sheet = sp.sheet
+                sp.image = sheet.frame(STATES[st[k]], idx[k], sheet.dir_of(hx[k], hy[k]))
+        return out
@@ -3,11 +3,9 @@
 import pygame
 from core.config import PLAYER_SIZE, TILE_W, TILE_H, PLAYER_SPEED_TILES
 from systems.iso_math import grid_to_screen
-from gameplay.actor_sprites import build_actor_sprites
+from gameplay.actor_sprites import build_actor_sheet
 from gameplay.combat import Health, compute_facing_from_iso_vel, make_melee_hitbox, STRIKE_FRAME_INDEX
 
-ANIM_FPS_WALK = 8
-ANIM_FPS_RUN = 12
 ATTACK_COOL = 0.35
 
 MAP_OFFSET_X = 0
@@ -26,24 +24,26 @@ class Player(pygame.sprite.Sprite):
         self.base_speed = PLAYER_SPEED_TILES
         self.vel_r = 0.0
         self.vel_c = 0.0
-        self.anim = build_actor_sprites(profile, size=(PLAYER_SIZE, PLAYER_SIZE))
+        self.sheet = build_actor_sheet(profile, size=(PLAYER_SIZE, PLAYER_SIZE))   # fps por estado vem da folha
         self.state = "idle"
         self.anim_t = 0.0
         self.anim_idx = 0
         self.attack_t = 0.0
-        self.image = self.anim["idle"][0]
+        self.image = self.sheet.frame("idle", 0)
         self.rect = self.image.get_rect()
         self.update_rect()
         # Combat
         self.health = Health(hp=24, hp_max=24)
         self.damage = 6
         self.last_hitbox: pygame.Rect | None = None
+        self.swing_id = 0   # incrementa a cada ataque (um acerto por alvo por golpe)
         self.facing = pygame.Vector2(1, 0)
 
     def update_rect(self):
         sx, sy = grid_to_screen(self.r, self.c)
         sx += MAP_OFFSET_X
         sy += MAP_OFFSET_Y
+        self.prev_midbottom = self.rect.midbottom   # para interpolar o desenho (passo fixo)
         self.rect.midbottom = (sx + TILE_W // 2, sy + TILE_H)
 
     def _set_state(self, st: str):
@@ -96,6 +96,7 @@ class Player(pygame.sprite.Sprite):
         # Attack
         if keys[pygame.K_j] and self.attack_t <= 0.0:
             self.attack_t = ATTACK_COOL
+            self.swing_id += 1
             self._set_state("attack")
 
     def take_damage(self, dmg: int):
@@ -123,20 +124,25 @@ class Player(pygame.sprite.Sprite):
         # Animação & emissão de hitbox no ataque
         if self.state == "attack":
             self.attack_t -= dt
-            fps = 12
+            fps = self.sheet.fps("attack")
+            last = self.sheet.count("attack") - 1
             self.anim_t += dt
             if self.anim_t >= 1.0 / fps:
                 self.anim_t -= 1.0 / fps
-                self.anim_idx = min(self.anim_idx + 1, len(self.anim["attack"]) - 1)
+                self.anim_idx = min(self.anim_idx + 1, last)
+            self.image = self.sheet.frame("attack", self.anim_idx, self._dir())
             if self.anim_idx == STRIKE_FRAME_INDEX:
                 self.last_hitbox = make_melee_hitbox(self.rect, self.facing, reach_px=70, width_px=56)
-            if self.attack_t <= 0.0 and self.anim_idx >= len(self.anim["attack"]) - 1:
+            if self.attack_t <= 0.0 and self.anim_idx >= last:
                 self._set_state("walk" if (self.vel_r or self.vel_c) else "idle")
         else:
-            fps = ANIM_FPS_RUN if self.state == "run" else (ANIM_FPS_WALK if self.state == "walk" else 6)
-            frames = self.anim[self.state]
+            fps = self.sheet.fps(self.state)
             self.anim_t += dt
             if self.anim_t >= 1.0 / fps:
                 self.anim_t -= 1.0 / fps
-                self.anim_idx = (self.anim_idx + 1) % len(frames)
-            self.image = self.anim[self.state][self.anim_idx]
+                self.anim_idx = (self.anim_idx + 1) % self.sheet.count(self.state)
+            self.image = self.sheet.frame(self.state, self.anim_idx, self._dir())
+
+    def _dir(self) -> int:
+        """Direção da folha pelo facing (frames já desenhados por direção)."""
+        return self.sheet.dir_of(self.facing.x, self.facing.y)
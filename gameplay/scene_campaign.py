@@ -1,10 +1,11 @@
 # gameplay/scene_campaign.py
 import pygame
-from core.ui_fx import make_vignette, make_grain, tint
+from core.ui_fx import Backdrop
 from core.settings import load_settings
 from core.strings import t
 from ui.theme import COLORS, SPACING, get_font
 from ui.widgets import RightMenuList
+from ui.dirty import DirtyLayer
 
 class SceneCampaign:
     def __init__(self, mgr):
@@ -12,10 +13,9 @@ class SceneCampaign:
         st = load_settings()
         self.lang = st.get('language','en-US')
         self.font = get_font(38)
-        self._fx_size = None
-        self.vignette = None
-        self.grain = None
+        self.backdrop = Backdrop(fill=COLORS['bg'], tint_alpha=42, grain=22)
         self.menu = RightMenuList(self.font)
+        self.dirty = DirtyLayer()
         self.sel = 0
 
     def handle(self, events):
@@ -59,21 +59,18 @@ class SceneCampaign:
         profile = data.get('profile', {})
         self.mgr.switch_to(SceneGame(self.mgr, profile=profile, loaded_state=data))
 
-    def _ensure_fx(self, screen):
-        size = screen.get_size()
-        if self._fx_size != size:
-            self._fx_size = size
-            self.vignette = make_vignette(size, strength=0.75)
-            self.grain = make_grain(size, intensity=22)
+    def enter(self):
+        self.dirty.invalidate()   # outra cena desenhou na tela enquanto esta estava fora
 
     def on_resize(self, size):
-        self._fx_size = None
+        self.dirty.invalidate()
 
     def draw(self, screen):
-        screen.fill(COLORS['bg'])
-        self._ensure_fx(screen)
-        tint(screen, color=(20, 28, 42), alpha=42)
-        if self.vignette: screen.blit(self.vignette, (0,0))
-        if self.grain: screen.blit(self.grain, (0,0))
+        if not self.dirty.needs_full(screen, (self.sel, self.lang)):
+            return self.dirty.redraw(screen, self.menu.draw_arrow)
+        self.backdrop.draw(screen)
         options = t('campaign.options', self.lang)
-        self.menu.draw(screen, options, self.sel, x_frac=0.82, y_frac=0.32, gap=SPACING['menu_gap']-2)
+        self.menu.draw(screen, options, self.sel, x_frac=0.82, y_frac=0.32, gap=SPACING['menu_gap']-2, arrow=False)
+        self.dirty.commit_base(screen)
+        self.dirty.track(self.menu.draw_arrow(screen))
+        return None
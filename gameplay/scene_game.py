@@ -4,22 +4,28 @@ import pygame
 from typing import Optional
 from core.config import SCREEN_SIZE, TILE_W, TILE_H
 from core.camera_v2 import CameraV2
-from core.map_iso2 import IsoTileSet2 as IsoTileSet, IsoMap2 as IsoMap
+from core.map_iso2 import IsoTileSet2 as IsoTileSet
+from core.iso_chunked import IsoChunkedMap, ChunkSpec
 from core.iso_math2 import grid_to_screen, screen_to_grid
 from gameplay.player_iso import Player, set_map_offset
 from gameplay.enemies_iso import EnemiesIso
-from gameplay.combat import draw_hitbox_debug
+from gameplay.combat import draw_hitbox_debug, HitResolver
 from core.asset import missing_assets
 from core.strings import t
 from core.ui_fx import tint
 from core.props import PropsManager
 from systems.prop_factory import build_prop as _build_prop
 from core import props as _core_props
-from systems.mapgen_caelari import generate as generate_layers
+from systems.mapgen_iso import generate_layers
 from core.settings import load_settings
 from systems.depth_group import DepthGroup
 from systems.overlap_zone import OverlapZone
+from systems.spatial_hash import screen_radius_to_grid
+from gameplay.ai_lod import view_from_camera
+from core.quality import GOVERNOR
 from core.fx_pipeline import PostFX
+from core.zoom_view import ZoomView, is_quantized, quantize_zoom
+from core.fixed_step import FixedStep, lerp_point
 
 _core_props.load_prop_image = _build_prop
 
@@ -32,16 +38,26 @@ class SceneGame:
         # FX leves — desabilitados por padrão
         self.fx_enabled_bloom = False
         self.fx_enabled_dof = False
-        self.postfx = PostFX(st.get('fx_quality','half'))
+        self.fx_quality = st.get('fx_quality','half')   # teto escolhido pelo jogador
+        self.postfx = PostFX(self.fx_quality)
+        # Zoom nativo: chunks/sprites em variantes escaladas, sem smoothscale da tela
+        self.native_zoom = bool(st.get('native_zoom', True))
+        # Simulação em passo fixo (main loop chama update(sim.step) N vezes); o draw
+        # interpola câmera e atores entre os dois últimos passos com sim.alpha
+        sim_hz = float(st.get('sim_hz', 60) or 0)
+        self.sim = FixedStep(sim_hz) if sim_hz > 0 else None
+        self._lerp = []          # (sprite, midbottom antes do último passo)
+        self._prev_cam = None
         # MAPA 128x128
-        result = generate_layers(rows=128, cols=128, seed=2025)
-        if len(result) == 4:
-            layers, pois, start_rc, props_rc = result
+        result = generate_layers(rows=128, cols=128, seed=2025, compact=True)
+        if len(result) >= 4:
+            layers, pois, start_rc, props_rc = result[:4]
         else:
             layers, pois, start_rc = result
             props_rc = []
         self.tileset = IsoTileSet()
-        self.tilemap = IsoMap(layers, self.tileset)
+        # Chão em chunks pré-renderizados (custo por frame ~ tamanho da tela)
+        self.tilemap = IsoChunkedMap(layers, self.tileset, spec=ChunkSpec(rows=24, cols=24, cache_mb=192.0))
         set_map_offset(self.tilemap.offset_x, self.tilemap.offset_y)
         world_w, world_h = self.tilemap.world_bounds()
         # Camera ISO estável com framing tipo OT2
@@ -56,6 +72,7 @@ class SceneGame:
         self.enemies = EnemiesIso(tilemap=self.tilemap, pois=pois)
         for e in self.enemies.group.sprites():
             self.entities.add(e)
+        self.hits = HitResolver()
         self.props_mgr = PropsManager()
         for p in props_rc:
             r, c = int(p.get('r',0)), int(p.get('c',0))
@@ -63,6 +80,12 @@ class SceneGame:
             x += self.tilemap.offset_x
             y += self.tilemap.offset_y
             self.props_mgr.add_prop(p.get('key','unknown'), x, y-6, bool(p.get('collidable', True)))
+        # props entram na mesma passada de profundidade dos atores (árvore cobre o player);
+        # com bake_props, os baixos vão para os chunks e os altos viram faixas assadas
+        props = self.props_mgr.all.sprites()
+        if self.tilemap.spec.bake_props:
+            props = self.tilemap.bake_props(props)
+        self.entities.add_static(*props)
         self.overlaps: list[OverlapZone] = []
         self.paused = False
         self.pause_tabs = list(t('pause.tabs', self.lang))
@@ -78,6 +101,17 @@ class SceneGame:
         self._rt_size = None
         self._rt = None
         self._bg_color = (10, 12, 18)
+        # Nível do governador de qualidade aplicado (FX, escala da RT, orçamentos, LOD da IA)
+        self._quality = None
+        self._apply_quality()
+
+    def _apply_quality(self):
+        q = GOVERNOR.tier
+        if q is self._quality:
+            return
+        self._quality = q
+        self.postfx.set_quality('quarter' if self.fx_quality == 'quarter' else q.fx_quality)
+        self.tilemap.baker.budget_ms = q.bake_budget_ms
 
     # --- helpers ---
     def _ensure_rt(self):
@@ -133,17 +167,23 @@ class SceneGame:
     # --- update ---
     def update(self, dt: float):
         self._last_dt = dt
+        self._apply_quality()
+        self._lerp = []
+        self._prev_cam = None
         if self.paused:
             return
+        prev_cam = (self.camera.x, self.camera.y)
         # 1) Input com cardinais puros + compensação do flip
         self.player.handle_input(dt, cardinais_puros=True, screen_dir=getattr(self, 'orient', 1))
         # 2) Atualiza player (sem retratar input)
         self.player.update(dt, input_already_handled=True)
+        self.entities.mark_dirty(self.player)
 
-        # 3) foco automático no inimigo mais próximo (se houver)
+        # 3) foco automático no inimigo mais próximo (se houver); só candidatos do índice espacial
         near = None; d2_best = 1e12
         px, py = self.player.rect.center
-        for e in self.enemies.group.sprites():
+        radius = screen_radius_to_grid(600) + 2.0   # +2 tiles: folga entre âncora e centro do rect
+        for e in self.enemies.index.query_radius(self.player.r, self.player.c, radius):
             ex, ey = e.rect.center
             dx, dy = (ex - px), (ey - py)
             d2 = dx*dx + dy*dy
@@ -171,13 +211,27 @@ class SceneGame:
 
         # 7) atualiza inimigos e sistemas dependentes
         ox, oy = self.tilemap.offset_x, self.tilemap.offset_y
-        self.enemies.update(dt, player_rc=(self.player.r, self.player.c), ox=ox, oy=oy)
-        for e in self.enemies.group.sprites():
+        q = self._quality
+        view = view_from_camera(self.camera, self.w, self.h, margin=q.ai_view_margin)   # fora dela: IA em tick reduzido
+        moved = self.enemies.update(dt, player_rc=(self.player.r, self.player.c), ox=ox, oy=oy, view=view,
+                                    periods=q.ai_periods)
+        for e in moved:
             self.entities.mark_dirty(e)
+        if self.sim is not None:
+            self._prev_cam = prev_cam
+            self._lerp = [(e, e.prev_midbottom) for e in moved]
+            self._lerp.append((self.player, self.player.prev_midbottom))
+
+        # 7b) combate: todos os hitboxes do frame resolvidos em lote contra o índice
+        if self.player.last_hitbox is not None:
+            self.hits.emit(self.player, self.player.last_hitbox, self.player.damage, self.player.swing_id)
+        for ev in self.hits.resolve(self.enemies.index, origin=(ox, oy)):
+            if ev.killed:
+                self.enemies.remove(ev.target)
+                self.entities.remove(ev.target)
         for z in self.overlaps:
             z.apply(self.player, self.entities)
-            for e in self.enemies.group.sprites():
-                z.apply(e, self.entities)
+            z.apply_index(self.enemies.index, self.entities, origin=(ox, oy))
 
         # 8) zoom dinâmico (abre em combate, fecha em exploração)
         base = 1.12
@@ -186,12 +240,53 @@ class SceneGame:
         else:
             z_target = base
         z = self.camera.zoom + (z_target - self.camera.zoom) * 0.08
+        if abs(z - z_target) < 0.002:
+            z = quantize_zoom(z_target)   # assenta num nível quantizado -> desenho nativo
         self.camera.set_profile(zoom=z)
 
     # --- draw ---
+    def _draw_native(self, screen: pygame.Surface) -> bool:
+        """Mundo direto na tela (zoom quantizado, flip nas variantes); False = usar a RT.
+        O baker avança aqui; o caminho da RT no mesmo frame não o avança de novo."""
+        view = ZoomView(self.camera, self.w, self.h, flip=getattr(self, 'orient', 1) == -1)
+        if not self.tilemap.draw_native(screen, view, budget_ms=self._quality.native_budget_ms):
+            return False
+        self.entities.draw_sorted(screen, view, clip_rect=view.world_rect().inflate(320, 240))
+        if self.player.last_hitbox is not None:
+            draw_hitbox_debug(screen, view.screen_rect(self.player.last_hitbox))
+        return True
+
     def draw(self, screen: pygame.Surface):
-        # 0) limpa tela principal e RT
+        """Com passo fixo, desenha o estado interpolado (alpha) e devolve o simulado."""
+        if self.sim is None or self._prev_cam is None:
+            return self._draw_frame(screen)
+        a = self.sim.alpha
+        cam = self.camera
+        cur_cam = (cam.x, cam.y)
+        px, py = self._prev_cam
+        cam.x, cam.y = px + (cur_cam[0] - px) * a, py + (cur_cam[1] - py) * a
+        saved = []
+        for sp, prev in self._lerp:
+            cur = sp.rect.midbottom
+            saved.append((sp, cur))
+            sp.rect.midbottom = lerp_point(prev, cur, a)
+            self.entities.mark_dirty(sp)
+        try:
+            return self._draw_frame(screen)
+        finally:
+            cam.x, cam.y = cur_cam
+            for sp, cur in saved:
+                sp.rect.midbottom = cur
+                self.entities.mark_dirty(sp)
+
+    def _draw_frame(self, screen: pygame.Surface):
+        # 0) limpa tela principal; zoom assentado desenha nativo, transição usa a RT
         screen.fill(self._bg_color)
+        pumped = False   # o baker avança uma vez por frame
+        if self.native_zoom and is_quantized(self.camera.zoom):
+            if self._draw_native(screen):
+                return
+            pumped = True
         self._ensure_rt()
         rt = self._rt
         rt.fill(self._bg_color)
@@ -201,19 +296,36 @@ class SceneGame:
         cam_draw = CameraV2(rt.get_width(), rt.get_height(), world_w, world_h, zoom=1.0)
         cam_draw.x = self.camera.x
         cam_draw.y = self.camera.y
-        self.tilemap.draw_visible(rt, cam_draw)
-        self.props_mgr.draw(rt, cam_draw, sort_by_y=True)
+        cam_draw.vel_px = self.camera.vel_px            # previsão de bake dos chunks
+        cam_draw.lookahead_t = self.camera.lookahead_t
         cam_rect = pygame.Rect(int(self.camera.x), int(self.camera.y), rt.get_width(), rt.get_height()).inflate(320, 240)
-        self.entities.draw_sorted(rt, cam_draw, clip_rect=cam_rect)
-        draw_hitbox_debug(rt, self.player.last_hitbox)
+        # espelhado: chunks/frames já espelhados (variantes em cache) em vez de flip da tela inteira
+        flip = getattr(self, 'orient', 1) == -1
+        mirrored = False
+        if flip:
+            mirror_view = ZoomView(cam_draw, rt.get_width(), rt.get_height(), flip=True, zoom=1.0)
+            mirrored = self.tilemap.draw_native(rt, mirror_view, budget_ms=self._quality.native_budget_ms,
+                                                pump=not pumped)
+            pumped = True
+            if mirrored:
+                self.entities.draw_sorted(rt, mirror_view, clip_rect=cam_rect)
+                if self.player.last_hitbox is not None:
+                    draw_hitbox_debug(rt, mirror_view.screen_rect(self.player.last_hitbox))
+                flip = False
+            else:
+                rt.fill(self._bg_color)   # estourou o orçamento de bake: caminho antigo
+        if not mirrored:
+            self.tilemap.draw(rt, cam_draw, pump=not pumped)
+            self.entities.draw_sorted(rt, cam_draw, clip_rect=cam_rect)
+            draw_hitbox_debug(rt, self.player.last_hitbox)
 
-        # 2) upscale para tela (visual zoom) e possível flip
+        # 2) upscale para tela (visual zoom) e, se a RT não saiu espelhada, flip
+        final = rt
         if (rt.get_width(), rt.get_height()) != (self.w, self.h):
-            scaled = pygame.transform.smoothscale(rt, (self.w, self.h))
-            final = pygame.transform.flip(scaled, True, False) if getattr(self, 'orient', 1) == -1 else scaled
-            screen.blit(final, (0, 0))
-        else:
-            final = pygame.transform.flip(rt, True, False) if getattr(self, 'orient', 1) == -1 else rt
-            screen.blit(final, (0, 0))
+            scale = pygame.transform.smoothscale if self._quality.smooth_scale else pygame.transform.scale
+            final = scale(rt, (self.w, self.h))
+        if flip:
+            final = pygame.transform.flip(final, True, False)
+        screen.blit(final, (0, 0))
         # 3) overlays leves (opcionais)
         # (Bloom/DOF desabilitados por padrão para evitar qualquer rastro)
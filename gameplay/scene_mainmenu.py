@@ -1,10 +1,11 @@
 import pygame
 from core.asset import load_image_strict
-from core.ui_fx import blit_fit, blit_cover, make_vignette, make_grain, tint
+from core.ui_fx import Backdrop
 from core.settings import load_settings
 from core.strings import t
 from ui.theme import COLORS, SPACING, get_font
 from ui.widgets import RightMenuList
+from ui.dirty import DirtyLayer
 from systems.save_load import has_save_any, list_saves, load_game
 
 class SceneMainMenu:
@@ -14,13 +15,12 @@ class SceneMainMenu:
         self.lang = st.get('language','en-US')
         self.bg = load_image_strict('ui/main_menu.png') or load_image_strict('ui/dragons_bg.png')
         self.font = get_font(40)
-        self._fx_size = None
-        self.vignette = None
-        self.grain = None
+        self.backdrop = Backdrop(self.bg, fill=COLORS['bg'], tint_alpha=38, grain=24)
         self.options = self._build_options()
         self.sel = 0
         self._t = 0.0
         self.menu = RightMenuList(self.font)
+        self.dirty = DirtyLayer()
 
     def _build_options(self):
         opts = list(t('main.options', self.lang))
@@ -60,13 +60,6 @@ class SceneMainMenu:
         else:
             self.mgr.running = False
 
-    def _ensure_fx(self, screen):
-        size = screen.get_size()
-        if self._fx_size != size:
-            self._fx_size = size
-            self.vignette = make_vignette(size, strength=0.75)
-            self.grain = make_grain(size, intensity=24)
-
     def update(self, dt):
         self._t += dt
         self.menu.update(dt)
@@ -75,18 +68,20 @@ class SceneMainMenu:
             self.lang = new_lang
             self.options = self._build_options()
 
+    def enter(self):
+        self.dirty.invalidate()   # outra cena desenhou na tela enquanto esta estava fora
+
     def on_resize(self, size):
-        self._fx_size = None
+        self.dirty.invalidate()
 
     def draw(self, screen):
+        """Frame cheio só quando algo mudou; senão só a seta (rects para display.update)."""
         st = load_settings()
         mode = st.get('scale_mode','fit')
-        if self.bg:
-            (blit_cover if mode == 'cover' else blit_fit)(screen, self.bg)
-        else:
-            screen.fill(COLORS['bg'])
-        self._ensure_fx(screen)
-        tint(screen, color=(20,28,42), alpha=38)
-        if self.vignette: screen.blit(self.vignette, (0,0))
-        if self.grain: screen.blit(self.grain, (0,0))
-        self.menu.draw(screen, self.options, self.sel, x_frac=0.82, y_frac=0.35, gap=SPACING['menu_gap'])
+        if not self.dirty.needs_full(screen, (tuple(self.options), self.sel, mode)):
+            return self.dirty.redraw(screen, self.menu.draw_arrow)
+        self.backdrop.draw(screen, mode)   # fundo + véu + vinheta + grão, composto por (tamanho, modo)
+        self.menu.draw(screen, self.options, self.sel, x_frac=0.82, y_frac=0.35, gap=SPACING['menu_gap'], arrow=False)
+        self.dirty.commit_base(screen)
+        self.dirty.track(self.menu.draw_arrow(screen))
+        return None
@@ -6,6 +6,7 @@ from core.config import SAVES_DIR
 from core.strings import t
 from core.settings import load_settings
 from systems.save_load import list_saves, load_game, save_game, SLOTS
+from ui.dirty import DirtyLayer
 
 try:
     from ui.theme import get_font
@@ -26,6 +27,7 @@ class SceneSaveSlots:
         self.small = get_font(18)
         self.sel = 0
         self._meta = self._load_slots_meta()
+        self.dirty = DirtyLayer()
 
     def _load_slots_meta(self):
         meta = []
@@ -80,7 +82,16 @@ class SceneSaveSlots:
     def update(self, dt):
         pass
 
+    def enter(self):
+        self.dirty.invalidate()   # outra cena desenhou na tela enquanto esta estava fora
+
+    def on_resize(self, size):
+        self.dirty.invalidate()
+
     def draw(self, screen):
+        # nada anima: redesenha (frame cheio) só quando seleção/slots mudam
+        if not self.dirty.needs_full(screen, (self.sel, tuple(m['name'] for m in self._meta))):
+            return []
         w, h = screen.get_size()
         screen.fill((12,14,18))
         title_key = 'saves.title.save' if self.mode=='save' else ('saves.title.delete' if self.mode=='delete' else 'saves.title.load')
@@ -104,3 +115,4 @@ class SceneSaveSlots:
             screen.blit(self.small.render(label, True, (210,210,210)), (rect.x+12, rect.y+10))
             name = self._meta[i]['name']
             screen.blit(self.font.render(name, True, (240,220,160) if sel else (200,200,210)), (rect.x+12, rect.y+44))
+        return None
@@ -8,6 +8,7 @@ from core.settings import load_settings, save_settings
 from core.state_manager import StateManager
 from gameplay.scene_start import SceneStart
 from systems.audio import ensure_audio
+from core.quality import GOVERNOR
 
 def main():
     pygame.init()
@@ -16,6 +17,8 @@ def main():
     screen = pygame.display.set_mode(size, pygame.RESIZABLE)
     clock = pygame.time.Clock()
     fps_cap = int(st.get('fps', 60))
+    GOVERNOR.enabled = bool(st.get('quality_auto', True))
+    GOVERNOR.set_budget_fps(fps_cap)
 
     # Inicializa gerenciador de estado
     mgr = StateManager()
@@ -23,20 +26,37 @@ def main():
 
     while mgr.running:
         dt = clock.tick(fps_cap) / 1000.0
+        GOVERNOR.sample(clock.get_rawtime())   # trabalho do frame anterior, sem a espera do teto
         events = pygame.event.get()
         for e in events:
             if e.type == pygame.QUIT:
                 mgr.running = False
 
+        # janela exposta/redimensionada: a tela inteira precisa ser reapresentada
+        expose = any(e.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED) for e in events)
+
+        rects = None
         if mgr.current_scene:
             if hasattr(mgr.current_scene, 'handle'):
                 mgr.current_scene.handle(events)
-            if hasattr(mgr.current_scene, 'update'):
-                mgr.current_scene.update(dt)
+            scene = mgr.current_scene
+            sim = getattr(scene, 'sim', None)   # core.fixed_step.FixedStep: passos fixos + alpha p/ o draw
+            if sim is not None:
+                for _ in range(sim.advance(dt)):
+                    scene.update(sim.step)
+                    if mgr.current_scene is not scene:
+                        break
+            elif hasattr(scene, 'update'):
+                scene.update(dt)
             if hasattr(mgr.current_scene, 'draw'):
-                mgr.current_scene.draw(screen)
+                rects = mgr.current_scene.draw(screen)
 
-        pygame.display.flip()
+        # cenas com dirty rects devolvem a lista de áreas mudadas ([] = nada);
+        # None (padrão) = frame cheio
+        if rects is None or expose:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
 
 if __name__ == "__main__":
     main()
@@ -1,21 +1,53 @@
 import pygame
+from systems.spatial_hash import StaticRectHash
 
-class DepthGroup(pygame.sprite.LayeredUpdates):
-    """Layered group where each sprite layer = rect.bottom + depth_offset + layer_bias.
-    Use change_layer only on sprites whose Y changed or entered/exited overlap zones.
+class DepthGroup(pygame.sprite.Group):
+    """Group drawn in depth order, key = rect.bottom + depth_offset + layer_bias.
+    The visible sprites keep their order between frames; each draw culls against
+    clip_rect first and fixes the order with an insertion pass, so the cost tracks
+    the visible sprites and how many of them moved. Members live in a rect index
+    (refreshed for dirty sprites), so culling does not scan the whole group.
+    Call mark_dirty on every sprite that moved or entered/exited overlap zones.
+    Static items (props) go in through add_static: their key is computed once and
+    they live in a rect index, so only the ones inside clip_rect join the pass.
     """
     def __init__(self):
         super().__init__()
         self._dirty = set()
+        self._order = []   # visíveis no último draw, em ordem de profundidade
+        self.static = StaticRectHash()
+        self._index = StaticRectHash()   # membros (móveis) por rect; reindexados em sync_layers
 
     def add(self, *sprites, layer=None):
+        super().add(*sprites)
+        if layer is not None:
+            for sp in sprites:
+                sp._layer = layer
+
+    def add_static(self, *sprites):
+        """Registra itens que nunca se mexem (fora do Group; chave fixa)."""
+        for sp in sprites:
+            sp._layer = sp.rect.bottom + getattr(sp, 'depth_offset', 0) + getattr(sp, 'layer_bias', 0)
+            self.static.insert(sp, sp.rect)
+
+    def remove_static(self, *sprites):
         for sp in sprites:
-            if not hasattr(sp, 'layer_bias'):
-                sp.layer_bias = 0
-            if not hasattr(sp, 'depth_offset'):
-                sp.depth_offset = 0
-            sp._layer = (sp.rect.bottom + sp.depth_offset + sp.layer_bias) if layer is None else layer
-            super().add(sp, layer=sp._layer)
+            self.static.remove(sp)
+
+    def add_internal(self, sprite, layer=None):
+        # também cobre sprite.add(group) / Group(sprites), que não passam por add()
+        if not hasattr(sprite, 'layer_bias'):
+            sprite.layer_bias = 0
+        if not hasattr(sprite, 'depth_offset'):
+            sprite.depth_offset = 0
+        sprite._layer = sprite.rect.bottom + sprite.depth_offset + sprite.layer_bias
+        super().add_internal(sprite, layer)
+        self._index.insert(sprite, sprite.rect)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._index.remove(sprite)
+        self._dirty.discard(sprite)   # _order é filtrado no próximo draw
 
     def mark_dirty(self, sp):
         self._dirty.add(sp)
@@ -23,16 +55,57 @@ class DepthGroup(pygame.sprite.LayeredUpdates):
     def sync_layers(self):
         if not self._dirty:
             return
-        for sp in list(self._dirty):
-            new_layer = sp.rect.bottom + sp.depth_offset + sp.layer_bias
-            if self.get_layer_of_sprite(sp) != new_layer:
-                self.change_layer(sp, new_layer)
-            self._dirty.discard(sp)
+        members = self.spritedict
+        index = self._index
+        for sp in self._dirty:
+            if sp in members:          # removido depois de marcado (ex.: morreu no frame) fica de fora
+                sp._layer = sp.rect.bottom + sp.depth_offset + sp.layer_bias
+                index.move(sp, sp.rect)
+        self._dirty.clear()
+
+    def _visible_in_order(self, clip_rect):
+        members = self.spritedict
+        if clip_rect is None:
+            vis = set(members)
+            vis.update(self.static)
+        else:
+            vis = self._index.query(clip_rect)
+            vis |= self.static.query(clip_rect)
+        order = [sp for sp in self._order if sp in vis]
+        if len(order) != len(vis):
+            kept = set(order)
+            fresh = [sp for sp in vis if sp not in kept]
+            if len(fresh) * 4 > len(order):
+                # muitos entrando (1º frame, teleporte): sort adaptativo sai mais barato
+                order.extend(fresh)
+                order.sort(key=lambda sp: sp._layer)
+                self._order = order
+                return order
+            order.extend(fresh)
+        # passo de inserção: ~linear quando poucos sprites trocaram de posição
+        for i in range(1, len(order)):
+            sp = order[i]
+            k = sp._layer
+            j = i - 1
+            if order[j]._layer <= k:
+                continue
+            while j >= 0 and order[j]._layer > k:
+                order[j + 1] = order[j]
+                j -= 1
+            order[j + 1] = sp
+        self._order = order
+        return order
 
     def draw_sorted(self, screen, camera, clip_rect=None):
         self.sync_layers()
-        for layer in sorted(self.layers()):
-            for sp in self.get_sprites_from_layer(layer):
-                if clip_rect and not sp.rect.colliderect(clip_rect):
-                    continue
-                screen.blit(sp.image, camera.world_to_screen(sp.rect.topleft) if hasattr(camera,'world_to_screen') else camera.aplicar(sp))
+        blit = screen.blit
+        place = getattr(camera, 'place', None)
+        if place is not None:
+            # core.zoom_view.ZoomView: variante escalada/espelhada de cada imagem
+            image = camera.image
+            for sp in self._visible_in_order(clip_rect):
+                blit(image(sp.image), place(sp.rect))
+            return
+        to_screen = getattr(camera, 'world_to_screen', None)
+        for sp in self._visible_in_order(clip_rect):
+            blit(sp.image, to_screen(sp.rect.topleft) if to_screen else camera.aplicar(sp))
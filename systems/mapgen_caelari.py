@@ -103,3 +103,21 @@ def generate(side='W', rows=256, cols=256, seed=22051):
         {'name':'overlay_debug','grid':overlay_debug},
     ]
     return layers
+
+def generate_fast(side='W', rows=256, cols=256, seed=22051):
+    """Mesmo resultado de generate(); usa o backend NumPy (mapgen_caelari_np) se disponível."""
+    try:
+        from systems.mapgen_caelari_np import generate as _generate_np
+    except ImportError:
+        return generate(side=side, rows=rows, cols=cols, seed=seed)
+    return _generate_np(side=side, rows=rows, cols=cols, seed=seed)
+
+def generate_compact(side='W', rows=256, cols=256, seed=22051):
+    """Mesmas camadas, com 'grid' = core.tile_grid.TileGrid (ids uint8; grid[r][c] ainda dá o token)."""
+    try:
+        from systems.mapgen_caelari_np import generate_compact as _generate_np
+    except ImportError:
+        from core.tile_grid import TileGrid
+        return [{'name': L['name'], 'grid': TileGrid.from_tokens(L['grid'])}
+                for L in generate(side=side, rows=rows, cols=cols, seed=seed)]
+    return _generate_np(side=side, rows=rows, cols=cols, seed=seed)
@@ -0,0 +1,125 @@
+# systems/mapgen_caelari_np.py — backend NumPy do gerador Caelari (mesmo resultado, máscaras vetorizadas)
+"""
+Reproduz systems.mapgen_caelari.generate() célula a célula para a mesma seed,
+trocando os laços por célula por máscaras NumPy:
+- C de água: elipses avaliadas por broadcasting (mesma aritmética float64).
+- Anel de areia / espuma: dilatação 3x3 da máscara de água (OR de 9 fatias).
+- Sorteios (areia leste, trilha, neve) consomem o random.Random na MESMA ordem
+  e quantidade do gerador original, então a sequência da seed é preservada.
+"""
+from __future__ import annotations
+import random
+import numpy as np
+from core.tile_grid import PALETTE, TileGrid
+
+# ids da paleta global (core.tile_grid); 0 = vazio
+GRASS, SAND, WATER, PATH, SHORE, SNOW = (PALETTE.id_of(t) for t in ('grass', 'sand', 'water', 'path', 'shore', 'snow'))
+DBG_CITY, DBG_VILLAGE, DBG_CAVE, DBG_DUNGEON = (PALETTE.id_of(t) for t in ('dbg_city', 'dbg_village', 'dbg_cave', 'dbg_dungeon'))
+
+def _ellipse(cc, rr, cx, cy, rx, ry):
+    # igual ao elp() original: x=c comparado com cy, y=r comparado com cx
+    return ((cc - cy) ** 2) / max(1, rx * rx) + ((rr - cx) ** 2) / max(1, ry * ry) <= 1.0
+
+def _near(mask: np.ndarray) -> np.ndarray:
+    """True onde alguma célula da vizinhança 3x3 (dentro do mapa) é True."""
+    rows, cols = mask.shape
+    pad = np.zeros((rows + 2, cols + 2), dtype=bool)
+    pad[1:-1, 1:-1] = mask
+    out = np.zeros_like(mask)
+    for dr in range(3):
+        for dc in range(3):
+            out |= pad[dr:dr + rows, dc:dc + cols]
+    return out
+
+def _draws(rng: random.Random, n: int) -> np.ndarray:
+    return np.fromiter((rng.random() for _ in range(n)), dtype=np.float64, count=n)
+
+def generate_grids(side='W', rows=256, cols=256, seed=22051):
+    """Mesmas camadas de generate(), como grades uint8 de ids da PALETTE."""
+    rng = random.Random(seed)
+    ground = np.full((rows, cols), GRASS, dtype=np.uint8)
+    rr, cc = np.ogrid[0:rows, 0:cols]
+
+    # WEST: costa em C nas ~32 colunas
+    if side.upper().startswith('W'):
+        cx, cy = rows//2, 20
+        E1 = _ellipse(cc, rr, cx, cy, int(cols*0.16), int(rows*0.42))
+        E2 = _ellipse(cc, rr, cx-8, cy+8, int(cols*0.18), int(rows*0.36))
+        H  = _ellipse(cc, rr, cx, cy+10, int(cols*0.10), int(rows*0.22))
+        ground[(E1 | E2) & ~H & (cc < 32)] = WATER
+        # ring de areia (só escreve areia; o teste olha água, então a ordem não importa)
+        ring = (ground == GRASS) & _near(ground == WATER) & (cc < 34)
+        ground[ring] = SAND
+    else:
+        # EAST: um sorteio por célula das colunas 2..9, em ordem de linha
+        c0, c1 = 2, min(10, cols)
+        if c1 > c0:
+            hit = _draws(rng, rows * (c1 - c0)).reshape(rows, c1 - c0) < 0.03
+            block = ground[:, c0:c1]
+            block[hit & (block == GRASS)] = SAND
+
+    water = ground == WATER
+
+    # PATH meandro até o funil leste (passeio sequencial; barato)
+    overlay_path = np.zeros((rows, cols), dtype=np.uint8)
+    pr, pc = max(2, rows//2 - 10), 4
+    gate_cs = cols-14
+    steps = rows*6
+    while steps>0 and pc<gate_cs:
+        steps-=1
+        if 0<=pr<rows and 0<=pc<cols and not water[pr, pc]:
+            overlay_path[pr, pc]=PATH
+        if rng.random()<0.90: pc+=1
+        if rng.random()<0.45: pr+=rng.choice((-1,1))
+        pr=max(1,min(rows-2,pr))
+    funnel = np.zeros((rows, cols), dtype=bool)
+    funnel[max(0, rows//2-2):max(0, rows//2+3), max(0, gate_cs):max(0, cols-1)] = True
+    overlay_path[funnel & ~water] = PATH
+
+    # SHORE espuma
+    overlay_shore = np.zeros((rows, cols), dtype=np.uint8)
+    overlay_shore[((ground == GRASS) | (ground == SAND)) & _near(water)] = SHORE
+
+    # NEVE ao norte-leste: um sorteio por célula sem água, em ordem de linha
+    overlay_snow = np.zeros((rows, cols), dtype=np.uint8)
+    band_top = int(rows*0.40)
+    sc = int(cols*0.48)
+    band = ~water[:band_top, sc:]
+    n = int(band.sum())
+    if n:
+        hit = np.zeros(band.shape, dtype=bool)
+        hit[band] = _draws(rng, n) < 0.24
+        overlay_snow[:band_top, sc:][hit] = SNOW
+
+    # DEBUG overlay (cidade/vilas/pois)
+    overlay_debug = np.zeros((rows, cols), dtype=np.uint8)
+    city_r, city_c = rows//2, int(cols*0.30)
+    overlay_debug[city_r, city_c] = DBG_CITY
+    villages = [
+        (rows//2 + 10, int(cols*0.18)),
+        (rows//2 - 6,  int(cols*0.46)),
+        (rows//2 + 12, int(cols*0.62)),
+        (band_top//2 + 6, int(cols*0.70)),
+    ]
+    for (vr,vc) in villages: overlay_debug[vr, vc]=DBG_VILLAGE
+    overlay_debug[int(rows*0.22), int(cols*0.80)]=DBG_CAVE
+    overlay_debug[int(rows*0.12), int(cols*0.86)]=DBG_DUNGEON
+
+    return [
+        ('ground', ground),
+        ('overlay_path', overlay_path),
+        ('overlay_shore', overlay_shore),
+        ('overlay_snow', overlay_snow),
+        ('overlay_debug', overlay_debug),
+    ]
+
+def generate_compact(side='W', rows=256, cols=256, seed=22051):
+    """Camadas com 'grid' = TileGrid (1 byte/célula), sem passar por strings."""
+    return [{'name': name, 'grid': TileGrid.from_numpy(grid)}
+            for name, grid in generate_grids(side=side, rows=rows, cols=cols, seed=seed)]
+
+def generate(side='W', rows=256, cols=256, seed=22051):
+    """Drop-in de mapgen_caelari.generate(): mesmas camadas list[list[str]]."""
+    lut = np.array(PALETTE.tokens, dtype=object)
+    return [{'name': name, 'grid': lut[grid].tolist()}
+            for name, grid in generate_grids(side=side, rows=rows, cols=cols, seed=seed)]
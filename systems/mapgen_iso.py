@@ -1,15 +1,19 @@
 # systems/mapgen_iso.py — compatibility wrapper to new Caelari generator
 from __future__ import annotations
 from typing import Tuple, Dict, Any
-from systems.mapgen_caelari import generate as _generate
+from systems.mapgen_caelari import generate_fast as _generate
+from systems.region_cache import load_or_generate as _load_or_generate
 
-def generate_layers(rows: int = 256, cols: int = 256, seed: int = 22051, want_meta: bool = True, side: str = 'W'):
+def generate_layers(rows: int = 256, cols: int = 256, seed: int = 22051, want_meta: bool = True, side: str = 'W', compact: bool = False):
     """
     Backward-compatible signature used by old code:
       returns: (layers, pois, start_rc, props_rc[, meta])
     Internally uses systems.mapgen_caelari.generate (new).
+    compact=True returns each layer grid as core.tile_grid.TileGrid (uint8 ids),
+    served from the on-disk region cache (systems.region_cache) when available.
     """
-    layers = _generate(side=side, rows=rows, cols=cols, seed=seed)
+    gen = _load_or_generate if compact else _generate
+    layers = gen(side=side, rows=rows, cols=cols, seed=seed)
     # Minimal/neutral POIs + start/meta (can be enriched later)
     pois: Dict[str, Any] = {}
     start_rc: Tuple[int,int] = (rows//2, int(cols*0.30))
@@ -5,6 +5,7 @@ class OverlapZone:
     def __init__(self, x, y, w, h, bias_front=100_000):
         self.rect = pygame.Rect(int(x), int(y), int(w), int(h))
         self.bias_front = int(bias_front)
+        self._inside = set()   # sprites com bias aplicado via apply_index()
 
     def apply(self, sprite, group):
         inside = self.rect.colliderect(sprite.rect)
@@ -12,3 +13,11 @@ class OverlapZone:
         if getattr(sprite, 'layer_bias', 0) != target:
             sprite.layer_bias = target
             group.mark_dirty(sprite)
+
+    def apply_index(self, index, group, origin=(0, 0)):
+        """Same as apply() for every sprite in a SpatialHash, touching only sprites
+        near the zone plus the ones that were inside last frame."""
+        now = {sp for sp in index.query_screen_rect(self.rect, origin) if self.rect.colliderect(sp.rect)}
+        for sp in now | self._inside:
+            self.apply(sp, group)
+        self._inside = now
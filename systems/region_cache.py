@@ -0,0 +1,136 @@
+# systems/region_cache.py — cache em disco das regiões geradas (grades compactas, mmap)
+"""
+Guarda as camadas compactas (core.tile_grid.TileGrid) de cada região em
+DATA_DIR/region_cache, uma por chave (side, rows, cols, seed, versão do gerador).
+A versão é um hash do código-fonte do gerador: mudou o mapgen, a chave muda.
+
+Formato .mrr (little-endian):
+    b'MRRG' | u16 formato | u32 rows | u32 cols | u16 n_camadas | u16 n_tokens
+    n_tokens x (u8 len + utf-8)      paleta (id -> token)
+    n_camadas x (u8 len + utf-8)     nomes das camadas
+    padding até múltiplo de 64
+    n_camadas x rows*cols bytes      ids uint8, camada a camada, em ordem de linha
+Os bytes das camadas são abertos com mmap (cópia-na-escrita), sem ler o arquivo todo.
+"""
+from __future__ import annotations
+import hashlib
+import mmap
+import os
+import struct
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.config import DATA_DIR
+from core.tile_grid import PALETTE, TileGrid
+
+CACHE_DIR: Path = DATA_DIR / 'region_cache'
+_MAGIC = b'MRRG'
+_FORMAT = 1
+_HEAD = struct.Struct('<4sHIIHH')
+_ALIGN = 64
+
+@lru_cache(maxsize=1)
+def generator_version() -> str:
+    """Hash curto do código do gerador (puro-Python + backend NumPy)."""
+    import systems.mapgen_caelari as gen
+    h = hashlib.sha1()
+    here = Path(gen.__file__).resolve().parent
+    for name in ('mapgen_caelari.py', 'mapgen_caelari_np.py'):
+        p = here / name
+        if p.exists():
+            h.update(p.read_bytes())
+    return h.hexdigest()[:12]
+
+def region_path(side: str, rows: int, cols: int, seed: int) -> Path:
+    s = (side or 'W').upper()[:1]
+    return CACHE_DIR / f'{s}_{int(rows)}x{int(cols)}_s{int(seed)}_{generator_version()}.mrr'
+
+def _pack_str(s: str) -> bytes:
+    b = s.encode('utf-8')
+    return struct.pack('<B', len(b)) + b
+
+def save_region(path: Path, layers: List[Dict[str, Any]]):
+    """Grava as camadas (TileGrid) de forma atômica (tmp + replace)."""
+    grids = [L['grid'] for L in layers]
+    rows, cols = grids[0].rows, grids[0].cols
+    tokens = grids[0].palette.tokens
+    head = _HEAD.pack(_MAGIC, _FORMAT, rows, cols, len(grids), len(tokens))
+    head += b''.join(_pack_str(t) for t in tokens)
+    head += b''.join(_pack_str(L['name']) for L in layers)
+    head += b'\0' * (-len(head) % _ALIGN)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with tmp.open('wb') as f:
+        f.write(head)
+        for g in grids:
+            f.write(g.tobytes())
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # arquivo antigo ainda mapeado (Windows): mantém o existente
+        tmp.unlink(missing_ok=True)
+
+def load_region(path: Path, use_mmap: bool = True) -> Optional[List[Dict[str, Any]]]:
+    """Lê um .mrr; devolve None se não existir ou estiver inválido."""
+    try:
+        with path.open('rb') as f:
+            if use_mmap:
+                buf = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+            else:
+                buf = memoryview(bytearray(f.read()))
+    except (OSError, ValueError):
+        return None
+    try:
+        return _parse(buf)
+    except (IndexError, ValueError, struct.error):
+        # truncado/corrompido (UnicodeDecodeError é ValueError): regera a região
+        return None
+
+def _parse(buf: memoryview) -> Optional[List[Dict[str, Any]]]:
+    if len(buf) < _HEAD.size:
+        return None
+    magic, fmt, rows, cols, n_layers, n_tokens = _HEAD.unpack_from(buf, 0)
+    if magic != _MAGIC or fmt != _FORMAT or n_tokens > 256:
+        return None
+    off = _HEAD.size
+    strs = []
+    for _ in range(n_tokens + n_layers):
+        n = buf[off]
+        if off + 1 + n > len(buf):
+            return None
+        strs.append(bytes(buf[off + 1: off + 1 + n]).decode('utf-8'))
+        off += 1 + n
+    tokens, names = strs[:n_tokens], strs[n_tokens:]
+    off += -off % _ALIGN
+    size = rows * cols
+    if len(buf) < off + size * n_layers:
+        return None
+    # paleta do arquivo -> paleta atual (sem cópia quando os ids coincidem)
+    ids = [PALETTE.id_of(t) for t in tokens]
+    remap = None if ids == list(range(n_tokens)) else bytes(ids) + bytes(256 - n_tokens)
+    layers = []
+    for i, name in enumerate(names):
+        data = buf[off + i * size: off + (i + 1) * size]
+        if remap is not None:
+            data = memoryview(bytearray(bytes(data).translate(remap)))
+        layers.append({'name': name, 'grid': TileGrid(rows, cols, data, PALETTE)})
+    return layers
+
+def load_or_generate(side: str = 'W', rows: int = 256, cols: int = 256, seed: int = 22051) -> List[Dict[str, Any]]:
+    """Camadas compactas da região: do cache em disco, ou geradas e gravadas."""
+    path = region_path(side, rows, cols, seed)
+    t0 = time.perf_counter()
+    layers = load_region(path)
+    if layers is not None:
+        print(f'[RegionCache] hit {path.name} ({(time.perf_counter() - t0) * 1000.0:.1f} ms)')
+        return layers
+    import systems.mapgen_caelari as mapgen
+    layers = mapgen.generate_compact(side=side, rows=rows, cols=cols, seed=seed)
+    try:
+        save_region(path, layers)
+    except OSError as e:
+        print('[RegionCache] falha ao gravar', path.name, e)
+    print(f'[RegionCache] miss {path.name} ({(time.perf_counter() - t0) * 1000.0:.1f} ms)')
+    return layers
@@ -0,0 +1,250 @@
+# systems/spatial_hash.py — índice espacial em grade uniforme no espaço do grid (r,c)
+"""
+Cada objeto fica num balde (floor(r/cell), floor(c/cell)). move() só troca de
+balde quando o objeto cruza a borda de uma célula, então atualizar N inimigos
+por frame custa O(N) dict lookups. Consultas:
+- query_radius(r, c, raio)      -> objetos a <= raio tiles (distância no grid)
+- nearest(r, c, k, max_radius)  -> k mais próximos, [(d2, obj), ...] crescente
+- query_rect(r0, c0, r1, c1)    -> objetos com r0<=r<=r1 e c0<=c<=c1
+- query_screen_rect(rect, ...)  -> candidatos cujo sprite pode tocar um Rect de tela
+  (mundo); o chamador faz o teste exato (colliderect).
+
+StaticRectHash é o par em px de mundo: indexa o Rect em todas as células que
+ele cobre e responde query(rect) direto. Feito para props parados; move() serve
+para quem anda pouco e avisa (sprites do DepthGroup marcados com mark_dirty).
+"""
+from __future__ import annotations
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from core.config import TILE_W, TILE_H, PLAYER_SIZE
+
+# menor distância em px de tela por tile de grid (direção r=c): TILE_H*sqrt(2)/2
+PX_PER_TILE_MIN = TILE_H * math.sqrt(2.0) / 2.0
+
+def screen_radius_to_grid(px: float) -> float:
+    """Raio no grid que contém com certeza um círculo de `px` pixels de tela."""
+    return float(px) / PX_PER_TILE_MIN
+
+class SpatialHash:
+    def __init__(self, cell: float = 8.0):
+        self.cell = float(cell)
+        self._cells: Dict[Tuple[int, int], List[Hashable]] = {}
+        self._key: Dict[Hashable, Tuple[int, int]] = {}
+        self._pos: Dict[Hashable, Tuple[float, float]] = {}
+
+    def _cell_of(self, r: float, c: float) -> Tuple[int, int]:
+        return (math.floor(r / self.cell), math.floor(c / self.cell))
+
+    # --- manutenção ---
+    def insert(self, obj, r: float, c: float):
+        if obj in self._key:
+            self.move(obj, r, c)
+            return
+        key = self._cell_of(r, c)
+        self._cells.setdefault(key, []).append(obj)
+        self._key[obj] = key
+        self._pos[obj] = (r, c)
+
+    def move(self, obj, r: float, c: float):
+        old = self._key.get(obj)
+        if old is None:
+            self.insert(obj, r, c)
+            return
+        self._pos[obj] = (r, c)
+        key = self._cell_of(r, c)
+        if key != old:
+            self._drop(obj, old)
+            self._cells.setdefault(key, []).append(obj)
+            self._key[obj] = key
+
+    def remove(self, obj):
+        key = self._key.pop(obj, None)
+        if key is not None:
+            self._pos.pop(obj, None)
+            self._drop(obj, key)
+
+    def _drop(self, obj, key):
+        bucket = self._cells[key]
+        bucket.remove(obj)
+        if not bucket:
+            del self._cells[key]
+
+    def clear(self):
+        self._cells.clear(); self._key.clear(); self._pos.clear()
+
+    def rebuild(self, objs: Iterable):
+        """Reindexa tudo a partir de obj.r / obj.c."""
+        self.clear()
+        for o in objs:
+            self.insert(o, o.r, o.c)
+
+    def __len__(self) -> int:
+        return len(self._key)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._key
+
+    def position(self, obj) -> Optional[Tuple[float, float]]:
+        return self._pos.get(obj)
+
+    # --- consultas ---
+    def _cells_in(self, r0: float, c0: float, r1: float, c1: float):
+        (kr0, kc0), (kr1, kc1) = self._cell_of(r0, c0), self._cell_of(r1, c1)
+        cells = self._cells
+        # poucos objetos: varrer os baldes existentes é mais barato que a janela inteira
+        if (kr1 - kr0 + 1) * (kc1 - kc0 + 1) > len(cells):
+            for (kr, kc), bucket in cells.items():
+                if kr0 <= kr <= kr1 and kc0 <= kc <= kc1:
+                    yield bucket
+            return
+        for kr in range(kr0, kr1 + 1):
+            for kc in range(kc0, kc1 + 1):
+                bucket = cells.get((kr, kc))
+                if bucket:
+                    yield bucket
+
+    def query_rect(self, r0: float, c0: float, r1: float, c1: float) -> List:
+        pos = self._pos
+        out = []
+        for bucket in self._cells_in(r0, c0, r1, c1):
+            for o in bucket:
+                r, c = pos[o]
+                if r0 <= r <= r1 and c0 <= c <= c1:
+                    out.append(o)
+        return out
+
+    def query_radius(self, r: float, c: float, radius: float) -> List:
+        pos = self._pos
+        rad2 = radius * radius
+        out = []
+        for bucket in self._cells_in(r - radius, c - radius, r + radius, c + radius):
+            for o in bucket:
+                orr, oc = pos[o]
+                if (orr - r) ** 2 + (oc - c) ** 2 <= rad2:
+                    out.append(o)
+        return out
+
+    def nearest(self, r: float, c: float, k: int = 1, max_radius: Optional[float] = None,
+                exclude=None) -> List[Tuple[float, object]]:
+        """k vizinhos mais próximos (distância no grid), expandindo anéis de células."""
+        if not self._key or k <= 0:
+            return []
+        pos = self._pos
+        cr, cc = self._cell_of(r, c)
+        found: List[Tuple[float, object]] = []
+        seen = 0
+        ring = 0
+        while True:
+            for kr in range(cr - ring, cr + ring + 1):
+                for kc in range(cc - ring, cc + ring + 1):
+                    if ring and cr - ring < kr < cr + ring and cc - ring < kc < cc + ring:
+                        continue  # interior já visitado
+                    bucket = self._cells.get((kr, kc))
+                    if not bucket:
+                        continue
+                    seen += len(bucket)
+                    for o in bucket:
+                        if o is exclude:
+                            continue
+                        orr, oc = pos[o]
+                        found.append(((orr - r) ** 2 + (oc - c) ** 2, o))
+            # tudo a menos de ring*cell tiles já foi visto
+            reach = ring * self.cell
+            if max_radius is not None and reach >= max_radius:
+                break
+            if len(found) >= k:
+                found.sort(key=lambda t: t[0])
+                if found[k - 1][0] <= reach * reach:
+                    break
+            if seen >= len(self._key):
+                break
+            ring += 1
+        if max_radius is not None:
+            m2 = max_radius * max_radius
+            found = [t for t in found if t[0] <= m2]
+        found.sort(key=lambda t: t[0])
+        return found[:k]
+
+    def query_screen_rect(self, rect, origin: Tuple[float, float] = (0, 0),
+                          pad_px: int = PLAYER_SIZE) -> List:
+        """Candidatos cujo sprite (âncora midbottom no tile, até pad_px de lado)
+        pode tocar `rect` (coordenadas de mundo). `origin` = offset do mapa (ox, oy)."""
+        ox = origin[0] + TILE_W // 2
+        oy = origin[1] + TILE_H
+        # a âncora fica até pad_px/2 para os lados e até pad_px abaixo do topo do rect
+        x0, x1 = rect.left - pad_px / 2 - ox, rect.right + pad_px / 2 - ox
+        y0, y1 = rect.top - oy, rect.bottom + pad_px - oy
+        hw, hh = TILE_W / 2.0, TILE_H / 2.0
+        # inversa 2:1 nos 4 cantos -> caixa no grid (+1 tile pelo int() da projeção)
+        us = (y0 / hh, y1 / hh)
+        vs = (x0 / hw, x1 / hw)
+        rs = [(u - v) / 2 for u in us for v in vs]
+        cs = [(u + v) / 2 for u in us for v in vs]
+        return self.query_rect(min(rs) - 1, min(cs) - 1, max(rs) + 1, max(cs) + 1)
+
+
+class StaticRectHash:
+    """Índice de Rects em px de mundo (células de `cell` px).
+    Um objeto entra em todas as células que seu rect cobre; move() só mexe nos
+    baldes quando o conjunto de células muda."""
+    def __init__(self, cell: int = 256):
+        self.cell = int(cell)
+        self._cells: Dict[Tuple[int, int], List[Hashable]] = {}
+        self._rects: Dict[Hashable, object] = {}
+
+    def _span(self, rect):
+        s = self.cell
+        return (rect.left // s, rect.top // s, (rect.right - 1) // s, (rect.bottom - 1) // s)
+
+    def insert(self, obj, rect):
+        if obj in self._rects:
+            self.remove(obj)
+        rect = self._rects[obj] = rect.copy()   # chave das células fixada na inserção
+        kx0, ky0, kx1, ky1 = self._span(rect)
+        for kx in range(kx0, kx1 + 1):
+            for ky in range(ky0, ky1 + 1):
+                self._cells.setdefault((kx, ky), []).append(obj)
+
+    def move(self, obj, rect):
+        old = self._rects.get(obj)
+        if old is not None and self._span(old) == self._span(rect):
+            self._rects[obj] = rect.copy()
+        else:
+            self.insert(obj, rect)
+
+    def remove(self, obj):
+        rect = self._rects.pop(obj, None)
+        if rect is None:
+            return
+        kx0, ky0, kx1, ky1 = self._span(rect)
+        for kx in range(kx0, kx1 + 1):
+            for ky in range(ky0, ky1 + 1):
+                bucket = self._cells[(kx, ky)]
+                bucket.remove(obj)
+                if not bucket:
+                    del self._cells[(kx, ky)]
+
+    def clear(self):
+        self._cells.clear(); self._rects.clear()
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._rects
+
+    def __iter__(self):
+        return iter(self._rects)
+
+    def query(self, rect) -> set:
+        """Objetos cujo rect toca `rect` (teste exato)."""
+        kx0, ky0, kx1, ky1 = self._span(rect)
+        cells, rects = self._cells, self._rects
+        out = set()
+        for kx in range(kx0, kx1 + 1):
+            for ky in range(ky0, ky1 + 1):
+                bucket = cells.get((kx, ky))
+                if bucket:
+                    out.update(o for o in bucket if rect.colliderect(rects[o]))
+        return out
@@ -6,6 +6,7 @@ Cobre TODOS os tokens de ground/overlay + dbg_*. Sem dependência de assets.
 import pygame, random, math
 from functools import lru_cache
 from core.config import TILE_W, TILE_H
+from core.tile_disk_cache import disk_cached
 
 # ---------- utils ----------
 def _rhombus_points(w, h):
@@ -80,7 +81,9 @@ def _cracks(surf, pts, color=(40,80,120), n=3, seed=0):
         pygame.draw.line(surf, (*color, 200), (x,y), (x+dx, y+dy), 2)
 
 # ---------- render principal ----------
+# memória (lru) -> disco (data/tile_cache, versionado pelo hash deste arquivo) -> render
 @lru_cache(maxsize=512)
+@disk_cached('tile_factory', __file__, (TILE_W, TILE_H))
 def _render_token(token: str) -> pygame.Surface:
     w, h = TILE_W, TILE_H
     W, H = w*2, h*2
@@ -1,11 +1,13 @@
-# systems/world_streamer.py — v2 (min-compat return type)
+# systems/world_streamer.py — v3 (pré-carga assíncrona; min-compat return type)
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, Tuple, Optional, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from typing import Dict, Tuple, Optional, Any, List
 
 from core.map_iso2 import IsoTileSet2
 from core.iso_chunked import IsoChunkedMap, ChunkSpec
-import systems.mapgen_caelari as mapgen
+import systems.region_cache as region_cache
 
 @dataclass
 class Region:
@@ -22,20 +24,44 @@ class LoadedRegion:
     cmap: IsoChunkedMap
     meta: Dict[str, Any]
 
+@dataclass
+class Preload:
+    """Pré-carga em andamento: a geração roda no worker, o IsoChunkedMap é montado no main thread."""
+    rid: str
+    future: Future
+    t_start: float
+    trigger_c: float
+    t_ready: Optional[float] = None
+    loaded: Optional[LoadedRegion] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
 class WorldStreamer:
     def __init__(self, registry: Dict[str, Region], current_id: str,
                  tileset: Optional[IsoTileSet2]=None,
-                 chunk_spec: ChunkSpec=ChunkSpec(rows=24, cols=24, lru_max=12)):
+                 chunk_spec: ChunkSpec=ChunkSpec(rows=24, cols=24, cache_mb=256.0),
+                 preload_cols: int = 8):
         self.registry = registry
         self.current_id = current_id
         self.active: Optional[LoadedRegion] = None
         self.next_loaded: Optional[LoadedRegion] = None
         self.tileset = tileset or IsoTileSet2()
         self.chunk_spec = chunk_spec
+        self.preload_cols = int(preload_cols)   # distância (colunas) do portão que dispara a pré-carga
+        self.pending: Optional[Preload] = None
+        self.history: List[Dict[str, Any]] = []  # um registro por handoff (para calibrar preload_cols)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='region-load')
 
-    def _load_region(self, rid: str) -> LoadedRegion:
+    # --- carga ---
+    def _generate(self, rid: str) -> Tuple[Any, float]:
+        """Parte pesada (roda no worker): camadas compactas do cache em disco ou geradas."""
+        R = self.registry[rid]
+        t0 = time.perf_counter()
+        layers = region_cache.load_or_generate(side=R.side, rows=R.size[0], cols=R.size[1], seed=R.seed)
+        return layers, (time.perf_counter() - t0) * 1000.0
+
+    def _build(self, rid: str, layers) -> LoadedRegion:
+        """Parte leve (main thread): monta o IsoChunkedMap e os portões."""
         R = self.registry[rid]
-        layers = mapgen.generate(side=R.side, rows=R.size[0], cols=R.size[1], seed=R.seed)
         cmap = IsoChunkedMap(layers, self.tileset, origin=R.origin, spec=self.chunk_spec)
         rows, cols = R.size
         gate_r0, gate_r1 = (rows//2 - 2, rows//2 + 2)
@@ -46,48 +72,135 @@ class WorldStreamer:
             meta['gate_west'] = {'rc_range': ((gate_r0, gate_r1), (2, 8))}
         return LoadedRegion(R, cmap, meta)
 
+    def _load_region(self, rid: str) -> LoadedRegion:
+        """Carga síncrona (região inicial)."""
+        layers, gen_ms = self._generate(rid)
+        t0 = time.perf_counter()
+        loaded = self._build(rid, layers)
+        loaded.meta['timings'] = {'gen_ms': gen_ms, 'build_ms': (time.perf_counter() - t0) * 1000.0}
+        return loaded
+
     def ensure_loaded(self):
         if not self.active:
             print('[WS] ensure_loaded ->', self.current_id)
             self.active = self._load_region(self.current_id)
 
+    def _start_preload(self, rid: str, trigger_c: float):
+        print('[WS] preloading ->', rid)
+        self.pending = Preload(rid, self._pool.submit(self._generate, rid), time.perf_counter(), trigger_c)
+
+    def _cancel_preload(self):
+        """Descarta a pré-carga atual (o jogador foi para o outro portão)."""
+        p = self.pending
+        print('[WS] preload cancelado ->', p.rid)
+        p.future.cancel()   # se já está no worker, termina lá e o resultado é ignorado
+        if p.loaded is not None:
+            p.loaded.cmap.close()
+        self.pending = None
+        self.next_loaded = None
+
+    def _approaching(self, c: float) -> Optional[str]:
+        """Vizinho cuja faixa de pré-carga (preload_cols antes do portão) contém c;
+        se as duas faixas se sobrepõem, o do portão mais próximo."""
+        best = None
+        for side, gate_key in (('E', 'gate_east'), ('W', 'gate_west')):
+            gate = self.active.meta.get(gate_key)
+            rid = self.active.region.neighbors.get(side)
+            if not gate or not rid or rid not in self.registry:
+                continue
+            _, (gc0, gc1) = gate['rc_range']
+            d = max(0.0, gc0 - c, c - gc1)   # colunas até o portão
+            if d <= self.preload_cols and (best is None or d < best[0]):
+                best = (d, rid)
+        return best[1] if best else None
+
+    def _finish_preload(self, block: bool) -> Optional[LoadedRegion]:
+        """Monta a região pré-carregada se o worker terminou (ou espera, se block=True)."""
+        p = self.pending
+        if p is None:
+            return None
+        if p.loaded is None:
+            if not block and not p.future.done():
+                return None
+            t_wait = time.perf_counter()
+            layers, gen_ms = p.future.result()
+            p.timings['wait_ms'] = (time.perf_counter() - t_wait) * 1000.0 if block else 0.0
+            t0 = time.perf_counter()
+            p.loaded = self._build(p.rid, layers)
+            p.t_ready = time.perf_counter()
+            p.timings['gen_ms'] = gen_ms
+            p.timings['build_ms'] = (p.t_ready - t0) * 1000.0
+            p.loaded.meta['timings'] = dict(p.timings)
+            self.next_loaded = p.loaded
+        return p.loaded
+
+    def preload_status(self) -> Dict[str, Any]:
+        """Estado da pré-carga: 'idle' | 'loading' | 'ready', com tempos em ms.
+        Em 'loading', stage diz se o job ainda espera o worker ('queued') ou gera ('generating')."""
+        p = self.pending
+        if p is None:
+            return {'state': 'idle'}
+        now = time.perf_counter()
+        out: Dict[str, Any] = {'id': p.rid, 'trigger_c': p.trigger_c,
+                               'elapsed_ms': ((p.t_ready or now) - p.t_start) * 1000.0}
+        if p.loaded is not None:
+            out['state'] = 'ready'
+        else:
+            out['state'] = 'loading'
+            out['stage'] = 'generating' if p.future.running() else 'queued'
+        out.update(p.timings)
+        return out
+
+    def _handoff(self, r: float, c: float, new_c: int) -> Tuple[int,int]:
+        p = self.pending
+        t_reach = time.perf_counter()
+        was_ready = p.loaded is not None
+        loaded = self._finish_preload(block=True)
+        rec = self.preload_status()
+        # folga > 0: região ficou pronta antes do jogador chegar; < 0: o frame esperou o worker
+        rec['slack_ms'] = (t_reach - p.t_ready) * 1000.0 if was_ready else -rec.get('wait_ms', 0.0)
+        self.history.append(rec)
+        old = self.active
+        self.active = loaded
+        self.current_id = self.active.region.id
+        self.next_loaded = None
+        self.pending = None
+        if old is not None:
+            old.cmap.close()
+        new_r = min(max(r, 1), self.active.region.size[0]-2)
+        return (new_r, new_c)
+
     def update(self, player_rc: Tuple[int,int]):
         if not self.active:
             return None
+        self._finish_preload(block=False)
         r, c = player_rc
-        rows, cols = self.active.region.size
+        # pré-carga segue o portão de que o jogador se aproxima (troca se ele mudar de lado)
+        want = self._approaching(c)
+        if want is not None and (self.pending is None or self.pending.rid != want):
+            if self.pending is not None:
+                self._cancel_preload()
+            self._start_preload(want, c)
         # EAST gate
         gateE = self.active.meta.get('gate_east')
+        nxtE = self.active.region.neighbors.get('E')
         if gateE:
             (gr0, gr1), (gc0, gc1) = gateE['rc_range']
-            if c >= gc0 - 8 and self.next_loaded is None:
-                nxt = self.active.region.neighbors.get('E')
-                if nxt and nxt in self.registry:
-                    print('[WS] preloading ->', nxt)
-                    self.next_loaded = self._load_region(nxt)
-            if gc0 <= c <= gc1 and gr0 <= r <= gr1 and self.next_loaded:
-                print('[WS] handoff E ->', self.next_loaded.region.id)
-                self.active = self.next_loaded
-                self.current_id = self.active.region.id
-                self.next_loaded = None
-                new_r = min(max(r, 1), self.active.region.size[0]-2)
-                new_c = 1
-                return (new_r, new_c)  # MIN-COMPAT: return only (r,c)
+            if gc0 <= c <= gc1 and gr0 <= r <= gr1 and self.pending and self.pending.rid == nxtE:
+                print('[WS] handoff E ->', nxtE)
+                return self._handoff(r, c, 1)  # MIN-COMPAT: return only (r,c)
         # WEST gate
         gateW = self.active.meta.get('gate_west')
+        nxtW = self.active.region.neighbors.get('W')
         if gateW:
             (gr0, gr1), (gc0, gc1) = gateW['rc_range']
-            if c <= gc1 + 8 and self.next_loaded is None:
-                nxt = self.active.region.neighbors.get('W')
-                if nxt and nxt in self.registry:
-                    print('[WS] preloading ->', nxt)
-                    self.next_loaded = self._load_region(nxt)
-            if gc0 <= c <= gc1 and gr0 <= r <= gr1 and self.next_loaded:
-                print('[WS] handoff W ->', self.next_loaded.region.id)
-                self.active = self.next_loaded
-                self.current_id = self.active.region.id
-                self.next_loaded = None
-                new_r = min(max(r, 1), self.active.region.size[0]-2)
-                new_c = self.active.region.size[1]-2
-                return (new_r, new_c)  # MIN-COMPAT
+            if gc0 <= c <= gc1 and gr0 <= r <= gr1 and self.pending and self.pending.rid == nxtW:
+                print('[WS] handoff W ->', nxtW)
+                return self._handoff(r, c, self.registry[nxtW].size[1] - 2)  # MIN-COMPAT
         return None
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for lr in (self.active, self.next_loaded):
+            if lr is not None:
+                lr.cmap.close()
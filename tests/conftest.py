@@ -0,0 +1,18 @@
+# tests/conftest.py — raiz do repo no sys.path e pygame sem janela
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+
+@pytest.fixture
+def no_disk_sheets(monkeypatch):
+    """Folhas de ator montadas só em memória (não grava em data/anim_cache)."""
+    from gameplay import actor_sprites
+    monkeypatch.setattr(actor_sprites.SPRITE_CACHE, 'disk', False)
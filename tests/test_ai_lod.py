@@ -0,0 +1,94 @@
+# tests/test_ai_lod.py — ritmo de tick da IA por tier de LOD (multidão NumPy e caminho por objeto)
+import pytest
+
+from gameplay import enemies_iso
+from gameplay.ai_lod import LOD_PERIOD, LOD_NEAR, LOD_MID, LOD_FAR, tier_of
+from gameplay.enemies_iso import EnemiesIso, EnemyIso
+
+DT = 1.0 / 60.0
+OFF_VIEW = (0.0, 0.0, 1.0, 1.0)          # (50, 50) cai bem fora
+ALL_VIEW = (-1e9, -1e9, 1e9, 1e9)
+
+
+class NoWander:
+    """Gerador da multidão que nunca sorteia wander."""
+    def random(self, n):
+        import numpy as np
+        return np.ones(n)
+
+    def uniform(self, lo, hi, size):
+        raise AssertionError('wander com roll = 1')
+
+
+@pytest.fixture(params=['crowd', 'scalar'])
+def enemies(request, no_disk_sheets, monkeypatch):
+    ens = EnemiesIso(tilemap=None, pois={})
+    if request.param == 'crowd':
+        pytest.importorskip('numpy')
+        if ens.crowd is None:
+            pytest.skip('sem NumPy')
+    else:
+        ens.crowd = None
+    e = EnemyIso(50, 50)
+    ens.add(e)
+    e.vel_r = 0.5                         # anda em +r, de costas para o player em (45, 50)
+    if ens.crowd is not None:
+        ens.crowd.rng = NoWander()
+    monkeypatch.setattr(enemies_iso.random, 'random', lambda: 1.0)
+    return ens, e
+
+
+def _run(ens, e, frames, player_rc, view):
+    """Frames (contando a partir de 0) em que o inimigo andou."""
+    out = []
+    for f in range(frames):
+        r0 = e.r
+        moved = ens.update(DT, player_rc, 0, 0, view=view)
+        assert (e in moved) == (e.r != r0)
+        if e.r != r0:
+            out.append(f)
+    return out
+
+
+def _gaps(ticks):
+    return {b - a for a, b in zip(ticks, ticks[1:])}
+
+
+def test_tiers():
+    assert tier_of(901.0, 0, 0, None) == LOD_FAR
+    assert tier_of(900.0, 0, 0, None) == LOD_NEAR
+    assert tier_of(25.0, 5, 5, OFF_VIEW) == LOD_MID
+    assert tier_of(25.0, 0.5, 0.5, OFF_VIEW) == LOD_NEAR
+
+
+def test_far_enemy_ticks_at_reduced_rate_and_keeps_pace(enemies):
+    ens, e = enemies
+    r0 = last = e.r
+    ticks = []
+    for f in range(64):
+        moved = ens.update(DT, (0.0, 0.0), 0, 0, view=OFF_VIEW)
+        if e in moved:
+            ticks.append(f)
+            # o dt pulado é acumulado: no tick a posição é a mesma de quem anda todo frame
+            assert e.r == pytest.approx(r0 + 0.5 * DT * (f + 1))
+        else:
+            assert e.r == last
+        last = e.r
+    assert len(ticks) == 64 // LOD_PERIOD[LOD_FAR]
+    assert _gaps(ticks) == {LOD_PERIOD[LOD_FAR]}
+
+
+def test_enemy_returns_to_full_rate_when_player_comes_near(enemies):
+    ens, e = enemies
+    far = _run(ens, e, 32, (0.0, 0.0), OFF_VIEW)
+    assert _gaps(far) == {LOD_PERIOD[LOD_FAR]}
+    # player a 5 tiles, inimigo ainda fora da tela: tier do meio
+    mid = _run(ens, e, 16, (45.0, 50.0), OFF_VIEW)
+    assert _gaps(mid) == {LOD_PERIOD[LOD_MID]}
+    assert len(mid) == 16 // LOD_PERIOD[LOD_MID]
+    # na tela: todo frame
+    near = _run(ens, e, 16, (45.0, 50.0), ALL_VIEW)
+    assert near == list(range(16))
+    # sem view, a distância basta: perto do player = tier cheio
+    near = _run(ens, e, 16, (e.r - 5.0, e.c), None)
+    assert near == list(range(16))
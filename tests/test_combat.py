@@ -0,0 +1,53 @@
+# tests/test_combat.py — HitResolver: um acerto por golpe, estado preso ao objeto (não ao id)
+import gc
+
+import pygame
+
+from core.config import TILE_W, TILE_H
+from gameplay.combat import Health, HitResolver
+from systems.iso_math import grid_to_screen
+from systems.spatial_hash import SpatialHash
+
+
+class Dummy(pygame.sprite.Sprite):
+    def __init__(self, r, c, hp=10):
+        super().__init__()
+        self.r, self.c = float(r), float(c)
+        self.health = Health(hp=hp, hp_max=hp)
+        x, y = grid_to_screen(self.r, self.c)
+        self.rect = pygame.Rect(0, 0, 48, 64)
+        self.rect.midbottom = (x + TILE_W // 2, y + TILE_H)
+
+
+def _setup():
+    index = SpatialHash(cell=8.0)
+    target = Dummy(10, 10)
+    index.insert(target, target.r, target.c)
+    return index, target, Dummy(0, 0, hp=99)
+
+
+def test_one_hit_per_swing_across_frames():
+    index, target, attacker = _setup()
+    res = HitResolver()
+    for _ in range(3):   # hitbox ativa por vários frames do golpe
+        res.emit(attacker, target.rect.inflate(8, 8), 3, swing=1)
+        events = res.resolve(index)
+    assert target.health.hp == 7
+    res.emit(attacker, target.rect, 3, swing=2)
+    events = res.resolve(index)
+    assert [e.target for e in events] == [target] and target.health.hp == 4
+
+
+def test_freed_objects_leave_no_stale_entries():
+    index, target, attacker = _setup()
+    res = HitResolver()
+    res.emit(attacker, target.rect, 1, swing=1)
+    res.resolve(index)
+    assert len(res._hit[attacker][1]) == 1
+    index.remove(target)
+    del target
+    gc.collect()
+    assert len(res._hit[attacker][1]) == 0
+    del attacker
+    gc.collect()
+    assert len(res._hit) == 0
@@ -0,0 +1,48 @@
+# tests/test_depth_group.py — culling do DepthGroup pelo índice de rects vs. varredura
+import random
+
+import pygame
+
+from systems.depth_group import DepthGroup
+
+
+def _sprite(rng):
+    sp = pygame.sprite.Sprite()
+    sp.image = pygame.Surface((40, 60))
+    sp.rect = sp.image.get_rect(topleft=(rng.randrange(-500, 3000), rng.randrange(-500, 3000)))
+    return sp
+
+
+def test_visible_matches_full_scan_while_sprites_move():
+    rng = random.Random(3)
+    group = DepthGroup()
+    sprites = [_sprite(rng) for _ in range(400)]
+    for i, sp in enumerate(sprites):
+        # os dois caminhos de entrada no grupo
+        if i % 2:
+            group.add(sp)
+        else:
+            sp.add(group)
+    for step in range(150):
+        for sp in rng.sample(sprites, 30):
+            sp.rect.move_ip(rng.randint(-300, 300), rng.randint(-300, 300))
+            group.mark_dirty(sp)
+        if step % 10 == 0:
+            sp = rng.choice(sprites)
+            sp.kill()
+            if step % 20 == 0:
+                sp.add(group)
+        clip = pygame.Rect(rng.randrange(0, 2000), rng.randrange(0, 2000), 900, 600)
+        group.sync_layers()
+        order = group._visible_in_order(clip)
+        assert set(order) == {sp for sp in group if sp.rect.colliderect(clip)}
+        assert all(a._layer <= b._layer for a, b in zip(order, order[1:]))
+
+
+def test_static_items_join_the_visible_set():
+    group = DepthGroup()
+    prop = pygame.sprite.Sprite()
+    prop.rect = pygame.Rect(100, 100, 64, 128)
+    group.add_static(prop)
+    assert prop in group._visible_in_order(pygame.Rect(0, 0, 300, 300))
+    assert prop not in group._visible_in_order(pygame.Rect(1000, 1000, 300, 300))
@@ -0,0 +1,30 @@
+# tests/test_dirty.py — DirtyLayer: frame cheio só quando a chave muda; base só para quem anima
+import pygame
+
+from ui.dirty import DirtyLayer
+
+
+def test_static_scene_needs_no_base():
+    screen = pygame.Surface((320, 200))
+    dirty = DirtyLayer()
+    assert dirty.needs_full(screen, 0)
+    assert not dirty.needs_full(screen, 0)   # sem commit_base: nada a redesenhar
+    assert dirty._base is None
+    assert dirty.needs_full(screen, 1)
+    dirty.invalidate()
+    assert dirty.needs_full(screen, 1)
+    assert dirty.needs_full(pygame.Surface((640, 400)), 1)
+
+
+def test_animated_item_restores_base():
+    screen = pygame.Surface((320, 200))
+    dirty = DirtyLayer()
+    assert dirty.needs_full(screen, 'menu')
+    screen.fill((10, 20, 30))
+    dirty.commit_base(screen)
+    arrow = pygame.Rect(10, 10, 8, 8)
+    dirty.track(screen.fill((255, 0, 0), arrow))
+    moved = arrow.move(0, 20)
+    assert dirty.redraw(screen, lambda s: s.fill((255, 0, 0), moved)) == [arrow.union(moved)]
+    assert tuple(screen.get_at(arrow.topleft))[:3] == (10, 20, 30)
+    assert dirty.redraw(screen, lambda s: s.fill((255, 0, 0), moved)) == []
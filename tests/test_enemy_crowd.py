@@ -0,0 +1,90 @@
+# tests/test_enemy_crowd.py — EnemyCrowd (struct-of-arrays) vs. EnemyIso.update_ai por objeto
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameplay import enemies_iso
+from gameplay.enemies_iso import EnemyIso
+from gameplay.enemy_crowd import EnemyCrowd
+
+DT = 1.0 / 60.0
+TOL = 1e-9
+
+
+class FixedRolls:
+    """Substitui o gerador da multidão: todo sorteio sai `roll`, todo uniform(lo, hi) sai lo + (hi-lo)*frac."""
+    def __init__(self, roll, frac):
+        self.roll, self.frac = roll, frac
+
+    def random(self, n):
+        return np.full(n, self.roll)
+
+    def uniform(self, lo, hi, size):
+        return np.full(size, lo + (hi - lo) * self.frac)
+
+
+def _spawn(seed):
+    """Mesmos inimigos duas vezes: perto olhando o alvo, perto de costas, parados e longe (> 30 tiles)."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(40):
+        r, c = rng.uniform(0, 80), rng.uniform(0, 80)
+        vr, vc = rng.choice((0.0, rng.uniform(-1, 1))), rng.choice((0.0, rng.uniform(-1, 1)))
+        pair = []
+        for _ in range(2):
+            e = EnemyIso(r, c)
+            e.vel_r, e.vel_c = vr, vc
+            pair.append(e)
+        out.append(pair)
+    return [p[0] for p in out], [p[1] for p in out]
+
+
+@pytest.mark.parametrize('roll, frac', [(1.0, 0.5), (0.0, 0.8), (0.0, 0.1)])
+def test_crowd_matches_per_object_update(no_disk_sheets, monkeypatch, roll, frac):
+    solo, grouped = _spawn(seed=7)
+    crowd = EnemyCrowd(seed=1)
+    for e in grouped:
+        crowd.add(e)
+    # primeiro terço sem wander (os parados ficam idle), depois o roll do caso
+    rolls = crowd.rng = FixedRolls(1.0, frac)
+    monkeypatch.setattr(enemies_iso.random, 'random', lambda: rolls.roll)
+    monkeypatch.setattr(enemies_iso.random, 'uniform', lambda lo, hi: lo + (hi - lo) * frac)
+
+    target = [40.0, 40.0]
+    reached = set()
+    for f in range(180):
+        if f == 60:
+            rolls.roll = roll
+        target[0] += 0.05; target[1] -= 0.03   # alvo andando: entra/sai do FOV e do raio de 30 tiles
+        for e in solo:
+            e.update_ai(DT, tuple(target))
+        crowd.step(DT, tuple(target), periods=(1, 1, 1))   # sem LOD: todo frame, como o caminho por objeto
+        for i, (a, b) in enumerate(zip(solo, grouped)):
+            assert abs(a.r - b.r) < TOL and abs(a.c - b.c) < TOL
+            assert abs(a.vel_r - b.vel_r) < TOL and abs(a.vel_c - b.vel_c) < TOL
+            assert a.state == b.state
+            assert a.anim_idx == int(crowd.anim_idx[i])
+            reached.add(a.state)
+    # o cenário passa pelos três estados
+    assert reached == {'idle', 'walk', 'run'}
+
+
+def test_remove_and_unbind_keep_state(no_disk_sheets):
+    _, grouped = _spawn(seed=3)
+    crowd = EnemyCrowd(seed=1)
+    for e in grouped:
+        crowd.add(e)
+    for _ in range(30):
+        crowd.step(DT, (40.0, 40.0), periods=(1, 1, 1))
+    gone = grouped[5]
+    before = (gone.r, gone.c, gone.vel_r, gone.vel_c, gone.state)
+    last = grouped[-1]
+    last_before = (last.r, last.c, last.state)
+    crowd.remove(gone)
+    assert (gone.r, gone.c, gone.vel_r, gone.vel_c, gone.state) == before
+    assert gone._crowd is None
+    # a última linha foi movida para o buraco e o sprite continua lendo os próprios dados
+    assert (last.r, last.c, last.state) == last_before
+    assert len(crowd) == len(grouped) - 1
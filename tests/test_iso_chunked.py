@@ -0,0 +1,73 @@
+# tests/test_iso_chunked.py — bake de chunks: Surfaces só no main thread, bake velho não volta ao cache
+import threading
+
+import pygame
+
+from core.chunk_baker import drain
+from core.iso_chunked import ChunkSpec, IsoChunkedMap
+from core.tile_grid import TileGrid, TilePalette
+
+COLORS = {'grass': (40, 160, 60), 'sand': (200, 180, 120), 'late': (220, 30, 200)}
+
+
+class RecordingTileset:
+    """tileset.get que anota em qual thread cada Surface foi criada."""
+    def __init__(self):
+        self.threads = []
+
+    def get(self, token):
+        self.threads.append(threading.current_thread())
+        surf = pygame.Surface((128, 64), pygame.SRCALPHA)
+        surf.fill(COLORS.get(token, (90, 90, 90)))
+        return surf
+
+
+def _map(tileset, workers=1):
+    palette = TilePalette(('', 'grass', 'sand'))
+    grid = TileGrid.from_tokens([['grass', 'sand'] * 4] * 8, palette)
+    return IsoChunkedMap([{'name': 'ground', 'grid': grid}], tileset,
+                         spec=ChunkSpec(rows=4, cols=4, bake_workers=workers))
+
+
+def _wait_baked(m, cam, key):
+    for _ in range(500):
+        m._schedule(cam, pygame.Rect(0, 0, 1, 1), [key])
+        if key in m.cache:
+            return m.cache.peek(key)
+        threading.Event().wait(0.002)
+    raise AssertionError('chunk não ficou pronto')
+
+
+def test_late_palette_token_is_resolved_on_main_thread():
+    tileset = RecordingTileset()
+    m = _map(tileset)
+    grid = m.layers[0]['grid']
+    # token registrado depois do atlas e usado no tile (0, 0)
+    grid.set(0, 0, grid.palette.id_of('late'))
+    try:
+        surf = _wait_baked(m, object(), (0, 0))
+    finally:
+        m.close()
+    assert set(tileset.threads) == {threading.main_thread()}
+    # canto do tile (0, 0) que os vizinhos não cobrem, em coordenadas locais do chunk
+    rect = m.chunk_world_rect(0, 0)
+    assert tuple(surf.get_at((m.map_offset_x + 10 - rect.left, 5 - rect.top)))[:3] == COLORS['late']
+
+
+def test_bake_started_before_bake_props_is_not_cached():
+    m = _map(RecordingTileset(), workers=0)
+    key = (0, 0)
+    # bake já em andamento (como no worker) quando os props chegam
+    job = m.baker.make_job(key)
+    next(job)
+    rock = pygame.sprite.Sprite()
+    rock.image = pygame.Surface((20, 20))
+    rock.image.fill((250, 250, 0))
+    rect = m.chunk_world_rect(*key)
+    rock.rect = rock.image.get_rect(center=(m.map_offset_x + 64, 32))
+    assert m.bake_props([rock]) == []
+    m._on_baked(key, drain(job))
+    assert key not in m.cache
+    # o próximo bake pedido já traz o prop
+    surf = _wait_baked(m, object(), key)
+    assert tuple(surf.get_at((m.map_offset_x + 64 - rect.left, 32 - rect.top)))[:3] == (250, 250, 0)
@@ -0,0 +1,40 @@
+# tests/test_region_cache.py — .mrr íntegro volta igual; truncado/corrompido vira None (regera)
+import pytest
+
+from core.tile_grid import TileGrid
+from systems.region_cache import _HEAD, load_region, save_region
+
+
+def _layers():
+    ground = TileGrid.from_tokens([['grass', 'water', 'sand'], ['sand', 'grass', 'water']])
+    deco = TileGrid.from_tokens([['', 'tree', ''], ['', '', 'rock']])
+    return [{'name': 'ground', 'grid': ground}, {'name': 'deco', 'grid': deco}]
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_round_trip(tmp_path, use_mmap):
+    path = tmp_path / 'r.mrr'
+    src = _layers()
+    save_region(path, src)
+    got = load_region(path, use_mmap=use_mmap)
+    assert [L['name'] for L in got] == ['ground', 'deco']
+    assert [L['grid'].tolist() for L in got] == [L['grid'].tolist() for L in src]
+
+
+def test_truncated_or_corrupt_file_is_a_miss(tmp_path):
+    path = tmp_path / 'r.mrr'
+    save_region(path, _layers())
+    blob = path.read_bytes()
+    # cortes no meio do cabeçalho, da tabela de strings e das camadas
+    for cut in (0, 3, _HEAD.size, _HEAD.size + 1, _HEAD.size + 4, len(blob) - 1):
+        bad = tmp_path / f'cut{cut}.mrr'
+        bad.write_bytes(blob[:cut])
+        assert load_region(bad, use_mmap=False) is None, cut
+    # string da paleta com utf-8 inválido
+    bad = tmp_path / 'utf.mrr'
+    bad.write_bytes(blob[:_HEAD.size + 1] + b'\xff' + blob[_HEAD.size + 2:])
+    assert load_region(bad, use_mmap=False) is None
+    # comprimento de string apontando para além do fim
+    bad = tmp_path / 'len.mrr'
+    bad.write_bytes(blob[:_HEAD.size] + b'\xff' + blob[_HEAD.size + 1:_HEAD.size + 8])
+    assert load_region(bad, use_mmap=False) is None
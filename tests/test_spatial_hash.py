@@ -0,0 +1,109 @@
+# tests/test_spatial_hash.py — consultas dos índices espaciais vs. força bruta
+import random
+
+import pygame
+
+from core.config import TILE_W, TILE_H, PLAYER_SIZE
+from systems.iso_math import grid_to_screen
+from systems.spatial_hash import SpatialHash, StaticRectHash
+
+CELL = 8.0
+
+
+class Obj:
+    def __init__(self, r, c):
+        self.r, self.c = r, c
+        self.rect = pygame.Rect(0, 0, 1, 1)
+
+    def place(self, r, c, origin, size):
+        self.r, self.c = r, c
+        x, y = grid_to_screen(r, c)
+        self.rect = pygame.Rect(0, 0, *size)
+        self.rect.midbottom = (x + origin[0] + TILE_W // 2, y + origin[1] + TILE_H)
+
+
+def _coord(rng):
+    # mistura pontos exatamente na borda de células, perto dela e quaisquer (inclusive negativos)
+    k = rng.random()
+    if k < 0.3:
+        return rng.randint(-4, 12) * CELL
+    if k < 0.5:
+        return rng.randint(-4, 12) * CELL + rng.choice((-1e-9, 1e-9))
+    return rng.uniform(-40.0, 100.0)
+
+
+def _populated(rng, n=300, origin=(0, 0)):
+    index = SpatialHash(cell=CELL)
+    objs = []
+    for _ in range(n):
+        o = Obj(0.0, 0.0)
+        o.place(_coord(rng), _coord(rng), origin, (rng.randint(8, PLAYER_SIZE), rng.randint(8, PLAYER_SIZE)))
+        index.insert(o, o.r, o.c)
+        objs.append(o)
+    return index, objs
+
+
+def _move_some(rng, index, objs, origin=(0, 0)):
+    for o in rng.sample(objs, len(objs) // 3):
+        o.place(o.r + rng.uniform(-CELL, CELL), o.c + rng.uniform(-CELL, CELL), origin, o.rect.size)
+        index.move(o, o.r, o.c)
+
+
+def test_query_rect_and_radius_match_brute_force():
+    rng = random.Random(11)
+    index, objs = _populated(rng)
+    for _ in range(40):
+        _move_some(rng, index, objs)
+        r0, c0 = _coord(rng), _coord(rng)
+        r1, c1 = r0 + rng.uniform(0, 30), c0 + rng.uniform(0, 30)
+        got = set(index.query_rect(r0, c0, r1, c1))
+        assert got == {o for o in objs if r0 <= o.r <= r1 and c0 <= o.c <= c1}
+        rad = rng.uniform(0, 25)
+        got = set(index.query_radius(r0, c0, rad))
+        assert got == {o for o in objs if (o.r - r0) ** 2 + (o.c - c0) ** 2 <= rad * rad}
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(12)
+    index, objs = _populated(rng, n=120)
+    for _ in range(30):
+        _move_some(rng, index, objs)
+        r, c, k = _coord(rng), _coord(rng), rng.randint(1, 6)
+        got = [d2 for d2, _ in index.nearest(r, c, k)]
+        want = sorted((o.r - r) ** 2 + (o.c - c) ** 2 for o in objs)[:k]
+        assert got == want
+
+
+def test_query_screen_rect_finds_every_colliding_sprite():
+    rng = random.Random(13)
+    origin = (3000, 40)
+    index, objs = _populated(rng, origin=origin)
+    for _ in range(40):
+        _move_some(rng, index, objs, origin)
+        x, y = grid_to_screen(_coord(rng), _coord(rng))
+        probe = pygame.Rect(x + origin[0], y + origin[1], rng.randint(1, 400), rng.randint(1, 300))
+        cand = set(index.query_screen_rect(probe, origin))
+        assert {o for o in objs if o.rect.colliderect(probe)} <= cand
+
+
+def test_static_rect_hash_matches_brute_force():
+    rng = random.Random(14)
+    cell = 256
+    index = StaticRectHash(cell=cell)
+    rects = {}
+    for i in range(300):
+        # metade alinhada às bordas das células (encosta/atravessa a borda)
+        x = rng.randint(-4, 12) * cell - rng.randint(0, 1) * rng.randint(1, 64) if i % 2 else rng.randint(-1000, 3000)
+        y = rng.randint(-4, 12) * cell - rng.randint(0, 1) * rng.randint(1, 64) if i % 2 else rng.randint(-1000, 3000)
+        rects[i] = pygame.Rect(x, y, rng.randint(1, 600), rng.randint(1, 600))
+        index.insert(i, rects[i])
+    for _ in range(60):
+        for i in rng.sample(list(rects), 40):
+            rects[i] = rects[i].move(rng.randint(-300, 300), rng.randint(-300, 300))
+            index.move(i, rects[i])
+        gone = rng.choice(list(rects))
+        index.remove(gone)
+        del rects[gone]
+        probe = pygame.Rect(rng.randint(-1000, 3000), rng.randint(-1000, 3000), rng.randint(1, 900), rng.randint(1, 700))
+        assert index.query(probe) == {i for i, r in rects.items() if r.colliderect(probe)}
+        assert len(index) == len(rects)
@@ -0,0 +1,42 @@
+# tests/test_zoom_view.py — variantes de zoom/flip em cache com teto de memória
+import pygame
+
+from core import zoom_view
+from core.chunk_cache import ChunkCache
+from core.zoom_view import ZOOM_STEP, ZoomView
+
+
+class _Cam:
+    x = y = 0.0
+
+    def __init__(self, zoom):
+        self.zoom = zoom
+
+
+def test_variants_are_reused_and_capped(monkeypatch):
+    cache = ChunkCache(max_mb=1.0)
+    monkeypatch.setattr(zoom_view, 'VARIANTS', cache)
+    surfs = [pygame.Surface((128, 64)) for _ in range(8)]
+    view = ZoomView(_Cam(1.5), 800, 600)
+    first = view.image(surfs[0])
+    assert view.image(surfs[0]) is first
+    assert ZoomView(_Cam(1.0), 800, 600).image(surfs[0]) is surfs[0]
+    # uma sessão de zoom passeando por todos os níveis: a memória não cresce além do teto
+    for k in range(25, 200):
+        view = ZoomView(_Cam(k * ZOOM_STEP), 800, 600, flip=bool(k % 2))
+        for s in surfs:
+            view.image(s)
+    assert cache.resident_bytes <= cache.max_bytes
+    assert cache.evictions > 0
+
+
+def test_dead_source_never_matches_new_surface(monkeypatch):
+    monkeypatch.setattr(zoom_view, 'VARIANTS', ChunkCache(max_mb=16.0))
+    view = ZoomView(_Cam(2.0), 800, 600)
+    a = pygame.Surface((10, 10))
+    a.fill((255, 0, 0))
+    view.image(a)
+    del a
+    b = pygame.Surface((10, 10))
+    b.fill((0, 255, 0))
+    assert view.image(b).get_at((5, 5))[:3] == (0, 255, 0)
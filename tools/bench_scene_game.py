@@ -0,0 +1,157 @@
+# tools/bench_scene_game.py — benchmark headless do SceneGame (update/draw separados, saída JSON)
+"""
+Sobe o SceneGame com o driver de vídeo 'dummy' do SDL, conduz o player por um
+percurso fixo de waypoints no mapa 128x128 (dt fixo, sem teclado) e mede
+update() e draw() separadamente. O resultado é um JSON com percentis em ms,
+para comparar entre commits:
+
+    python tools/bench_scene_game.py --frames 1200 --out bench.json
+    python tools/bench_scene_game.py --compare bench.json
+"""
+import os, sys, json, time, math, argparse, subprocess, platform
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+# Percurso (r, c) no mapa 128x128: cidade -> leste -> sul -> costa oeste -> norte
+WAYPOINTS = [(64, 40), (64, 100), (100, 100), (100, 30), (30, 30), (30, 90), (64, 40)]
+
+def percentiles(samples):
+    if not samples:
+        return {}
+    s = sorted(samples)
+    def p(q):
+        return s[min(len(s) - 1, int(round(q / 100.0 * (len(s) - 1))))]
+    return {'p50': p(50), 'p90': p(90), 'p95': p(95), 'p99': p(99),
+            'max': s[-1], 'mean': sum(s) / len(s)}
+
+class ScriptedPath:
+    """Substitui Player.handle_input: anda em linha reta (grid) até o próximo waypoint."""
+    def __init__(self, player, waypoints, loop=True):
+        self.player = player
+        self.points = list(waypoints)
+        self.i = 0
+        self.loop = loop
+
+    def __call__(self, dt, **_):
+        pl = self.player
+        if self.i >= len(self.points):
+            pl.vel_r = pl.vel_c = 0.0
+            return
+        tr, tc = self.points[self.i]
+        dr, dc = tr - pl.r, tc - pl.c
+        dist = math.hypot(dr, dc)
+        speed = pl.base_speed
+        if dist <= max(0.05, speed * dt):
+            self.i += 1
+            if self.loop and self.i >= len(self.points):
+                self.i = 0
+            pl.vel_r = pl.vel_c = 0.0
+            return
+        pl.vel_r, pl.vel_c = dr / dist * speed, dc / dist * speed
+        pl._set_state('walk')
+
+def _git_rev():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def run(frames=1200, warmup=60, dt=1.0 / 60.0, size=None, flip=True):
+    from core.config import SCREEN_SIZE
+    pygame.init()
+    screen = pygame.display.set_mode(tuple(size or SCREEN_SIZE))
+    from gameplay.scene_game import SceneGame
+
+    class DummyMgr:
+        running = True
+        current_scene = None
+        def switch_to(self, scene): pass
+
+    t0 = time.perf_counter()
+    scene = SceneGame(DummyMgr())
+    init_ms = (time.perf_counter() - t0) * 1000.0
+    start = (scene.player.r, scene.player.c)
+    scene.player.handle_input = ScriptedPath(scene.player, [start] + WAYPOINTS)
+
+    upd, drw, pres, tot = [], [], [], []
+    for i in range(warmup + frames):
+        pygame.event.pump()
+        a = time.perf_counter()
+        scene.update(dt)
+        b = time.perf_counter()
+        scene.draw(screen)
+        c = time.perf_counter()
+        if flip:
+            pygame.display.flip()
+        d = time.perf_counter()
+        if i >= warmup:
+            upd.append((b - a) * 1000.0)
+            drw.append((c - b) * 1000.0)
+            pres.append((d - c) * 1000.0)
+            tot.append((d - a) * 1000.0)
+
+    report = {
+        'rev': _git_rev(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'screen': list(screen.get_size()),
+        'frames': frames, 'warmup': warmup, 'dt': dt,
+        'init_ms': init_ms,
+        'update_ms': percentiles(upd),
+        'draw_ms': percentiles(drw),
+        'present_ms': percentiles(pres),
+        'frame_ms': percentiles(tot),
+        'player_end_rc': [round(scene.player.r, 2), round(scene.player.c, 2)],
+    }
+    if hasattr(scene.tilemap, 'cache_stats'):
+        report['chunks'] = scene.tilemap.cache_stats()
+    from core.zoom_view import VARIANTS
+    report['sprite_variants'] = VARIANTS.stats()
+    if hasattr(scene.tilemap, 'close'):
+        scene.tilemap.close()
+    pygame.quit()
+    return report
+
+def compare(cur, base):
+    """Linhas 'seção.percentil: base -> atual (+x%)' para p50/p95/p99."""
+    out = []
+    for sec in ('update_ms', 'draw_ms', 'present_ms', 'frame_ms'):
+        for k in ('p50', 'p95', 'p99'):
+            a, b = base.get(sec, {}).get(k), cur.get(sec, {}).get(k)
+            if a is None or b is None:
+                continue
+            pct = (b - a) / a * 100.0 if a else 0.0
+            out.append(f'{sec}.{k}: {a:.2f} -> {b:.2f} ({pct:+.1f}%)')
+    return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark headless do SceneGame')
+    ap.add_argument('--frames', type=int, default=1200)
+    ap.add_argument('--warmup', type=int, default=60)
+    ap.add_argument('--dt', type=float, default=1.0 / 60.0)
+    ap.add_argument('--size', type=int, nargs=2, metavar=('W', 'H'))
+    ap.add_argument('--no-flip', action='store_true', help='não chama display.flip (mede só update/draw)')
+    ap.add_argument('--out', help='grava o JSON neste arquivo')
+    ap.add_argument('--compare', help='JSON de referência (ex.: de outro commit)')
+    args = ap.parse_args(argv)
+
+    report = run(args.frames, args.warmup, args.dt, args.size, not args.no_flip)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    print(text)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        print(f"# vs {base.get('rev') or args.compare}")
+        for line in compare(report, base):
+            print(line)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import pygame
+
+class DirtyLayer:
+    """Apresentação por retângulos sujos para cenas quase estáticas (menus).
+
+    A cena desenha tudo que é parado e chama commit_base(): a tela vira a base.
+    Nos frames seguintes, enquanto a chave de estado não muda, só o item animado
+    é redesenhado (base restaurada embaixo dele) e draw() da cena devolve a lista
+    de rects para pygame.display.update. Cena sem item animado não guarda base:
+    needs_full() sozinho decide entre frame cheio e nada. Convenção do main loop:
+    None = frame cheio (flip), [] = nada mudou.
+    """
+    def __init__(self):
+        self._key = None
+        self._base = None
+        self._prev = None   # rect do item animado no último frame
+
+    def invalidate(self):
+        self._key = None
+        self._base = None
+        self._prev = None
+
+    def needs_full(self, screen: pygame.Surface, key) -> bool:
+        """True (e guarda a chave) se tamanho da tela ou estado mudaram."""
+        key = (screen.get_size(), key)
+        if key != self._key:
+            self._key = key
+            return True
+        return False
+
+    def commit_base(self, screen: pygame.Surface):
+        self._base = screen.copy()
+        self._prev = None
+
+    def track(self, rect):
+        """Registra o rect do item animado desenhado no frame cheio."""
+        self._prev = pygame.Rect(rect) if rect else None
+
+    def redraw(self, screen: pygame.Surface, draw_fn) -> list:
+        """Restaura a base sob o item animado, redesenha com draw_fn(screen) -> rect."""
+        prev = self._prev
+        if prev is not None:
+            screen.blit(self._base, prev, prev)
+        rect = draw_fn(screen)
+        rect = pygame.Rect(rect) if rect else None
+        self._prev = rect
+        if rect == prev:
+            return []   # mesma imagem no mesmo lugar (ex.: bob no mesmo pixel)
+        if prev is None:
+            return [rect]
+        return [prev.union(rect)] if rect is not None else [prev]
@@ -7,6 +7,7 @@ class RightMenuList:
         self._t = 0.0
         self.arrow_img = load_image_strict(arrow_path)
         self._arrow_cache = {}
+        self._sel_rect = None
     def update(self, dt: float):
         self._t += dt
     def _get_arrow_for_height(self, h: int):
@@ -17,24 +18,35 @@ class RightMenuList:
             w = int(h * 0.9)
             self._arrow_cache[key] = pygame.transform.smoothscale(self.arrow_img, (w, h))
         return self._arrow_cache[key]
-    def draw(self, screen: pygame.Surface, options, selected: int, x_frac=0.82, y_frac=0.35, gap=56, color_sel=COLORS['menu_sel'], color_norm=COLORS['menu_item']):
+    def draw(self, screen: pygame.Surface, options, selected: int, x_frac=0.82, y_frac=0.35, gap=56, color_sel=COLORS['menu_sel'], color_norm=COLORS['menu_item'], arrow=True):
+        """Desenha a lista; arrow=False deixa a seta para draw_arrow() (dirty rects)."""
         sw, sh = screen.get_size()
         x = int(sw * x_frac)
         y = int(sh * y_frac)
-        bob = int(3 * math.sin(self._t * 5.0))
+        self._sel_rect = None
         for i, text in enumerate(options):
             col = color_sel if i == selected else color_norm
             surf = self.font.render(text, True, col)
             rect = surf.get_rect(topright=(x, y))
             screen.blit(surf, rect)
             if i == selected:
-                ah = int(self.font.get_height() * 0.8)
-                arrow = self._get_arrow_for_height(ah)
-                if arrow:
-                    arect = arrow.get_rect(midright=(rect.left - 14, rect.centery + bob))
-                    screen.blit(arrow, arect)
-                else:
-                    mid = (rect.left - 12, rect.centery + bob)
-                    pts = [(mid[0]-12, mid[1]-10), (mid[0]-12, mid[1]+10), (mid[0], mid[1])]
-                    pygame.draw.polygon(screen, (240,220,160), pts)
+                self._sel_rect = rect
             y += gap
+        if arrow:
+            return self.draw_arrow(screen)
+        return None
+    def draw_arrow(self, screen: pygame.Surface):
+        """Seta (com bob) ao lado do item selecionado no último draw(); devolve o rect tocado."""
+        rect = self._sel_rect
+        if rect is None:
+            return None
+        bob = int(3 * math.sin(self._t * 5.0))
+        ah = int(self.font.get_height() * 0.8)
+        arrow = self._get_arrow_for_height(ah)
+        if arrow:
+            arect = arrow.get_rect(midright=(rect.left - 14, rect.centery + bob))
+            screen.blit(arrow, arect)
+            return arect
+        mid = (rect.left - 12, rect.centery + bob)
+        pts = [(mid[0]-12, mid[1]-10), (mid[0]-12, mid[1]+10), (mid[0], mid[1])]
+        return pygame.draw.polygon(screen, (240,220,160), pts)